@@ -3,16 +3,14 @@
 
 #Instalação: pip install pygad
 
+import multiprocessing as mp
+import time
+from functools import partial
 import numpy as np
 import matplotlib.pyplot as plt
 import pygad
 import pulp
 
-print(" - ALGORITMO GENÉTICO (PyGAD) vs PROGRAMAÇÃO LINEAR")
-print("=" * 65)
-print("Biblioteca PyGAD: Implementação profissional de AG")
-print("=" * 65)
-
 #%%=============================================================================
 # CONFIGURAÇÃO DO PROBLEMA
 # =============================================================================
@@ -24,9 +22,23 @@ CALCIO_COEF = np.array([0.6, 0.4, 0.4])
 PROTEINA_MIN = 0.3
 CALCIO_MIN = 0.5
 
-print(f" - DADOS DO PROBLEMA:")
-print(f"   Custos ($/kg): Osso={CUSTOS[0]}, Soja={CUSTOS[1]}, Peixe={CUSTOS[2]}")
-print(f"   Restrições: Proteína ≥ {PROTEINA_MIN*100}%, Cálcio ≥ {CALCIO_MIN*100}%")
+# Coeficientes por ingrediente (linhas) de custo, proteína e cálcio (colunas):
+# uma única multiplicação X @ COEFICIENTES avalia a população inteira
+COEFICIENTES = np.column_stack([CUSTOS, PROTEINA_COEF, CALCIO_COEF])
+
+def mostrar_problema():
+    """
+    Cabeçalho e dados do problema. Chamado só no processo principal: com o
+    método "spawn" os processos do Pool importam este arquivo, e um print no
+    nível do módulo se repetiria uma vez por processo.
+    """
+    print(" - ALGORITMO GENÉTICO (PyGAD) vs PROGRAMAÇÃO LINEAR")
+    print("=" * 65)
+    print("Biblioteca PyGAD: Implementação profissional de AG")
+    print("=" * 65)
+    print(f" - DADOS DO PROBLEMA:")
+    print(f"   Custos ($/kg): Osso={CUSTOS[0]}, Soja={CUSTOS[1]}, Peixe={CUSTOS[2]}")
+    print(f"   Restrições: Proteína ≥ {PROTEINA_MIN*100}%, Cálcio ≥ {CALCIO_MIN*100}%")
 
 #%%# =============================================================================
 # FUNÇÃO DE FITNESS PARA O PYGAD
@@ -63,6 +75,26 @@ def calcular_fitness(ga_instance, solution, solution_idx):
     
     return fitness
 
+def calcular_fitness_lote(ga_instance, solutions, solutions_idx):
+    """
+    Mesma fitness de calcular_fitness para um lote de soluções (fitness_batch_size).
+    Normalização, custo, nutrientes e penalidades são calculados para todas as
+    linhas de uma vez, sem laço nem if por solução.
+    """
+    X = np.atleast_2d(np.asarray(solutions, dtype=float))
+    soma = X.sum(axis=1)
+    x_norm = X / np.where(soma == 0, 1.0, soma)[:, None]
+    
+    # Custo, proteína e cálcio de cada solução: (n x 3) @ (3 x 3)
+    custo, proteina, calcio = (x_norm @ COEFICIENTES).T
+    
+    # Penalidades só para quem viola a restrição (max(0, déficit) * 100)
+    penalidade = (np.maximum(PROTEINA_MIN - proteina, 0) * 100 +
+                  np.maximum(CALCIO_MIN - calcio, 0) * 100)
+    
+    fitness = 1.0 / (custo + penalidade + 0.001)
+    return np.where(soma == 0, 0.001, fitness)  # Evitar divisão por zero
+
 def callback_geracao(ga_instance):
     """Callback chamado a cada geração para acompanhar evolução"""
     geracao = ga_instance.generations_completed
@@ -112,84 +144,144 @@ def resolver_programacao_linear():
 # EXECUÇÃO DO ALGORITMO GENÉTICO COM PYGAD
 # =============================================================================
 
-def executar_pygad(num_execucoes=3):
-    """Executa o PyGAD múltiplas vezes para mostrar variabilidade"""
+def executar_uma_vez(execucao, mostrar_progresso=None, parada=None):
+    """
+    Uma execução independente do PyGAD com semente 42 + execucao.
+    Roda dentro dos processos do Pool, por isso devolve só um dict compacto
+    (arrays pequenos e números), e não a instância do GA.
+    
+    mostrar_progresso: imprime o melhor custo a cada 50 gerações
+                       (None = só na primeira execução)
+    parada: CriterioParada opcional (ex.: CriterioParada(paciencia=50, tolerancia=1e-6));
+            por padrão roda todas as 300 gerações
+    """
+    if mostrar_progresso is None:
+        mostrar_progresso = execucao == 0
+    
+    def on_generation(ga_instance):
+        if mostrar_progresso:
+            callback_geracao(ga_instance)
+        if parada is not None:
+            return parada.on_generation(ga_instance)
+    
+    # Configuração do PyGAD
+    ga_instance = pygad.GA(
+        # Genes e espaço de busca
+        num_generations=300,
+        num_parents_mating=10,
+        sol_per_pop=50,
+        num_genes=3,
+        gene_space=[{'low': 0.0, 'high': 1.0} for _ in range(3)],
+        
+        # Função de fitness (população inteira avaliada em uma única chamada)
+        fitness_func=calcular_fitness_lote,
+        fitness_batch_size=50,
+        
+        # Operadores genéticos
+        parent_selection_type="tournament",
+        K_tournament=3,
+        crossover_type="single_point",
+        mutation_type="random",  
+        mutation_percent_genes=20,
+        mutation_by_replacement=False,
+        random_mutation_min_val=-0.1,
+        random_mutation_max_val=0.1,
+        
+        # Callback e configurações
+        on_start=parada.on_start if parada is not None else None,
+        on_generation=on_generation,
+        suppress_warnings=True,
+        random_seed=42 + execucao  # Seed diferente para cada execução
+    )
+    
+    # Executar o algoritmo
+    inicio = time.perf_counter()
+    ga_instance.run()
+    tempo = time.perf_counter() - inicio
+    
+    # Obter melhor solução
+    melhor_solucao, melhor_fitness, _ = ga_instance.best_solution(pop_fitness=ga_instance.last_generation_fitness)
+    
+    # Normalizar solução
+    melhor_solucao_norm = melhor_solucao / np.sum(melhor_solucao)
+    custo = np.dot(CUSTOS, melhor_solucao_norm)
+    
+    # Verificar restrições
+    proteina = np.dot(PROTEINA_COEF, melhor_solucao_norm)
+    calcio = np.dot(CALCIO_COEF, melhor_solucao_norm)
+    
+    return {
+        'execucao': execucao,
+        'solucao': melhor_solucao_norm,
+        'custo': custo,
+        'fitness': melhor_fitness,
+        'proteina': proteina,
+        'calcio': calcio,
+        'proteina_ok': proteina >= PROTEINA_MIN - 0.001,
+        'calcio_ok': calcio >= CALCIO_MIN - 0.001,
+        'geracoes': ga_instance.generations_completed,
+        'motivo_parada': parada.motivo if parada is not None else None,
+        'tempo': tempo,
+        'convergencia': np.array(ga_instance.best_solutions_fitness)
+    }
+
+def mostrar_resultado(resultado):
+    """Imprime o resumo de uma execução"""
+    solucao = resultado['solucao']
+    print(f"\n - Execução {resultado['execucao'] + 1}:")
+    print(f"   Gerações: {resultado['geracoes']} ({resultado['motivo_parada'] or 'limite de gerações'}) "
+          f"em {resultado['tempo']:.2f} s")
+    print(f"   Custo: ${resultado['custo']:.4f}")
+    print(f"   Osso: {solucao[0]:.3f} ({solucao[0]:.1%})")
+    print(f"   Soja: {solucao[1]:.3f} ({solucao[1]:.1%})")
+    print(f"   Peixe: {solucao[2]:.3f} ({solucao[2]:.1%})")
+    
+    status_prot = "✅" if resultado['proteina_ok'] else "❌"
+    status_calc = "✅" if resultado['calcio_ok'] else "❌"
+    
+    print(f"   Proteína: {resultado['proteina']:.3f} {status_prot} (≥{PROTEINA_MIN})")
+    print(f"   Cálcio: {resultado['calcio']:.3f} {status_calc} (≥{CALCIO_MIN})")
+
+def executar_pygad(num_execucoes=3, n_processos=None, parada=None):
+    """
+    Executa o PyGAD múltiplas vezes para mostrar variabilidade.
+    As execuções são independentes (uma semente cada) e rodam em paralelo em
+    um Pool de processos; a primeira mostra o progresso por geração e cada
+    resultado é impresso assim que fica pronto, junto com o resumo parcial
+    (melhor / médio / pior custo até o momento).
+    
+    Args:
+        num_execucoes: número de reinícios independentes (sementes 42, 43, ...)
+        n_processos: processos do Pool (None = número de núcleos; 1 = sequencial)
+        parada: CriterioParada opcional aplicado a cada execução (None = sem
+                parada antecipada; cada processo recebe sua própria cópia)
+    
+    Returns:
+        Lista de resultados na ordem das execuções (independe da ordem de término)
+    """
     print("\n - RESOLVENDO COM PYGAD")
     print("-" * 45)
     
     resultados = []
+    custos = np.empty(0)
     
-    for execucao in range(num_execucoes):
-        print(f"\n - Execução {execucao + 1}:")
-        
-        # Configuração do PyGAD
-        ga_instance = pygad.GA(
-            # Genes e espaço de busca
-            num_generations=300,
-            num_parents_mating=10,
-            sol_per_pop=50,
-            num_genes=3,
-            gene_space=[{'low': 0.0, 'high': 1.0} for _ in range(3)],
-            
-            # Função de fitness
-            fitness_func=calcular_fitness,
-            
-            # Operadores genéticos
-            parent_selection_type="tournament",
-            K_tournament=3,
-            crossover_type="single_point",
-            mutation_type="random",  
-            mutation_percent_genes=20,
-            mutation_by_replacement=False,
-            random_mutation_min_val=-0.1,
-            random_mutation_max_val=0.1,
-            
-            # Callback e configurações
-            on_generation=callback_geracao if execucao == 0 else None,  # Só mostrar na primeira
-            suppress_warnings=True,
-            random_seed=42 + execucao  # Seed diferente para cada execução
-        )
-        
-        # Executar o algoritmo
-        ga_instance.run()
-        
-        # Obter melhor solução
-        melhor_solucao, melhor_fitness, _ = ga_instance.best_solution(pop_fitness=ga_instance.last_generation_fitness)
-        
-        # Normalizar solução
-        melhor_solucao_norm = melhor_solucao / np.sum(melhor_solucao)
-        custo = np.dot(CUSTOS, melhor_solucao_norm)
-        
-        # Verificar restrições
-        proteina = np.dot(PROTEINA_COEF, melhor_solucao_norm)
-        calcio = np.dot(CALCIO_COEF, melhor_solucao_norm)
-        
-        resultado = {
-            'solucao': melhor_solucao_norm,
-            'custo': custo,
-            'fitness': melhor_fitness,
-            'proteina': proteina,
-            'calcio': calcio,
-            'proteina_ok': proteina >= PROTEINA_MIN - 0.001,
-            'calcio_ok': calcio >= CALCIO_MIN - 0.001,
-            'convergencia': ga_instance.best_solutions_fitness
-        }
-        
+    def registrar(resultado):
+        nonlocal custos
         resultados.append(resultado)
-        
-        # Mostrar resultado da execução
-        print(f"   Custo: ${custo:.4f}")
-        print(f"   Osso: {melhor_solucao_norm[0]:.3f} ({melhor_solucao_norm[0]:.1%})")
-        print(f"   Soja: {melhor_solucao_norm[1]:.3f} ({melhor_solucao_norm[1]:.1%})")
-        print(f"   Peixe: {melhor_solucao_norm[2]:.3f} ({melhor_solucao_norm[2]:.1%})")
-        
-        status_prot = "✅" if resultado['proteina_ok'] else "❌"
-        status_calc = "✅" if resultado['calcio_ok'] else "❌"
-        
-        print(f"   Proteína: {proteina:.3f} {status_prot} (≥{PROTEINA_MIN})")
-        print(f"   Cálcio: {calcio:.3f} {status_calc} (≥{CALCIO_MIN})")
-    
-    return resultados
+        custos = np.append(custos, resultado['custo'])
+        mostrar_resultado(resultado)
+        print(f"   Parcial ({len(custos)}/{num_execucoes}): melhor ${custos.min():.4f} | "
+              f"médio ${custos.mean():.4f} | pior ${custos.max():.4f}")
+    
+    if n_processos == 1:
+        for execucao in range(num_execucoes):
+            registrar(executar_uma_vez(execucao, parada=parada))
+    else:
+        with mp.Pool(n_processos) as pool:
+            for resultado in pool.imap_unordered(partial(executar_uma_vez, parada=parada), range(num_execucoes)):
+                registrar(resultado)
+    
+    return sorted(resultados, key=lambda r: r['execucao'])
 
 #%%=============================================================================
 # ANÁLISE E VISUALIZAÇÃO
@@ -294,11 +386,13 @@ def plotar_convergencia(resultados_ag):
 # =============================================================================
 
 if __name__ == "__main__":
+    mostrar_problema()
     try:
         # Resolver com Programação Linear
         solucao_pl, custo_pl = resolver_programacao_linear()
         
-        # Resolver com PyGAD
+        # Resolver com PyGAD (para parada antecipada, passe por exemplo
+        # parada=CriterioParada(paciencia=50, tolerancia=1e-6), de utils_ag)
         resultados_ag = executar_pygad(num_execucoes=3)
         
         # Análise comparativa
@@ -0,0 +1,98 @@
+#%% PyGAD - Modelo de Ilhas (Várias Populações em Paralelo)
+
+#Instalação: pip install pygad
+
+# Em vez de uma única população grande, N ilhas (populações menores) evoluem
+# em processos separados e, a cada época, enviam seus melhores indivíduos
+# para as ilhas vizinhas (ver utils_ilhas.py). Compara-se aqui uma população
+# única de 200 indivíduos com 4 ilhas de 50, nas três topologias de migração.
+
+import time
+import numpy as np
+import matplotlib.pyplot as plt
+import pygad
+from utils_ilhas import executar_ilhas, TOPOLOGIAS
+from utils_mochila import gerar_mochila, resolver_mochila_exata, ReparoMochila
+
+#%%============================================================================
+# INSTÂNCIA E PARÂMETROS
+# ============================================================================
+
+N_ITENS = 500
+N_ILHAS = 4
+POP_ILHA = 50
+EPOCAS = 10                 # Número de migrações
+GERACOES_POR_EPOCA = 20     # Intervalo de migração
+N_MIGRANTES = 2             # Melhores indivíduos enviados por ilha a cada época
+
+mochila, capacidade = gerar_mochila(N_ITENS, capacidade_relativa=0.2, seed=N_ITENS)
+otimo = resolver_mochila_exata(mochila, capacidade)['valor']
+
+# Fitness com reparo guloso (baldwiniano); o objeto pode ser enviado às ilhas
+reparo = ReparoMochila(mochila['pontos'].to_numpy(), mochila['peso'].to_numpy(), capacidade,
+                       lamarckiano=False)
+
+def parametros_ga(sol_per_pop):
+    return dict(
+        num_parents_mating=sol_per_pop // 2,
+        sol_per_pop=sol_per_pop,
+        num_genes=N_ITENS,
+        gene_space=[0, 1],
+        gene_type=int,
+        fitness_func=reparo.fitness_pygad,
+        fitness_batch_size=sol_per_pop,
+        parent_selection_type="tournament",
+        K_tournament=3,
+        keep_elitism=1,
+        mutation_probability=2 / N_ITENS,
+    )
+
+#%%============================================================================
+# EXECUÇÃO: POPULAÇÃO ÚNICA x ILHAS
+# ============================================================================
+
+if __name__ == "__main__":
+    print(f"{N_ITENS} itens | capacidade {capacidade} | ótimo = {otimo}")
+    print(f"Total de gerações: {EPOCAS * GERACOES_POR_EPOCA} | {N_ILHAS} ilhas de {POP_ILHA} "
+          f"x 1 população de {N_ILHAS * POP_ILHA}")
+    print("-" * 60)
+
+    # Referência: uma única população com o mesmo número total de indivíduos
+    inicio = time.perf_counter()
+    ga_unica = pygad.GA(num_generations=EPOCAS * GERACOES_POR_EPOCA, random_seed=42,
+                        suppress_warnings=True, **parametros_ga(N_ILHAS * POP_ILHA))
+    ga_unica.run()
+    melhor_unica = np.max(ga_unica.best_solutions_fitness)
+    print(f"População única  : {melhor_unica:.0f} pontos | gap = {(otimo - melhor_unica) / otimo * 100:.2f}% "
+          f"| {time.perf_counter() - inicio:.1f} s")
+
+    resultados = {}
+    for topologia in TOPOLOGIAS:
+        inicio = time.perf_counter()
+        resultados[topologia] = executar_ilhas(parametros_ga(POP_ILHA), n_ilhas=N_ILHAS, epocas=EPOCAS,
+                                               geracoes_por_epoca=GERACOES_POR_EPOCA,
+                                               n_migrantes=N_MIGRANTES, topologia=topologia,
+                                               seed=42, verbose=False)
+        melhor = resultados[topologia]['fitness']
+        print(f"Ilhas ({topologia:9s}): {melhor:.0f} pontos | gap = {(otimo - melhor) / otimo * 100:.2f}% "
+              f"| {time.perf_counter() - inicio:.1f} s")
+
+    #%%========================================================================
+    # CONVERGÊNCIA: MELHOR FITNESS AO FIM DE CADA ÉPOCA
+    # ========================================================================
+
+    fig, axes = plt.subplots(1, len(TOPOLOGIAS), figsize=(16, 4), sharey=True)
+    epocas = np.arange(1, EPOCAS + 1) * GERACOES_POR_EPOCA
+    for ax, topologia in zip(axes, TOPOLOGIAS):
+        historico = resultados[topologia]['historico']
+        for ilha in range(N_ILHAS):
+            ax.plot(epocas, historico[:, ilha], marker='o', markersize=3, label=f"Ilha {ilha}")
+        ax.plot(np.maximum.accumulate(ga_unica.best_solutions_fitness), 'k--', label="População única")
+        ax.axhline(otimo, color='gray', linestyle=':')
+        ax.set_title(f"Topologia: {topologia}")
+        ax.set_xlabel("Geração")
+        ax.grid(True, alpha=0.4)
+    axes[0].set_ylabel("Melhor fitness")
+    axes[0].legend()
+    plt.tight_layout()
+    plt.show()
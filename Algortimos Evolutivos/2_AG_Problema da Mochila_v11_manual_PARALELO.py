@@ -0,0 +1,31 @@
+#%% AG com Avaliação Paralela - Processos + Memória Compartilhada
+
+# A população é copiada uma vez por geração para um bloco de memória
+# compartilhada e cada processo avalia uma fatia (ver AvaliadorParalelo em
+# utils_ag.py). Vale a pena quando a fitness é cara (ex.: simulações); com 9
+# itens o custo de comunicação entre processos é maior que o ganho.
+#
+# Script separado e mínimo de propósito: com o método "spawn" (Windows/macOS)
+# cada processo importa este arquivo, então tudo o que executa fica sob o
+# if __name__ == "__main__".
+
+import numpy as np
+import pandas as pd
+from utils_ag import AvaliadorParalelo, algoritmo_genetico_numpy, selecao_roleta_numpy, selecao_torneio_numpy
+from utils_mochila import avaliar_mochila
+
+mochila = pd.DataFrame({
+    'item': ["barra de cereal", "casaco", "tênis", "celular", "água", "protetor solar", "protetor labial", "garrafas de oxigênio", "máquina fotográfica"],
+    'pontos': [6, 7, 3, 2, 9, 5, 2, 10, 6],
+    'peso': [200, 400, 400, 100, 1000, 200, 30, 3000, 500]
+})
+
+if __name__ == "__main__":
+    dados = {'pontos': mochila['pontos'].to_numpy(), 'pesos': mochila['peso'].to_numpy(), 'capacidade': 5000}
+    with AvaliadorParalelo(avaliar_mochila, n_processos=4, dados=dados) as avaliador:
+        for nome, selecao in [("Torneio", selecao_torneio_numpy), ("Roleta", selecao_roleta_numpy)]:
+            solucao, melhor_fitness, historico = algoritmo_genetico_numpy(
+                avaliador.avaliar, n_genes=9, tam_pop=10, geracoes=50, taxa_mut=0.1,
+                selecao=selecao, seed=42
+            )
+            print(f"{nome} (paralela): solução {solucao} | fitness {melhor_fitness}")
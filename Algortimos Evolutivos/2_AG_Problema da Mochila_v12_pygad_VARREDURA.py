@@ -0,0 +1,103 @@
+#%% Varredura de Parâmetros do PyGAD - Crossover e Mutação (Várias Sementes)
+
+#Instalação: pip install pygad
+
+# Uma execução por configuração (scripts v3 e v4) não diz qual é melhor. A
+# varredura roda toda a grade com várias sementes em paralelo (ver
+# utils_experimentos.py) e guarda cada célula concluída em um arquivo JSON
+# Lines: se for interrompida, basta executar de novo que só as células que
+# faltam são calculadas.
+#
+# Script separado de propósito: com o método "spawn" (Windows/macOS) cada
+# processo do Pool importa este arquivo, então tudo o que executa fica sob o
+# if __name__ == "__main__".
+
+from functools import partial
+
+import matplotlib.pyplot as plt
+from utils_experimentos import expandir_grade, executar_varredura, agregar_varredura
+from utils_mochila import gerar_mochila, resolver_mochila_exata, executar_pygad_mochila
+
+grade_crossover = {
+    'crossover_type': ["single_point", "two_points", "uniform", "scattered"],
+    'crossover_probability': [0.0, 0.3, 0.7, 0.95],
+}
+# A mutação adaptativa entra como uma configuração extra, pois sua
+# probabilidade é um par [inicial, final]
+configs_mutacao = expandir_grade({
+    'mutation_type': ["random", "swap", "inversion", "scramble"],
+    'mutation_probability': [0.001, 0.01, 0.1, 0.25],
+}) + [{'mutation_type': "adaptive", 'mutation_probability': [0.25, 0.05]}]
+SEMENTES = range(10)
+
+#%%============================================================================
+# VARREDURA 1: PROBABILIDADE x TIPO DE CROSSOVER
+# ============================================================================
+
+def varredura_crossover(mochila_grande, capacidade_grande, otimo):
+    execucao = partial(executar_pygad_mochila, mochila_grande, capacidade_grande, otimo=otimo,
+                       num_generations=100, sol_per_pop=50, num_parents_mating=20,
+                       mutation_probability=0.02)
+
+    registros = executar_varredura(execucao, grade_crossover, SEMENTES,
+                                   arquivo="varredura_crossover.jsonl", verbose=False)
+    tabela, curvas = agregar_varredura(registros)
+
+    print(f"\n --> VARREDURA DE CROSSOVER: 100 itens, ótimo = {otimo}, {len(SEMENTES)} sementes por célula")
+    print(tabela.pivot(index='crossover_probability', columns='crossover_type', values='gap_media')
+          .to_string(float_format=lambda v: f"{v:.2f}%"))
+
+    fig, axes = plt.subplots(1, len(grade_crossover['crossover_type']), figsize=(16, 4), sharey=True)
+    for ax, tipo in zip(axes, grade_crossover['crossover_type']):
+        for curva in curvas.values():
+            if curva['config']['crossover_type'] == tipo:
+                ax.plot(curva['media'], linewidth=2,
+                        label=f"{curva['config']['crossover_probability']:.0%}")
+        ax.axhline(otimo, color='k', linestyle=':')
+        ax.set_title(tipo)
+        ax.set_xlabel('Geração')
+        ax.legend(title='Probabilidade')
+    axes[0].set_ylabel(f'Fitness médio ({len(SEMENTES)} sementes)')
+    plt.tight_layout()
+    plt.show()
+
+#%%============================================================================
+# VARREDURA 2: PROBABILIDADE x TIPO DE MUTAÇÃO
+# ============================================================================
+
+def varredura_mutacao(mochila_grande, capacidade_grande, otimo):
+    execucao = partial(executar_pygad_mochila, mochila_grande, capacidade_grande, otimo=otimo,
+                       num_generations=100, sol_per_pop=50, num_parents_mating=20,
+                       crossover_type="single_point", crossover_probability=0.8)
+
+    registros = executar_varredura(execucao, configs_mutacao, SEMENTES,
+                                   arquivo="varredura_mutacao.jsonl", verbose=False)
+    tabela, curvas = agregar_varredura(registros)
+
+    print(f"\n --> VARREDURA DE MUTAÇÃO: 100 itens, ótimo = {otimo}, {len(SEMENTES)} sementes por célula")
+    print(tabela[['mutation_type', 'mutation_probability', 'gap_media', 'gap_desvio']]
+          .to_string(index=False, float_format=lambda v: f"{v:.3g}"))
+
+    plt.figure(figsize=(10, 5))
+    for curva in curvas.values():
+        config = curva['config']
+        plt.plot(curva['media'], linewidth=1.5,
+                 label=f"{config['mutation_type']} {config['mutation_probability']}")
+    plt.axhline(otimo, color='k', linestyle=':', label='Ótimo')
+    plt.title(f'Convergência média ({len(SEMENTES)} sementes) por configuração de mutação')
+    plt.xlabel('Geração')
+    plt.ylabel('Fitness')
+    plt.legend(fontsize=7, ncol=3)
+    plt.grid(True, alpha=0.4)
+    plt.tight_layout()
+    plt.show()
+
+#%%============================================================================
+# EXECUÇÃO
+# ============================================================================
+
+if __name__ == "__main__":
+    mochila_grande, capacidade_grande = gerar_mochila(100, capacidade_relativa=0.2, seed=100)
+    otimo = resolver_mochila_exata(mochila_grande, capacidade_grande)['valor']
+    varredura_crossover(mochila_grande, capacidade_grande, otimo)
+    varredura_mutacao(mochila_grande, capacidade_grande, otimo)
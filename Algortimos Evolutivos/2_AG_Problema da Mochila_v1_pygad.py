@@ -2,6 +2,7 @@
 
 import pygad
 import pandas as pd
+from utils_mochila import FitnessMochila
 
 
 #%%
@@ -11,13 +12,13 @@ mochila = pd.DataFrame({
     'peso': [200, 400, 400, 100, 1000, 200, 30, 3000, 500]
 })
 
-def fitness_mochila(ga_instance, solution, solution_idx):
-    pontos = sum(mochila['pontos'][i] for i in range(9) if solution[i] == 1)
-    peso = sum(mochila['peso'][i] for i in range(9) if solution[i] == 1)
-    return pontos if peso <= 5000 else 0
+# Versão vetorizada (em lote): avalia a população inteira de uma só vez
+# (ver FitnessMochila em utils_mochila.py)
+fitness_mochila_lote = FitnessMochila(mochila['pontos'], mochila['peso']).fitness_pygad
 
 ga_instance = pygad.GA(
-    num_generations=20, sol_per_pop=10, num_parents_mating=5, fitness_func=fitness_mochila,
+    num_generations=20, sol_per_pop=10, num_parents_mating=5,
+    fitness_func=fitness_mochila_lote, fitness_batch_size=10,
     num_genes=9, gene_type=int, gene_space=[0, 1], parent_selection_type="rws",
     keep_elitism=1, crossover_type="single_point", crossover_probability=0.8,
     mutation_type="random", mutation_probability=0.05, mutation_percent_genes=10
@@ -4,6 +4,7 @@
 
 import pygad
 import pandas as pd
+from utils_mochila import FitnessMochila
 
 #%% Dados da mochila
 mochila = pd.DataFrame({
@@ -12,10 +13,9 @@ mochila = pd.DataFrame({
     'peso': [200, 400, 400, 100, 1000, 200, 30, 3000, 500]
 })
 
-def fitness_mochila(ga_instance, solution, solution_idx):
-    pontos = sum(mochila['pontos'][i] for i in range(9) if solution[i] == 1)
-    peso = sum(mochila['peso'][i] for i in range(9) if solution[i] == 1)
-    return pontos if peso <= 5000 else 0
+# Versão vetorizada (em lote): avalia a população inteira de uma só vez
+# (ver FitnessMochila em utils_mochila.py)
+fitness_mochila_lote = FitnessMochila(mochila['pontos'], mochila['peso']).fitness_pygad
 
 #%%============================================================================
 # 1. SELEÇÃO POR TORNEIO (Tournament Selection)
@@ -26,7 +26,8 @@ ga_torneio = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -47,7 +48,8 @@ ga_roleta = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -67,7 +69,8 @@ ga_steady = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -87,7 +90,8 @@ ga_random = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -107,7 +111,8 @@ ga_rank = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
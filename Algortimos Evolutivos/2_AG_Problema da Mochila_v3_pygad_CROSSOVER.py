@@ -4,6 +4,7 @@
 
 import pygad
 import pandas as pd
+from utils_mochila import FitnessMochila
 import matplotlib.pyplot as plt
 
 # Dados da mochila
@@ -13,10 +14,9 @@ mochila = pd.DataFrame({
     'peso': [200, 400, 400, 100, 1000, 200, 30, 3000, 500]
 })
 
-def fitness_mochila(ga_instance, solution, solution_idx):
-    pontos = sum(mochila['pontos'][i] for i in range(9) if solution[i] == 1)
-    peso = sum(mochila['peso'][i] for i in range(9) if solution[i] == 1)
-    return pontos if peso <= 5000 else 0
+# Versão vetorizada (em lote): avalia a população inteira de uma só vez
+# (ver FitnessMochila em utils_mochila.py)
+fitness_mochila_lote = FitnessMochila(mochila['pontos'], mochila['peso']).fitness_pygad
 
 #%%============================================================================
 # 1. CROSSOVER BAIXO (Pouco Cruzamento)
@@ -27,7 +27,8 @@ ga_cross_baixo = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -58,7 +59,8 @@ ga_cross_normal = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -89,7 +91,8 @@ ga_cross_alto = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -120,7 +123,8 @@ ga_sem_cross = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -154,7 +158,8 @@ ga_dois_pontos = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -178,7 +183,8 @@ ga_uniforme = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -301,4 +307,9 @@ print("4. Observe como afeta a convergência")
 print(f"\n - SINTESE:")
 print("• Crossover = EXPLOITAÇÃO (combina soluções boas)")
 print("• Mutação = EXPLORAÇÃO (cria diversidade)")
-print("• Equilibrio entre os dois é fundamental!")
\ No newline at end of file
+print("• Equilibrio entre os dois é fundamental!")
+#%% Varredura de parâmetros - crossover com várias sementes
+# Ver 2_AG_Problema da Mochila_v12_pygad_VARREDURA.py: a varredura roda em um
+# Pool de processos e fica em um script próprio porque, com o método "spawn"
+# (Windows/macOS), cada processo importaria este arquivo e repetiria todas as
+# execuções e gráficos acima.
@@ -4,6 +4,7 @@
 
 import pygad
 import pandas as pd
+from utils_mochila import FitnessMochila
 import matplotlib.pyplot as plt
 
 # Dados da mochila
@@ -13,10 +14,9 @@ mochila = pd.DataFrame({
     'peso': [200, 400, 400, 100, 1000, 200, 30, 3000, 500]
 })
 
-def fitness_mochila(ga_instance, solution, solution_idx):
-    pontos = sum(mochila['pontos'][i] for i in range(9) if solution[i] == 1)
-    peso = sum(mochila['peso'][i] for i in range(9) if solution[i] == 1)
-    return pontos if peso <= 5000 else 0
+# Versão vetorizada (em lote): avalia a população inteira de uma só vez
+# (ver FitnessMochila em utils_mochila.py)
+fitness_mochila_lote = FitnessMochila(mochila['pontos'], mochila['peso']).fitness_pygad
 
 #%%============================================================================
 # 1. MUTAÇÃO MUITO BAIXA (Pouca Exploração)
@@ -27,7 +27,8 @@ ga_mut_baixa = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -55,7 +56,8 @@ ga_mut_normal = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -83,7 +85,8 @@ ga_mut_alta = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -111,7 +114,8 @@ ga_sem_mut = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -142,7 +146,8 @@ ga_mut_adaptativa = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -243,7 +248,8 @@ ga_ideal = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -273,4 +279,9 @@ print(f"\n --> EXPERIMENTO SUGERIDO:")
 print("Execute este código várias vezes e compare:")
 print("- Qual configuração é mais consistente?")
 print("- Qual encontra soluções melhores?")
-print("- Como a convergência varia?")
\ No newline at end of file
+print("- Como a convergência varia?")
+#%% Varredura de parâmetros - mutação com várias sementes
+# Ver 2_AG_Problema da Mochila_v12_pygad_VARREDURA.py: a varredura roda em um
+# Pool de processos e fica em um script próprio porque, com o método "spawn"
+# (Windows/macOS), cada processo importaria este arquivo e repetiria todas as
+# execuções e gráficos acima.
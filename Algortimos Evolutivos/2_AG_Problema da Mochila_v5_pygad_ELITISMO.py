@@ -4,6 +4,7 @@
 
 import pygad
 import pandas as pd
+from utils_mochila import FitnessMochila
 
 # Dados da mochila
 mochila = pd.DataFrame({
@@ -12,10 +13,9 @@ mochila = pd.DataFrame({
     'peso': [200, 400, 400, 100, 1000, 200, 30, 3000, 500]
 })
 
-def fitness_mochila(ga_instance, solution, solution_idx):
-    pontos = sum(mochila['pontos'][i] for i in range(9) if solution[i] == 1)
-    peso = sum(mochila['peso'][i] for i in range(9) if solution[i] == 1)
-    return pontos if peso <= 5000 else 0
+# Versão vetorizada (em lote): avalia a população inteira de uma só vez
+# (ver FitnessMochila em utils_mochila.py)
+fitness_mochila_lote = FitnessMochila(mochila['pontos'], mochila['peso']).fitness_pygad
 
 #%% ============================================================================
 # 1. COM ELITISMO (Padrão - Recomendado)
@@ -26,7 +26,8 @@ ga_com_elitismo = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -52,7 +53,8 @@ ga_sem_elitismo = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -78,7 +80,8 @@ ga_elitismo_alto = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -116,11 +119,6 @@ mochila = pd.DataFrame({
     'peso': [200, 400, 400, 100, 1000, 200, 30, 3000, 500]
 })
 
-def fitness_mochila(ga_instance, solution, solution_idx):
-    pontos = sum(mochila['pontos'][i] for i in range(9) if solution[i] == 1)
-    peso = sum(mochila['peso'][i] for i in range(9) if solution[i] == 1)
-    return pontos if peso <= 5000 else 0
-
 #%% ============================================================================
 # 1. COM ELITISMO (Padrão - Recomendado)
 # ============================================================================
@@ -130,7 +128,8 @@ ga_com_elitismo = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -156,7 +155,8 @@ ga_sem_elitismo = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -182,7 +182,8 @@ ga_elitismo_alto = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
@@ -307,7 +308,8 @@ ga_ideal = pygad.GA(
     num_generations=20,
     sol_per_pop=30,
     num_parents_mating=15,
-    fitness_func=fitness_mochila,
+    fitness_func=fitness_mochila_lote,
+    fitness_batch_size=30,
     num_genes=9,
     gene_type=int,
     gene_space=[0, 1],
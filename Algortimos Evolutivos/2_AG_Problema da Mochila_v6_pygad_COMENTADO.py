@@ -7,6 +7,7 @@
 
 import pygad
 import pandas as pd
+from utils_mochila import FitnessMochila
 
 #%% ============================================================================
 # DADOS DO PROBLEMA DA MOCHILA
@@ -26,11 +27,29 @@ def fitness_mochila(ga_instance, solution, solution_idx):
     """
     Função que avalia a qualidade de uma solução
     Retorna: pontos totais se peso ≤ 5000g, senão 0
+
+    Mantida para comparação didática: é a forma uma-solução-por-chamada
+    (fitness_batch_size=None). O GA abaixo usa a versão em lote.
     """
     pontos = sum(mochila['pontos'][i] for i in range(9) if solution[i] == 1)
     peso = sum(mochila['peso'][i] for i in range(9) if solution[i] == 1)
     return pontos if peso <= 5000 else 0
 
+# Versão vetorizada (em lote): avalia a população inteira de uma só vez
+# (ver FitnessMochila em utils_mochila.py)
+fitness_mochila_lote = FitnessMochila(mochila['pontos'], mochila['peso']).fitness_pygad
+
+# ============================================================================
+# PARADA ANTECIPADA (ver CriterioParada em utils_ag.py)
+# ============================================================================
+# Desligada por padrão: o GA sempre roda num_generations gerações. O ótimo
+# (41 pontos) costuma ser encontrado bem antes das 100 gerações; para parar ao
+# atingir o alvo ou após 20 gerações sem melhora, descomente as duas linhas
+# abaixo e os parâmetros on_start/on_generation no pygad.GA
+
+# from utils_ag import CriterioParada
+# parada = CriterioParada(paciencia=20, alvo=41)
+
 #%% ============================================================================
 #   CONFIGURAÇÃO DO ALGORITMO GENÉTICO
 #   ============================================================================
@@ -58,7 +77,13 @@ ga_instance = pygad.GA(
     # DEFINIÇÃO DO PROBLEMA
     # ========================================================================
     
-    fitness_func=fitness_mochila,   # Função que avalia cada solução
+    fitness_func=fitness_mochila_lote,  # Função que avalia as soluções
+                                    # Versão em lote: recebe várias soluções
+                                    # de uma vez (matriz população x genes)
+    
+    fitness_batch_size=10,          # Quantas soluções por chamada da fitness
+                                    # None = uma solução por chamada (fitness_mochila)
+                                    # sol_per_pop = população inteira de uma vez
     
     num_genes=9,                    # Número de genes por cromossomo
                                     # Aqui: 9 itens da mochila
@@ -134,11 +159,19 @@ ga_instance = pygad.GA(
                                     # Baixo = pouca diversidade, exploitação
                                     # 0.1 = 10% chance de cada gene sofrer mutação
     
-    mutation_percent_genes=15       # Porcentagem de genes que podem sofrer mutação
+    mutation_percent_genes=15,      # Porcentagem de genes que podem sofrer mutação
                                     # Valores típicos: 5-25%
                                     # Controla quantos genes por indivíduo podem mutar
                                     # 15% = até 15% dos genes de um indivíduo
     
+    # ========================================================================
+    # PARADA ANTECIPADA
+    # ========================================================================
+    
+    # on_start=parada.on_start,     # Zera o critério (e o relógio) no início do run()
+    # on_generation=parada.on_generation  # Retorna "stop" quando algum critério é atingido
+                                    # (alvo, paciência, diversidade ou tempo)
+    
     # ========================================================================
     # OUTROS PARÂMETROS AVANÇADOS (OPCIONAIS)
     # ========================================================================
@@ -159,10 +192,16 @@ ga_instance = pygad.GA(
                                     # None = sequencial
                                     # ['thread', n] = n threads
                                     # ['process', n] = n processos
+                                    # Para fitness cara, ver AvaliadorParalelo
+                                    # (utils_ag.py): processos + memória
+                                    # compartilhada, usado com
+                                    # fitness_func=avaliador.fitness_pygad
     
     # stop_criteria=None            # Critérios de parada
                                     # "reach_xxx" = para quando fitness atinge xxx
                                     # "saturate_xxx" = para após xxx gerações sem melhoria
+                                    # parada.stop_criteria() gera essa lista a partir
+                                    # do alvo e da paciência do CriterioParada
 )
 
 #%% ============================================================================
@@ -179,6 +218,7 @@ print(f"Elitismo: {ga_instance.keep_elitism} indivíduo(s)")
 print()
 
 ga_instance.run()
+print(f"Gerações executadas: {ga_instance.generations_completed}")
 
 #============================================================================
 # ANÁLISE DOS RESULTADOS
@@ -204,6 +244,25 @@ print(f"Pontos totais: {fitness_value}")
 print(f"Peso total: {peso_total}g / 5000g")
 print(f"Utilização: {peso_total/5000*100:.1f}%")
 
+#%% ============================================================================
+# COMPARAÇÃO COM O ÓTIMO EXATO
+# ============================================================================
+# Programação dinâmica (pesos inteiros) e branch-and-bound (ver utils_mochila.py):
+# o ótimo serve de referência para medir o desvio (gap) do AG.
+
+from utils_mochila import mochila_programacao_dinamica, mochila_branch_and_bound
+
+print("\n" + "="*50)
+print("ÓTIMO EXATO x ALGORITMO GENÉTICO")
+print("="*50)
+for nome, metodo in [("Programação dinâmica", mochila_programacao_dinamica),
+                     ("Branch-and-bound", mochila_branch_and_bound)]:
+    exato = metodo(mochila, capacidade=5000)
+    print(f"{nome:21s}: {exato['valor']} pontos | {exato['peso']}g | {exato['tempo']*1000:.2f} ms")
+
+gap = (exato['valor'] - fitness_value) / exato['valor'] * 100
+print(f"Algoritmo genético   : {fitness_value} pontos | gap = {gap:.1f}%")
+
 #%% ============================================================================
 # VISUALIZAÇÃO DA EVOLUÇÃO
 # ============================================================================
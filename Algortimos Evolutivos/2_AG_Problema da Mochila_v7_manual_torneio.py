@@ -2,6 +2,7 @@
 
 import random
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 #%% AG com Seleção por TORNEIO
@@ -23,8 +24,10 @@ def criar_populacao(tamanho):
     return [criar_individuo() for _ in range(tamanho)]
 
 def selecao_torneio(populacao, fitness_values, k=3):
-    competidores = random.sample(list(zip(populacao, fitness_values)), k)
-    return max(competidores, key=lambda x: x[1])[0]
+    # Sorteia apenas os ÍNDICES dos competidores (sem copiar a população)
+    competidores = random.sample(range(len(populacao)), k)
+    vencedor = max(competidores, key=lambda i: fitness_values[i])
+    return populacao[vencedor]
 
 def cruzamento_um_ponto(pai1, pai2):
     ponto = random.randint(1, 8)
@@ -33,14 +36,21 @@ def cruzamento_um_ponto(pai1, pai2):
 def mutacao(individuo, taxa=0.1):
     return [1-gene if random.random() < taxa else gene for gene in individuo]
 
-def algoritmo_genetico(tam_pop=10, geracoes=50, taxa_mut=0.1):
+def avaliar_populacao(populacao, avaliador=None):
+    if avaliador is None:
+        return [fitness(ind) for ind in populacao]
+    return avaliador.avaliar(np.array(populacao)).tolist()
+
+def algoritmo_genetico(tam_pop=10, geracoes=50, taxa_mut=0.1, avaliador=None, parada=None):
     populacao = criar_populacao(tam_pop)
     historico = []
     
     for geracao in range(geracoes):
-        fitness_values = [fitness(ind) for ind in populacao]
+        fitness_values = avaliar_populacao(populacao, avaliador)
         melhor_fitness = max(fitness_values)
         historico.append(melhor_fitness)
+        if parada is not None and parada.verificar(fitness_values, populacao):
+            break   # Critério de parada antecipada (ver CriterioParada em utils_ag.py)
         
         nova_populacao = []
         melhor_idx = fitness_values.index(melhor_fitness)
@@ -55,7 +65,7 @@ def algoritmo_genetico(tam_pop=10, geracoes=50, taxa_mut=0.1):
         
         populacao = nova_populacao
     
-    fitness_values = [fitness(ind) for ind in populacao]
+    fitness_values = avaliar_populacao(populacao, avaliador)
     melhor_idx = fitness_values.index(max(fitness_values))
     return populacao[melhor_idx], max(fitness_values), historico
 
@@ -73,4 +83,144 @@ plt.xlabel("Geração")
 plt.ylabel("Fitness")
 plt.title("Convergência - AG Manual")
 plt.grid(True)
-plt.show()
\ No newline at end of file
+plt.show()
+
+#%% Versão NumPy - população em um único array (tam_pop x genes)
+# Mesmo AG, mas seleção, cruzamento e mutação são feitos para a geração
+# inteira com operações de array (ver utils_ag.py). Indicado para populações grandes.
+from utils_ag import algoritmo_genetico_numpy, selecao_torneio_numpy
+
+PONTOS = mochila['pontos'].to_numpy()
+PESOS = mochila['peso'].to_numpy()
+
+def fitness_lote(populacao):
+    pontos = populacao @ PONTOS
+    peso = populacao @ PESOS
+    return np.where(peso <= 5000, pontos, 0)
+
+solucao_np, melhor_fitness_np, historico_np = algoritmo_genetico_numpy(
+    fitness_lote, n_genes=9, tam_pop=10, geracoes=50, taxa_mut=0.1,
+    selecao=selecao_torneio_numpy, seed=42
+)
+
+print("Solução (NumPy):", solucao_np)
+print("Fitness (NumPy):", melhor_fitness_np)
+
+plt.plot(historico, 'b-', linewidth=2, label="Listas")
+plt.plot(historico_np, 'r--', linewidth=2, label="NumPy")
+plt.xlabel("Geração")
+plt.ylabel("Fitness")
+plt.title("Convergência - AG Manual x NumPy (Torneio)")
+plt.legend()
+plt.grid(True)
+plt.show()
+
+#%% Parada antecipada - sem rodar todas as gerações configuradas
+# O ótimo (41 pontos) costuma aparecer em poucas gerações; o CriterioParada
+# (utils_ag.py) encerra o AG por alvo, estagnação, diversidade ou tempo.
+from utils_ag import CriterioParada
+
+parada = CriterioParada(paciencia=10, alvo=41, diversidade_minima=0.01, tempo_maximo=5)
+solucao_parada, fitness_parada, historico_parada = algoritmo_genetico(geracoes=200, parada=parada)
+print(f"Fitness: {fitness_parada} | parou após {parada.geracoes} de 200 gerações ({parada.motivo})")
+
+parada_np = CriterioParada(paciencia=10)
+_, fitness_parada_np, _ = algoritmo_genetico_numpy(fitness_lote, n_genes=9, tam_pop=10, geracoes=200,
+                                                   seed=42, parada=parada_np)
+print(f"NumPy: {fitness_parada_np} | parou após {parada_np.geracoes} de 200 gerações ({parada_np.motivo})")
+
+#%% Versão compactada - 1 bit por gene (64 genes por palavra uint64)
+# Pontos e pesos são somados com contagem de bits (popcount) sobre os
+# planos de bits dos valores, sem descompactar a população.
+from utils_ag import planos_de_bits, soma_ponderada_compactada
+
+PLANOS_PONTOS = planos_de_bits(PONTOS)
+PLANOS_PESOS = planos_de_bits(PESOS)
+
+def fitness_compactada(populacao):
+    pontos = soma_ponderada_compactada(populacao, PLANOS_PONTOS)
+    peso = soma_ponderada_compactada(populacao, PLANOS_PESOS)
+    return np.where(peso <= 5000, pontos, 0)
+
+solucao_bits, melhor_fitness_bits, historico_bits = algoritmo_genetico_numpy(
+    fitness_compactada, n_genes=9, tam_pop=10, geracoes=50, taxa_mut=0.1,
+    selecao=selecao_torneio_numpy, seed=42, compactado=True
+)
+
+print("Solução (compactada):", solucao_bits)
+print("Fitness (compactada):", melhor_fitness_bits)
+
+#%% Reparo guloso - soluções acima da capacidade perdem os piores itens
+# Com capacidade apertada, quase toda solução aleatória passa do limite e recebe
+# fitness 0. O reparo (ver utils_mochila.py) retira os itens de pior razão
+# pontos/peso até caber. Lamarckiano: os genes reparados ficam na população;
+# baldwiniano: só a avaliação usa a versão reparada.
+from utils_mochila import gerar_mochila, ReparoMochila, mochila_programacao_dinamica
+
+mochila_grande, capacidade_grande = gerar_mochila(200, capacidade_relativa=0.1, seed=7)
+PONTOS_G = mochila_grande['pontos'].to_numpy()
+PESOS_G = mochila_grande['peso'].to_numpy()
+otimo = mochila_programacao_dinamica(mochila_grande, capacidade_grande)['valor']
+
+def fitness_penalidade(populacao):
+    return np.where(populacao @ PESOS_G <= capacidade_grande, populacao @ PONTOS_G, 0)
+
+reparo_lamarck = ReparoMochila(PONTOS_G, PESOS_G, capacidade_grande, lamarckiano=True)
+reparo_baldwin = ReparoMochila(PONTOS_G, PESOS_G, capacidade_grande, lamarckiano=False)
+
+estrategias = {
+    "Penalidade (fitness 0)": dict(fitness_lote=fitness_penalidade),
+    "Reparo baldwiniano": dict(fitness_lote=reparo_baldwin.avaliar),
+    "Reparo lamarckiano": dict(fitness_lote=reparo_lamarck.avaliar, reparo=reparo_lamarck.reparar),
+}
+
+print(f"\n200 itens, capacidade {capacidade_grande} | ótimo (programação dinâmica) = {otimo}")
+for nome, kwargs in estrategias.items():
+    _, melhor, hist = algoritmo_genetico_numpy(n_genes=200, tam_pop=100, geracoes=200,
+                                               taxa_mut=0.005, seed=42, **kwargs)
+    print(f"{nome:23s}: {melhor} pontos | gap = {(otimo - melhor) / otimo * 100:.1f}%")
+    plt.plot(hist, linewidth=2, label=nome)
+
+plt.axhline(otimo, color='k', linestyle=':', label="Ótimo")
+plt.xlabel("Geração")
+plt.ylabel("Fitness")
+plt.title("Penalidade x Reparo - mochila com 200 itens")
+plt.legend()
+plt.grid(True)
+plt.show()
+
+#%% Avaliação paralela - processos + memória compartilhada
+# Ver 2_AG_Problema da Mochila_v11_manual_PARALELO.py: o exemplo fica em um
+# script próprio porque, com o método "spawn" (Windows/macOS), cada processo
+# importaria este arquivo e repetiria todas as execuções e gráficos acima.
+
+#%% Cache de fitness - cromossomos repetidos não são reavaliados (ver utils_ag.py)
+from utils_ag import CacheFitness
+
+fitness_cache = CacheFitness(fitness, tamanho=1000)
+solucao_cache, melhor_fitness_cache, historico_cache = algoritmo_genetico(avaliador=fitness_cache)
+
+print("Fitness (com cache):", melhor_fitness_cache)
+print(f"Cache: {fitness_cache.acertos} acertos, {fitness_cache.falhas} falhas "
+      f"({fitness_cache.taxa_acertos:.1%} de avaliações economizadas)")
+#%% Checkpoint e retomada - execuções longas que podem ser interrompidas
+# A cada 'intervalo_checkpoint' gerações o estado completo (população, fitness,
+# geração, gerador aleatório e histórico) vai para um .npz. Rodando de novo com
+# o mesmo arquivo, o AG continua de onde parou (ver utils_ag.py).
+import os
+import tempfile
+
+arquivo_checkpoint = os.path.join(tempfile.mkdtemp(), "mochila_200.npz")
+parametros_longos = dict(fitness_lote=reparo_lamarck.avaliar, reparo=reparo_lamarck.reparar,
+                         n_genes=200, tam_pop=100, taxa_mut=0.005, seed=42)
+
+# Execução "interrompida" na geração 120 e retomada até a 400
+algoritmo_genetico_numpy(geracoes=120, checkpoint=arquivo_checkpoint, intervalo_checkpoint=50,
+                         **parametros_longos)
+_, fitness_retomado, historico_retomado = algoritmo_genetico_numpy(
+    geracoes=400, checkpoint=arquivo_checkpoint, intervalo_checkpoint=50, **parametros_longos)
+
+# Mesma execução sem interrupção
+_, fitness_direto, historico_direto = algoritmo_genetico_numpy(geracoes=400, **parametros_longos)
+print(f"Retomada: {fitness_retomado} | sem interrupção: {fitness_direto} | "
+      f"históricos idênticos: {np.array_equal(historico_retomado, historico_direto)}")
@@ -1,7 +1,10 @@
 #%% Algoritmo Genético Manual - Sem Bibliotecas Externas
 
 import random
+from bisect import bisect_left
+from itertools import accumulate
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 #%% AG com Seleção por ROLETA
@@ -23,20 +26,21 @@ def criar_individuo():
 def criar_populacao(tamanho):
     return [criar_individuo() for _ in range(tamanho)]
 
-def selecao_roleta(populacao, fitness_values):
-    total_fitness = sum(fitness_values)
+def roleta_acumulada(fitness_values):
+    # Soma acumulada do fitness: calculada uma única vez por geração
+    return list(accumulate(fitness_values))
+
+def selecao_roleta(populacao, fitness_values, acumulado=None):
+    if acumulado is None:
+        acumulado = roleta_acumulada(fitness_values)
+    total_fitness = acumulado[-1]
     if total_fitness == 0:
         return random.choice(populacao)
     
     ponto_aleatorio = random.uniform(0, total_fitness)
-    acumulado = 0
-    
-    for individuo, fit in zip(populacao, fitness_values):
-        acumulado += fit
-        if acumulado >= ponto_aleatorio:
-            return individuo
-    
-    return populacao[-1]
+    # Busca binária: primeiro indivíduo cujo acumulado alcança o ponto sorteado
+    indice = bisect_left(acumulado, ponto_aleatorio)
+    return populacao[min(indice, len(populacao) - 1)]
 
 def cruzamento_um_ponto(pai1, pai2):
     ponto = random.randint(1, 8)
@@ -45,29 +49,37 @@ def cruzamento_um_ponto(pai1, pai2):
 def mutacao(individuo, taxa=0.1):
     return [1-gene if random.random() < taxa else gene for gene in individuo]
 
-def algoritmo_genetico(tam_pop=10, geracoes=50, taxa_mut=0.1):
+def avaliar_populacao(populacao, avaliador=None):
+    if avaliador is None:
+        return [fitness(ind) for ind in populacao]
+    return avaliador.avaliar(np.array(populacao)).tolist()
+
+def algoritmo_genetico(tam_pop=10, geracoes=50, taxa_mut=0.1, avaliador=None, parada=None):
     populacao = criar_populacao(tam_pop)
     historico = []
     
     for geracao in range(geracoes):
-        fitness_values = [fitness(ind) for ind in populacao]
+        fitness_values = avaliar_populacao(populacao, avaliador)
         melhor_fitness = max(fitness_values)
         historico.append(melhor_fitness)
+        if parada is not None and parada.verificar(fitness_values, populacao):
+            break   # Critério de parada antecipada (ver CriterioParada em utils_ag.py)
         
         nova_populacao = []
         melhor_idx = fitness_values.index(melhor_fitness)
         nova_populacao.append(populacao[melhor_idx])
         
+        acumulado = roleta_acumulada(fitness_values)
         while len(nova_populacao) < tam_pop:
-            pai1 = selecao_roleta(populacao, fitness_values)
-            pai2 = selecao_roleta(populacao, fitness_values)
+            pai1 = selecao_roleta(populacao, fitness_values, acumulado)
+            pai2 = selecao_roleta(populacao, fitness_values, acumulado)
             filho = cruzamento_um_ponto(pai1, pai2)
             filho = mutacao(filho, taxa_mut)
             nova_populacao.append(filho)
         
         populacao = nova_populacao
     
-    fitness_values = [fitness(ind) for ind in populacao]
+    fitness_values = avaliar_populacao(populacao, avaliador)
     melhor_idx = fitness_values.index(max(fitness_values))
     return populacao[melhor_idx], max(fitness_values), historico
 
@@ -85,4 +97,50 @@ plt.xlabel("Geração")
 plt.ylabel("Fitness")
 plt.title("Convergência - AG Manual (Seleção Roleta)")
 plt.grid(True)
-plt.show()
\ No newline at end of file
+plt.show()
+
+#%% Versão NumPy - população em um único array (tam_pop x genes)
+# Mesmo AG, mas seleção, cruzamento e mutação são feitos para a geração
+# inteira com operações de array (ver utils_ag.py). Indicado para populações grandes.
+# Alternativa para populações muito grandes: selecao_roleta_alias (sorteios em O(1))
+from utils_ag import algoritmo_genetico_numpy, selecao_roleta_numpy
+
+PONTOS = mochila['pontos'].to_numpy()
+PESOS = mochila['peso'].to_numpy()
+
+def fitness_lote(populacao):
+    pontos = populacao @ PONTOS
+    peso = populacao @ PESOS
+    return np.where(peso <= 5000, pontos, 0)
+
+solucao_np, melhor_fitness_np, historico_np = algoritmo_genetico_numpy(
+    fitness_lote, n_genes=9, tam_pop=10, geracoes=50, taxa_mut=0.1,
+    selecao=selecao_roleta_numpy, seed=42
+)
+
+print("Solução (NumPy):", solucao_np)
+print("Fitness (NumPy):", melhor_fitness_np)
+
+plt.plot(historico, 'b-', linewidth=2, label="Listas")
+plt.plot(historico_np, 'r--', linewidth=2, label="NumPy")
+plt.xlabel("Geração")
+plt.ylabel("Fitness")
+plt.title("Convergência - AG Manual x NumPy (Roleta)")
+plt.legend()
+plt.grid(True)
+plt.show()
+
+#%% Avaliação paralela - processos + memória compartilhada
+# Ver 2_AG_Problema da Mochila_v11_manual_PARALELO.py: o exemplo fica em um
+# script próprio porque, com o método "spawn" (Windows/macOS), cada processo
+# importaria este arquivo e repetiria todas as execuções e gráficos acima.
+
+#%% Cache de fitness - cromossomos repetidos não são reavaliados (ver utils_ag.py)
+from utils_ag import CacheFitness
+
+fitness_cache = CacheFitness(fitness, tamanho=1000)
+solucao_cache, melhor_fitness_cache, historico_cache = algoritmo_genetico(avaliador=fitness_cache)
+
+print("Fitness (com cache):", melhor_fitness_cache)
+print(f"Cache: {fitness_cache.acertos} acertos, {fitness_cache.falhas} falhas "
+      f"({fitness_cache.taxa_acertos:.1%} de avaliações economizadas)")
\ No newline at end of file
@@ -0,0 +1,138 @@
+#%% PyGAD - Benchmark dos Tipos de Seleção
+
+#Instalação: pip install pygad
+
+# O script v2 compara os 5 tipos de seleção com UMA execução na mochila de 9
+# itens. Aqui cada tipo de seleção roda em instâncias geradas de tamanho
+# crescente, com várias sementes, e é medido contra o ótimo exato:
+#   - tempo por geração
+#   - avaliações de fitness até atingir ALVO * ótimo
+#   - gap final em relação ao ótimo (programação dinâmica / branch-and-bound)
+
+import json
+import time
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from utils_mochila import gerar_mochila, resolver_mochila_exata, executar_pygad_mochila
+
+#%%============================================================================
+# CONFIGURAÇÃO DO BENCHMARK
+# ============================================================================
+
+SELECOES = {
+    "tournament": "Torneio",
+    "rws": "Roleta",
+    "sss": "Steady-State",
+    "random": "Aleatório",
+    "rank": "Rank",
+}
+TAMANHOS = [50, 100, 200, 500]      # Número de itens das instâncias geradas
+SEMENTES = range(10)                # Uma execução por semente (e por instância)
+CAPACIDADE_RELATIVA = 0.2           # Capacidade = 20% do peso total dos itens
+ALVO = 0.99                         # "Atingiu o alvo" = fitness >= 99% do ótimo
+
+# Fitness usada em todas as execuções: True = reparo guloso baldwiniano (as
+# soluções inviáveis são avaliadas depois de reparadas), False = AG puro
+# (fitness 0 se passar da capacidade); ver executar_pygad_mochila
+REPARO = True
+VARIANTE = "reparo baldwiniano" if REPARO else "sem reparo (fitness 0 se inviável)"
+
+PARAMETROS_GA = dict(
+    num_generations=100,
+    sol_per_pop=50,
+    num_parents_mating=20,
+    keep_elitism=1,
+    K_tournament=3,
+)
+
+ARQUIVO_CSV = "benchmark_selecao.csv"
+ARQUIVO_CONVERGENCIA = "benchmark_selecao_convergencia.csv"
+ARQUIVO_JSON = "benchmark_selecao.json"
+
+#%%============================================================================
+# EXECUÇÃO
+# ============================================================================
+
+resultados = []
+convergencias = []   # Formato longo: uma linha por (execução, geração)
+inicio = time.perf_counter()
+print(f"Fitness: {VARIANTE}")
+
+for n_itens in TAMANHOS:
+    mochila, capacidade = gerar_mochila(n_itens, CAPACIDADE_RELATIVA, seed=n_itens)
+    exato = resolver_mochila_exata(mochila, capacidade)
+    print(f"\n{n_itens} itens | capacidade {capacidade} | ótimo = {exato['valor']} "
+          f"({exato['metodo']}, {exato['tempo']:.3f} s)")
+
+    for selecao, nome in SELECOES.items():
+        for semente in SEMENTES:
+            resultado = executar_pygad_mochila(mochila, capacidade, semente, otimo=exato['valor'],
+                                               alvo=ALVO, reparo=REPARO, parent_selection_type=selecao,
+                                               **PARAMETROS_GA)
+            convergencia = resultado.pop('convergencia')
+            chave = {'n_itens': n_itens, 'selecao': nome, 'semente': semente}
+            resultados.append({**chave, 'variante': VARIANTE, 'otimo': int(exato['valor']), **resultado})
+            convergencias.extend({**chave, 'geracao': geracao, 'melhor': melhor}
+                                 for geracao, melhor in enumerate(convergencia))
+
+        ultimas = pd.DataFrame(resultados[-len(SEMENTES):])
+        print(f"  {nome:13s}: gap médio = {ultimas['gap'].mean():5.2f}% | "
+              f"{ultimas['tempo_por_geracao'].mean() * 1000:6.2f} ms/geração")
+
+print(f"\nBenchmark concluído em {time.perf_counter() - inicio:.1f} s")
+
+#%%============================================================================
+# RESULTADOS: CSV (UMA LINHA POR EXECUÇÃO), CSV DAS CURVAS DE CONVERGÊNCIA
+# (UMA LINHA POR GERAÇÃO) E JSON (CONFIGURAÇÃO + RESUMO)
+# ============================================================================
+
+df = pd.DataFrame(resultados)
+df.to_csv(ARQUIVO_CSV, index=False)
+pd.DataFrame(convergencias).to_csv(ARQUIVO_CONVERGENCIA, index=False)
+
+resumo = df.groupby(['n_itens', 'selecao']).agg(
+    gap_medio=('gap', 'mean'),
+    gap_desvio=('gap', 'std'),
+    taxa_alvo=('avaliacoes_ate_alvo', lambda x: x.notna().mean()),
+    avaliacoes_ate_alvo=('avaliacoes_ate_alvo', 'median'),
+    ms_por_geracao=('tempo_por_geracao', lambda x: x.mean() * 1000),
+).reset_index()
+
+with open(ARQUIVO_JSON, 'w', encoding='utf-8') as arquivo:
+    json.dump({'configuracao': {'tamanhos': TAMANHOS, 'sementes': list(SEMENTES),
+                                'capacidade_relativa': CAPACIDADE_RELATIVA, 'alvo': ALVO,
+                                'reparo': REPARO, 'variante': VARIANTE,
+                                'parametros_ga': PARAMETROS_GA},
+               'resumo': resumo.replace({np.nan: None}).to_dict(orient='records')},
+              arquivo, ensure_ascii=False, indent=2)
+
+print(f"Resultados salvos em {ARQUIVO_CSV}, {ARQUIVO_CONVERGENCIA} e {ARQUIVO_JSON}\n")
+print(resumo.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+
+#%%============================================================================
+# GRÁFICOS: GAP E AVALIAÇÕES ATÉ O ALVO POR TAMANHO DE INSTÂNCIA
+# ============================================================================
+
+fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+fig.suptitle(f"Tipos de Seleção do PyGAD - Mochila 0/1 ({VARIANTE})", fontsize=16, fontweight='bold')
+
+for nome in SELECOES.values():
+    linhas = resumo[resumo['selecao'] == nome]
+    ax1.errorbar(linhas['n_itens'], linhas['gap_medio'], yerr=linhas['gap_desvio'],
+                 marker='o', capsize=4, label=nome)
+    ax2.plot(linhas['n_itens'], linhas['taxa_alvo'] * 100, marker='o', label=nome)
+
+ax1.set_title("Gap em relação ao ótimo (média ± desvio)")
+ax1.set_xlabel("Número de itens")
+ax1.set_ylabel("Gap (%)")
+ax2.set_title(f"Execuções que atingiram {ALVO:.0%} do ótimo")
+ax2.set_xlabel("Número de itens")
+ax2.set_ylabel("Execuções (%)")
+for ax in (ax1, ax2):
+    ax.set_xscale('log')
+    ax.grid(True, alpha=0.4, linestyle='--')
+    ax.legend()
+
+plt.tight_layout()
+plt.show()
@@ -2,6 +2,7 @@
 
 import numpy as np         # Biblioteca para cálculos numéricos eficientes (arrays, operações matemáticas)
 import matplotlib.pyplot as plt  # Para criação de gráficos e visualizações
+from utils_ag import CriterioParada  # Parada antecipada (estagnação, alvo, diversidade, tempo)
 
 #%% --- 1. Configuração dos Parâmetros do Algoritmo Genético ---
 
@@ -17,8 +18,15 @@ GENS = 20       # Número de gerações: quantas iterações o algoritmo executa
 PC = 0.8        # Taxa de Crossover: 80% de chance de dois pais gerarem filhos por recombinação
 PM = 0.05       # Taxa de Mutação: 5% de chance de cada bit sofrer mutação (inversão 0↔1)
 
+# Parada antecipada: None = sempre roda GENS gerações
+# Ex.: CriterioParada(paciencia=5, diversidade_minima=0.05) para quando o melhor
+# f(x) não melhora por 5 gerações ou a população fica quase toda igual
+PARADA = None
+
 # Domínio da função objetivo que queremos otimizar
 XMIN, XMAX = -1.0, 2.0   # Intervalo onde procuraremos o máximo da função f(x) = x*sin(10πx) + 1
+# Para funções de várias variáveis (limites por dimensão, codificação real ou binária),
+# veja utils_continuo.py e o script 3_nD_Funcoes_Teste_Benchmark_AG.py
 
 #%% --- 2. Definição da Função Objetivo e Conversão Binário-Real ---
 
@@ -26,26 +34,47 @@ XMIN, XMAX = -1.0, 2.0   # Intervalo onde procuraremos o máximo da função f(x
 # Esta é uma função multimodal (vários picos) que testa a capacidade do AG de encontrar o máximo global
 f = lambda x: x * np.sin(10 * np.pi * x) + 1
 
+# Vetor com as potências de 2 de cada posição do cromossomo: [2^(BITS-1), ..., 4, 2, 1]
+# Pré-calculado uma única vez; decodificar vira um produto escalar (bits @ POTENCIAS_2)
+# Em int64 o maior valor representável é 2^63 - 1: acima disso o produto
+# transbordaria sem aviso
+assert BITS < 63, "Decodificação em int64: use BITS < 63"
+POTENCIAS_2 = 2 ** np.arange(BITS - 1, -1, -1, dtype=np.int64)
+
+# Codificação Gray: cromossomos vizinhos (x próximos) diferem em apenas 1 bit,
+# o que suaviza o efeito da mutação. False = binário comum
+GRAY = False
+
+def bits_to_int(bits):
+    """
+    Converte cromossomos binários em inteiros [0, 2^BITS-1] com um produto escalar.
+    Aceita um único cromossomo (BITS,) ou a população inteira (POP, BITS).
+    
+    Com GRAY=True, os bits são primeiro convertidos de código Gray para binário:
+    b[0] = g[0], b[i] = b[i-1] XOR g[i] (XOR acumulado ao longo do cromossomo).
+    """
+    bits = np.asarray(bits)
+    if GRAY:
+        bits = np.bitwise_xor.accumulate(bits, axis=-1)
+    return bits @ POTENCIAS_2
+
 def bits_to_real(bits):
     """
-    Converte um cromossomo binário (lista de 0s e 1s) para um valor real no domínio [XMIN, XMAX].
+    Converte cromossomos binários para valores reais no domínio [XMIN, XMAX].
     
-    Processo:
-    1. Converte array binário para string: [1,0,1,1] → "1011"
-    2. Interpreta como número binário: "1011" → 11 (decimal)
-    3. Normaliza para [0,1]: 11 / (2^14-1) = 11/16383
-    4. Mapeia para domínio desejado: XMIN + proporção * (XMAX - XMIN)
+    Processo (para a população inteira de uma vez, sem converter para string):
+    1. Produto escalar com as potências de 2: [1,0,1,1] · [8,4,2,1] → 11 (decimal)
+    2. Normaliza para [0,1]: 11 / (2^14-1) = 11/16383
+    3. Mapeia para domínio desejado: XMIN + proporção * (XMAX - XMIN)
     
     Args:
-        bits: Array numpy com valores 0 e 1 representando o cromossomo
+        bits: Array numpy com valores 0 e 1, um cromossomo (BITS,) ou população (POP, BITS)
     
     Returns:
-        float: Valor real correspondente no intervalo [XMIN, XMAX]
+        float ou array: Valor(es) real(is) correspondente(s) no intervalo [XMIN, XMAX]
     """
-    binary_string = ''.join(map(str, bits))  # Converte array para string binária
-    decimal_value = int(binary_string, 2)    # Converte binário para decimal
     # Mapeia linearmente do intervalo [0, 2^BITS-1] para [XMIN, XMAX]
-    return XMIN + (XMAX - XMIN) * decimal_value / (2**BITS - 1)
+    return XMIN + (XMAX - XMIN) * bits_to_int(bits) / (2**BITS - 1)
 
 #%% --- 3. Implementação dos Operadores Genéticos ---
 
@@ -63,50 +92,49 @@ def evolve_population(pop):
         tuple: (nova_população, valores_x, fitness_valores)
     """
     
-    # ETAPA 1: AVALIAÇÃO - Calcula o fitness (aptidão) de cada indivíduo
-    x_vals = np.array([bits_to_real(ind) for ind in pop])  # Converte todos os cromossomos para valores reais
-    fitness = np.array([f(x) for x in x_vals])             # Avalia a função objetivo para cada valor
+    # Tamanho da população atual (permite rodar com qualquer POP, ex.: 10^5)
+    n = len(pop)
+    
+    # ETAPA 1: AVALIAÇÃO - Calcula o fitness (aptidão) de todos os indivíduos de uma vez
+    x_vals = bits_to_real(pop)   # Converte todos os cromossomos de uma vez
+    fitness = f(x_vals)          # f é uma expressão NumPy: avalia o vetor inteiro
     
     # ETAPA 2: SELEÇÃO POR ROLETA VICIADA (Roulette Wheel Selection)
     # Indivíduos com maior fitness têm maior probabilidade de serem selecionados como pais
     # Adiciona pequena constante para evitar divisão por zero e garantir que todos tenham alguma chance
     probs = (fitness - fitness.min() + 0.001)  # Normaliza fitness para valores não-negativos
     probs /= probs.sum()                       # Converte para probabilidades (soma = 1)
-    # Seleciona POP indivíduos com reposição baseado nas probabilidades
-    selected = pop[np.random.choice(POP, POP, p=probs)]
-    
-    # ETAPA 3: REPRODUÇÃO (Crossover + Mutação)
-    # Gera POP-2 novos indivíduos (reservamos 2 vagas para elitismo)
-    new_pop = []
-    for i in range(0, POP-2, 2):  # Processa pares de pais
-        # Seleciona dois pais da população selecionada
-        p1, p2 = selected[i], selected[(i+1) % POP]
-        
-        # CROSSOVER DE UM PONTO: Recombina material genético dos pais
-        if np.random.random() < PC:  # Apenas se sorteio < taxa de crossover
-            pt = np.random.randint(1, BITS)  # Escolhe ponto de corte aleatório (1 a BITS-1)
-            # Cria filhos trocando segmentos após o ponto de corte
-            c1 = np.r_[p1[:pt], p2[pt:]]     # Filho 1: início do pai1 + fim do pai2
-            c2 = np.r_[p2[:pt], p1[pt:]]     # Filho 2: início do pai2 + fim do pai1
-        else:
-            # Se não há crossover, filhos são cópias exatas dos pais
-            c1, c2 = p1.copy(), p2.copy()
-        
-        # MUTAÇÃO BIT-FLIP: Cada bit pode ser invertido independentemente
-        for c in [c1, c2]:  # Aplica mutação a ambos os filhos
-            # Cria máscara booleana: True onde deve ocorrer mutação
-            mask = np.random.random(BITS) < PM
-            # Inverte bits selecionados: 0→1, 1→0
-            c[mask] = 1 - c[mask]
-        
-        new_pop.extend([c1, c2])  # Adiciona filhos à nova população
+    # Seleciona n indivíduos com reposição baseado nas probabilidades
+    selected = pop[np.random.choice(n, n, p=probs)]
+    
+    # ETAPA 3: REPRODUÇÃO (Crossover + Mutação) - todos os pares de uma vez
+    # Gera n-2 novos indivíduos (reservamos 2 vagas para elitismo)
+    idx_p1 = np.arange(0, n - 2, 2)                # Pais 1: posições 0, 2, 4, ...
+    p1, p2 = selected[idx_p1], selected[(idx_p1 + 1) % n]   # Pais 2: posições 1, 3, 5, ...
+    n_pares = len(idx_p1)
+    
+    # CROSSOVER DE UM PONTO: uma máscara por par diz quais genes vêm do "próprio" pai
+    # Genes antes do ponto de corte vêm do pai1 (filho 1) / pai2 (filho 2); o resto é trocado.
+    # Pares sem crossover (sorteio >= PC) têm máscara toda True: filhos = cópias dos pais
+    cruza = np.random.random(n_pares) < PC                      # Quais pares fazem crossover
+    pt = np.random.randint(1, BITS, n_pares)                    # Ponto de corte de cada par (1 a BITS-1)
+    mask = (np.arange(BITS) < pt[:, None]) | ~cruza[:, None]    # Máscara (n_pares x BITS)
+    c1 = np.where(mask, p1, p2)   # Filho 1: início do pai1 + fim do pai2
+    c2 = np.where(mask, p2, p1)   # Filho 2: início do pai2 + fim do pai1
+    # Intercala os filhos na ordem [c1 do par 0, c2 do par 0, c1 do par 1, ...]
+    children = np.stack([c1, c2], axis=1).reshape(-1, BITS)
+    
+    # MUTAÇÃO BIT-FLIP: Cada bit pode ser invertido independentemente
+    # Máscara booleana para todos os filhos: True onde deve ocorrer mutação
+    mutation_mask = np.random.random(children.shape) < PM
+    children = np.where(mutation_mask, 1 - children, children)   # Inverte bits: 0→1, 1→0
     
     # ETAPA 4: ELITISMO - Preserva os melhores indivíduos
     # Garante que as melhores soluções não sejam perdidas durante a evolução
     elite_idx = np.argsort(fitness)[-2:]  # Índices dos 2 melhores indivíduos
-    new_pop.extend([pop[elite_idx[-1]], pop[elite_idx[-2]]])  # Adiciona à nova população
+    new_pop = np.concatenate([children, pop[elite_idx[::-1]]])  # Adiciona à nova população
     
-    return np.array(new_pop[:POP]), x_vals, fitness
+    return new_pop[:n], x_vals, fitness
 
 #%% --- 4. Execução Principal do Algoritmo Genético ---
 
@@ -124,12 +152,15 @@ snapshots = {}
 
 # LOOP PRINCIPAL DE EVOLUÇÃO
 for gen in range(GENS):
-    # Evolui a população por uma geração completa
+    # Evolui a população por uma geração completa; x_vals e fitness são da
+    # população avaliada (a de entrada), não da nova
+    avaliada = pop
     pop, x_vals, fitness = evolve_population(pop)
     best_idx = np.argmax(fitness)  # Encontra o índice do melhor indivíduo
+    parar = PARADA is not None and PARADA.verificar(fitness, avaliada)
     
-    # Captura snapshot e imprime detalhes apenas nas gerações de interesse
-    if (gen + 1) in [1, 5, 10, 20]:
+    # Captura snapshot e imprime detalhes apenas nas gerações de interesse (e na última, se parar antes)
+    if (gen + 1) in [1, 5, 10, 20] or parar:
         # Armazena estado completo da população para posterior visualização
         snapshots[gen + 1] = (x_vals.copy(), fitness.copy(), x_vals[best_idx], fitness[best_idx])
         
@@ -140,12 +171,16 @@ for gen in range(GENS):
         # Exibe detalhes completos de cada indivíduo da população
         print("    Cromossomo (binário)    →  Decimal  →     x     →   f(x)")
         print("    " + "-"*56)
-        for i, (individual, x_val, fit_val) in enumerate(zip(pop, x_vals, fitness)):
-            binary_str = ''.join(map(str, individual))  # Converte cromossomo para string
-            decimal_val = int(binary_str, 2)            # Valor decimal correspondente
+        decimal_vals = bits_to_int(avaliada)            # Valores decimais de todos os cromossomos
+        for i, (individual, decimal_val, x_val, fit_val) in enumerate(zip(avaliada, decimal_vals, x_vals, fitness)):
+            binary_str = ''.join(map(str, individual))  # Cromossomo como texto (apenas para exibição)
             marker = " ★" if i == best_idx else "  "    # Marca o melhor indivíduo
             print(f"   {marker}{binary_str}  →   {decimal_val:5d}   → {x_val:7.4f} → {fit_val:7.4f}")
         print()
+    
+    if parar:
+        print(f"Parada antecipada na geração {gen+1}: {PARADA.motivo}")
+        break
 
 #%% --- 5. Criação do Painel de Visualização (2x2) ---
 
@@ -153,7 +188,7 @@ for gen in range(GENS):
 x_func = np.linspace(XMIN, XMAX, 500)  # 500 pontos para curva suave da função
 y_func = f(x_func)                     # Valores da função objetivo
 colors = ['red', 'orange', 'green', 'purple']  # Cores para cada geração
-target_gens = [1, 5, 10, 20]         # Gerações que serão visualizadas
+target_gens = sorted(snapshots)[:4]  # Gerações que serão visualizadas (1, 5, 10, 20 ou até a parada)
 
 # Criação da figura com 4 subplots (2 linhas × 2 colunas)
 fig, axes = plt.subplots(2, 2, figsize=(12, 10))
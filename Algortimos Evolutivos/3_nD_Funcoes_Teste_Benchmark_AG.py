@@ -0,0 +1,64 @@
+#%% --- Importação das Bibliotecas Necessárias ---
+
+import numpy as np               # Cálculos numéricos vetorizados
+import matplotlib.pyplot as plt  # Gráficos de convergência
+from utils_continuo import otimizar, limites_iguais, rastrigin, rosenbrock, ackley
+
+#%% --- 1. Configuração dos Experimentos ---
+
+# O mesmo AG do script 3_2D_Funcao_Teste_Nao_Linear_AG.py, agora para n variáveis
+# (ver utils_continuo.py). A função objetivo recebe a população inteira
+# X (pop x dim) e devolve um valor por indivíduo (pop,).
+
+DIM = 30        # Número de variáveis (dimensões) de cada função de teste
+POP = 200       # Tamanho da população
+GENS = 500      # Número de gerações
+SEED = 1234     # Semente para reprodutibilidade
+
+# Funções de teste clássicas (todas de minimização, ótimo global = 0)
+benchmarks = {
+    "Rastrigin":  (rastrigin,  limites_iguais(-5.12, 5.12, DIM)),
+    "Rosenbrock": (rosenbrock, limites_iguais(-5.0, 10.0, DIM)),
+    "Ackley":     (ackley,     limites_iguais(-32.768, 32.768, DIM)),
+}
+
+# Codificações comparadas: real (SBX + mutação polinomial) e binária (16 bits por variável)
+codificacoes = ["real", "binaria"]
+
+#%% --- 2. Execução ---
+
+print(f"AG n-dimensional | Dimensões: {DIM} | População: {POP} | Gerações: {GENS}")
+print("-" * 60)
+
+resultados = {}
+for nome, (funcao, limites) in benchmarks.items():
+    for codificacao in codificacoes:
+        resultado = otimizar(funcao, limites, tam_pop=POP, geracoes=GENS,
+                             codificacao=codificacao, bits=16, seed=SEED)
+        resultados[(nome, codificacao)] = resultado
+        print(f"{nome:10s} | {codificacao:7s} | Melhor f(x) = {resultado['f']:12.4f}")
+
+#%% --- 3. Curvas de Convergência ---
+
+fig, axes = plt.subplots(1, len(benchmarks), figsize=(16, 5))
+fig.suptitle(f"Convergência do AG em {DIM} dimensões", fontsize=16, fontweight='bold')
+
+for ax, nome in zip(axes, benchmarks):
+    for codificacao, estilo in zip(codificacoes, ['b-', 'r--']):
+        ax.semilogy(resultados[(nome, codificacao)]['historico'], estilo, linewidth=2, label=codificacao)
+    ax.set_title(nome)
+    ax.set_xlabel("Geração")
+    ax.set_ylabel("Melhor f(x) (escala log)")
+    ax.grid(True, alpha=0.4, linestyle='--')
+    ax.legend()
+
+plt.tight_layout()
+plt.show()
+
+#%% --- 4. Exemplo: a função 1-D do script original, agora pelo otimizador ---
+
+# f(x) = x*sin(10πx) + 1 em [-1, 2], maximizada como no script 3_2D
+f_1d = lambda X: X[:, 0] * np.sin(10 * np.pi * X[:, 0]) + 1
+resultado_1d = otimizar(f_1d, [[-1.0, 2.0]], tam_pop=14, geracoes=20,
+                        codificacao="binaria", bits=14, maximizar=True, seed=SEED)
+print(f"\nFunção 1-D: melhor x = {resultado_1d['x'][0]:.4f} | f(x) = {resultado_1d['f']:.4f}")
@@ -0,0 +1,197 @@
+#%% --- Importação das Bibliotecas Necessárias ---
+
+#Instalação: pip install pygad
+
+import pygad          # A biblioteca principal para o Algoritmo Genético
+import numpy as np    # Usada para cálculos numéricos eficientes
+import matplotlib.pyplot as plt # Para gerar os gráficos
+from utils_ag import CriterioParada, RelatorioProgresso  # Parada antecipada e progresso (ver utils_ag.py)
+from utils_tsp import (matriz_distancias, comprimento_rotas,  # Funções do PCV (ver utils_tsp.py)
+                       populacao_permutacoes, vizinhos_mais_proximos, estagio_memetico,
+                       crossover_ox_pygad, crossover_pmx_pygad,
+                       mutacao_inversao_pygad, mutacao_troca_pygad)
+
+#%% --- 1. Parâmetros do Algoritmo e do Problema ---
+
+# Hiperparâmetros do Algoritmo Genético que podem ser ajustados
+num_generations = 200       # Quantas "gerações" ou iterações o algoritmo irá executar
+sol_per_pop = 100           # Quantas soluções (rotas) existirão em cada geração
+num_parents_mating = 40     # Quantas das melhores soluções de uma geração serão selecionadas como "pais"
+mutation_probability = 0.3  # Chance de cada filho sofrer uma mutação (inversão de um trecho)
+
+# Operadores de permutação (ver utils_tsp.py)
+crossover = crossover_ox_pygad        # Alternativa: crossover_pmx_pygad
+mutacao = mutacao_inversao_pygad      # Alternativa: mutacao_troca_pygad
+
+# Estágio memético: busca local (2-opt + Or-opt) nos melhores indivíduos a cada geração
+usar_busca_local = True
+num_elites_busca_local = 2   # Quantos dos melhores indivíduos recebem a busca local
+num_vizinhos = 10            # Tamanho da lista de vizinhos mais próximos de cada cidade
+
+# Parada antecipada: None = sempre roda num_generations gerações
+# Ex.: CriterioParada(paciencia=50) encerra se a melhor rota não melhorar por 50 gerações
+parada = None
+# parada = CriterioParada(paciencia=50)
+
+# Progresso a cada 20 gerações, em distância (1 / fitness); destino="progresso.jsonl"
+# e formato='json' gravam os registros estruturados em arquivo
+relatorio = RelatorioProgresso(intervalo=20, transformar=lambda f: 1.0 / f, minimizar=True)
+
+# Coordenadas das Cidades (baseado no Exemplo 6.4 do livro de Belfiore e Fávero)
+city_coordinates = {1: (10, 30), 2: (20, 50), 3: (50, 90), 4: (70, 30), 5: (90, 50)}
+
+# Para instâncias maiores, basta gerar cidades aleatórias (ex.: 200 paradas)
+usar_cidades_aleatorias = False
+if usar_cidades_aleatorias:
+    rng = np.random.default_rng(42)
+    city_coordinates = {i + 1: tuple(c) for i, c in enumerate(rng.uniform(0, 100, (200, 2)))}
+
+coords_list = list(city_coordinates.values())
+city_labels = list(city_coordinates.keys())
+num_cities = len(coords_list)
+
+#%% --- 2. Preparação dos Dados ---
+
+# Cada solução (cromossomo) é uma PERMUTAÇÃO das cidades: [2, 0, 4, 1, 3]
+# significa visitar 3 → 1 → 5 → 2 → 4 e voltar para 3 (índices começam em 0).
+# Ao contrário da codificação binária por arcos (num_cities*(num_cities-1) genes),
+# aqui são apenas num_cities genes e toda solução já é uma rota válida.
+
+# Pré-calculamos a distância entre todas as cidades e guardamos em uma matriz.
+# A matriz é montada de forma vetorizada (broadcasting) em utils_tsp.py;
+# para milhares de cidades use dtype=np.float32 e/ou arquivo="dist.npy".
+distance_matrix = matriz_distancias(coords_list)
+
+# Listas de vizinhos para a busca local: só as cidades mais próximas são testadas
+vizinhos = vizinhos_mais_proximos(distance_matrix, num_vizinhos)
+
+#%% --- 3. Função de Aptidão (Fitness Function) em Lote ---
+
+def fitness_func(ga_instance, solutions, solutions_idx):
+    """
+    Avalia várias rotas de uma vez (fitness_batch_size).
+    O comprimento de todas as rotas é calculado com uma única indexação da
+    matriz de distâncias; não há penalidades porque toda permutação é válida.
+    """
+    return 1.0 / comprimento_rotas(solutions, distance_matrix)
+
+#%% --- 4. Callback para Imprimir o Fitness de Cada Geração ---
+def on_generation(ga_instance):
+    """
+    Esta função é executada ao final de cada geração para mostrar o progresso.
+    Com a busca local ativada, também melhora os melhores indivíduos (AG memético).
+    """
+    if usar_busca_local:
+        estagio_memetico(ga_instance, distance_matrix, vizinhos, num_elites=num_elites_busca_local)
+    relatorio.on_generation(ga_instance)
+    if parada is not None:
+        return parada.on_generation(ga_instance)   # "stop" encerra a execução
+
+#%% --- 5. Configuração e Execução do Algoritmo Genético ---
+# A execução fica sob o if __name__ == "__main__": com o método "spawn"
+# (Windows/macOS) os processos das ilhas importam este script, e só as
+# definições acima devem rodar neles.
+if __name__ == "__main__":
+    # População inicial: rotas aleatórias (permutações)
+    initial_population = populacao_permutacoes(sol_per_pop, num_cities, np.random.default_rng(42))
+
+    ga_instance = pygad.GA(
+        num_generations=num_generations,
+        num_parents_mating=num_parents_mating,
+        fitness_func=fitness_func,
+        fitness_batch_size=sol_per_pop,     # Avalia a população inteira de uma vez
+        initial_population=initial_population,
+        gene_type=int,
+        parent_selection_type="tournament",
+        K_tournament=3,
+        keep_elitism=2,
+        crossover_type=crossover,           # Order Crossover (OX) ou PMX
+        mutation_type=mutacao,              # Inversão ou troca (swap)
+        mutation_probability=mutation_probability,
+        on_start=parada.on_start if parada is not None else None,
+        on_generation=on_generation,
+        on_stop=relatorio.on_stop,
+        suppress_warnings=True,
+        random_seed=42
+    )
+
+    print("Executando o Algoritmo Genético (codificação por permutação)...")
+    ga_instance.run()
+    print(f"Execução finalizada após {ga_instance.generations_completed} gerações ({(parada.motivo if parada is not None else None) or 'limite de gerações'}).")
+
+#%% --- 6. Análise e Visualização do Resultado Final ---
+
+if __name__ == "__main__":
+    solution, solution_fitness, _ = ga_instance.best_solution(pop_fitness=ga_instance.last_generation_fitness)
+    rota = solution.astype(int)
+    final_distance = comprimento_rotas(rota, distance_matrix)
+
+    print("\n--- Melhor Solução Encontrada ---")
+    print(f"Distância Total: {final_distance:.2f}")
+    if num_cities <= 20:
+        print(f"Rota: {' → '.join(str(city_labels[c]) for c in np.r_[rota, rota[0]])}")
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+    fig.suptitle("Resultado Final do AG para o PCV (Permutação)", fontsize=16)
+
+    # Subplot 1: Gráfico da Melhor Rota Encontrada
+    coords = np.array(coords_list)
+    ciclo = np.r_[rota, rota[0]]
+    ax1.plot(coords[ciclo, 0], coords[ciclo, 1], 'b-', zorder=1)
+    ax1.scatter(coords[:, 0], coords[:, 1], c='red', zorder=2)
+    if num_cities <= 20:
+        for i, city_coord in enumerate(coords_list):
+            ax1.text(city_coord[0] + 1, city_coord[1] + 1, str(city_labels[i]))
+    ax1.set_title(f"Melhor Rota Encontrada (Distância: {final_distance:.2f})")
+    ax1.set_xlabel("Coordenada X")
+    ax1.set_ylabel("Coordenada Y")
+    ax1.grid(True)
+
+    # Subplot 2: Gráfico da Evolução da Distância
+    ax2.plot(1.0 / np.array(ga_instance.best_solutions_fitness))
+    ax2.set_title("Evolução da Distância por Geração")
+    ax2.set_xlabel("Geração")
+    ax2.set_ylabel("Distância da Melhor Rota")
+    ax2.grid(True)
+
+    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    plt.show()
+
+#%% --- 7. Modelo de Ilhas (opcional) ---
+
+# Várias populações em processos separados trocando os melhores indivíduos a
+# cada 'geracoes_por_epoca' gerações (ver utils_ilhas.py). Útil nas instâncias
+# grandes (usar_cidades_aleatorias = True) e em máquinas com vários núcleos.
+usar_ilhas = False
+
+if __name__ == "__main__" and usar_ilhas:
+    from functools import partial
+    from utils_ilhas import executar_ilhas
+    from utils_tsp import FitnessRotas
+
+    # Fitness e estágio memético como objeto: podem ser enviados aos processos das ilhas
+    pcv = FitnessRotas(distance_matrix, vizinhos if usar_busca_local else None, num_elites_busca_local)
+    parametros_ilha = dict(
+        num_parents_mating=num_parents_mating,
+        sol_per_pop=sol_per_pop,
+        num_genes=num_cities,
+        fitness_func=pcv.fitness_pygad,
+        fitness_batch_size=sol_per_pop,
+        on_generation=pcv.on_generation,
+        gene_type=int,
+        parent_selection_type="tournament",
+        K_tournament=3,
+        keep_elitism=2,
+        crossover_type=crossover,
+        mutation_type=mutacao,
+        mutation_probability=mutation_probability,
+    )
+    resultado_ilhas = executar_ilhas(parametros_ilha, n_ilhas=4, epocas=10,
+                                     geracoes_por_epoca=num_generations // 10, n_migrantes=2,
+                                     topologia='anel',
+                                     inicializar=partial(populacao_permutacoes, sol_per_pop, num_cities),
+                                     seed=42, verbose=False)
+    rota_ilhas = np.asarray(resultado_ilhas['solucao'], dtype=int)
+    print(f"\nModelo de ilhas (4 ilhas, anel): distância = {comprimento_rotas(rota_ilhas, distance_matrix):.2f} "
+          f"(ilha {resultado_ilhas['ilha']})")
+
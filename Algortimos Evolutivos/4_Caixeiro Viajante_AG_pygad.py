@@ -1,12 +1,14 @@
 #%% --- Importação das Bibliotecas Necessárias ---
 
 #Instalação: pip install pygad
-#Instalação: pip install math
 
 import pygad          # A biblioteca principal para o Algoritmo Genético
 import numpy as np    # Usada para cálculos numéricos eficientes
 import matplotlib.pyplot as plt # Para gerar os gráficos
-import math           # Para a função de raiz quadrada (cálculo da distância)
+from utils_ag import CacheFitness, CriterioParada, RelatorioProgresso  # Cache, parada e progresso
+from utils_tsp import (matriz_distancias, contar_subrotas,    # Funções do PCV (ver utils_tsp.py)
+                       vizinhos_mais_proximos, estagio_memetico,
+                       rota_de_sucessores, sucessores_de_rota)
 
 #%% --- 1. Parâmetros do Algoritmo e do Problema ---
 
@@ -15,6 +17,10 @@ num_generations = 50        # Quantas "gerações" ou iterações o algoritmo ir
 sol_per_pop = 80            # Quantas soluções (rotas) existirão em cada geração
 num_parents_mating = 20      # Quantas das melhores soluções de uma geração serão selecionadas como "pais"
 mutation_percent_genes = 5   # A chance (em %) de um gene sofrer uma mutação aleatória
+usar_busca_local = True      # Estágio memético: 2-opt + Or-opt nos melhores indivíduos válidos
+parada = None                # Parada antecipada: None = sempre roda num_generations gerações
+# parada = CriterioParada(paciencia=15)  # Ex.: encerra após 15 gerações sem melhora (ver utils_ag.py)
+relatorio = RelatorioProgresso(intervalo=5)  # Imprime melhor/média/desvio do fitness a cada 5 gerações
 
 # Coordenadas das Cidades (baseado no Exemplo 6.4 do livro de Belfiore e Fávero)
 city_coordinates = {1: (10, 30), 2: (20, 50), 3: (50, 90), 4: (70, 30), 5: (90, 50)}
@@ -28,14 +34,14 @@ num_cities = len(coords_list)
 # Mapeamos cada posição (gene) a uma rota específica. Ex: gene 0 = rota da cidade 1 para 2.
 gene_to_arc = [(i, j) for i in range(num_cities) for j in range(num_cities) if i != j]
 num_genes = len(gene_to_arc) # Total de 20 genes para 5 cidades
+# Obs.: o número de genes cresce com o quadrado do número de cidades e quase toda
+# a população é inviável; para instâncias maiores use a codificação por
+# permutação em "4_Caixeiro Viajante_AG_permutacao.py".
 
 # Para otimizar, pré-calculamos a distância entre todas as cidades e guardamos em uma matriz.
-distance_matrix = np.zeros((num_cities, num_cities))
-for i in range(num_cities):
-    for j in range(num_cities):
-        dist = math.sqrt((coords_list[i][0] - coords_list[j][0])**2 + 
-                         (coords_list[i][1] - coords_list[j][1])**2)
-        distance_matrix[i, j] = dist
+# A matriz é montada de forma vetorizada (broadcasting) em utils_tsp.py;
+# para milhares de cidades veja as opções dtype e arquivo.
+distance_matrix = matriz_distancias(coords_list)
 
 #%% --- 3. Função de Aptidão (Fitness Function) ---
 
@@ -69,39 +75,68 @@ def fitness_func(ga_instance, solution, solution_idx):
         # Penalidade se o número de rotas ativas for diferente do número de cidades.
         penalty += 10000
     elif active_arcs:
-        # Usamos uma busca em grafo para ver se todas as cidades estão conectadas.
-        visited, queue = set(), [active_arcs[0][0]]
-        adj_list = {i: [] for i in range(num_cities)}
-        for start, end in active_arcs: adj_list[start].append(end)
-        
-        while queue:
-            node = queue.pop(0)
-            if node not in visited:
-                visited.add(node)
-                if node in adj_list: queue.extend(adj_list[node])
-        # Se a busca não conseguiu visitar todas as cidades, é porque há sub-rotas.
-        if len(visited) != num_cities:
-            penalty += 10000
+        # Guardamos as rotas em um vetor de sucessores (sucessor[i] = próxima cidade
+        # depois de i) e contamos as sub-rotas seguindo os ponteiros, em O(n).
+        sucessor = np.full(num_cities, -1)
+        for start, end in active_arcs: sucessor[start] = end
+        # Uma rota válida tem 1 sub-rota; cada sub-rota a mais recebe uma penalidade,
+        # então soluções "quase" válidas são menos penalizadas.
+        num_subrotas = contar_subrotas(sucessor)
+        penalty += (num_subrotas - 1) * 10000
 
     total_cost = total_distance + penalty
     # Retorna o inverso do custo. Se o custo for 0, retorna um valor negativo.
     return 1.0 / total_cost if total_cost != 0 else -1
 
-#%% --- 4. Callback para Imprimir o Fitness de Cada Geração ---
+#%% --- 4. Busca Local (Estágio Memético) ---
+
+# A busca local trabalha com rotas (permutações). Estas funções convertem um
+# cromossomo binário de arcos em rota (apenas se ele já for uma rota válida)
+# e uma rota de volta para os genes binários.
+arc_to_gene = {arc: i for i, arc in enumerate(gene_to_arc)}
+vizinhos = vizinhos_mais_proximos(distance_matrix, k=10)
+
+def solution_to_route(solution):
+    active_arcs = [gene_to_arc[i] for i, gene in enumerate(solution) if gene == 1]
+    if len(active_arcs) != num_cities:
+        return None
+    sucessor = np.full(num_cities, -1)
+    for start, end in active_arcs: sucessor[start] = end
+    return rota_de_sucessores(sucessor)
+
+def route_to_solution(rota):
+    solution = np.zeros(num_genes, dtype=int)
+    for start, end in enumerate(sucessores_de_rota(rota)):
+        solution[arc_to_gene[(start, end)]] = 1
+    return solution
+
+#%% --- 5. Callback para Imprimir o Fitness de Cada Geração ---
 def on_generation(ga_instance):
     """
     Esta função é executada ao final de cada geração para mostrar o progresso.
+    Com a busca local ativada, também melhora os 2 melhores indivíduos válidos.
+    O relatório usa o fitness já calculado (last_generation_fitness): chamar
+    ga_instance.best_solution() sem pop_fitness reavaliaria a população inteira.
     """
-    print(f"Geração: {ga_instance.generations_completed:3} | Fitness: {ga_instance.best_solution()[1]:.4f}")
+    if usar_busca_local:
+        estagio_memetico(ga_instance, distance_matrix, vizinhos, num_elites=2,
+                         decodificar=solution_to_route, codificar=route_to_solution)
+    relatorio.on_generation(ga_instance)
+    if parada is not None:
+        return parada.on_generation(ga_instance)   # "stop" encerra a execução
+
+#%% --- 6. Configuração e Execução do Algoritmo Genético ---
 
-#%% --- 5. Configuração e Execução do Algoritmo Genético ---
+# Envolve a função de fitness com um cache: rotas (cromossomos) idênticas que
+# reaparecem na população não são reavaliadas.
+fitness_cache = CacheFitness(fitness_func, tamanho=10000)
 
 # Inicializa a instância do algoritmo genético com os parâmetros definidos.
 ga_instance = pygad.GA(
     num_generations=num_generations,
     sol_per_pop=sol_per_pop,
     num_parents_mating=num_parents_mating,
-    fitness_func=fitness_func,
+    fitness_func=fitness_cache,
     num_genes=num_genes,
     gene_type=int,
     gene_space=[0, 1], # Cada gene só pode ser 0 ou 1
@@ -109,15 +144,19 @@ ga_instance = pygad.GA(
     crossover_type="single_point",
     mutation_type="random",
     mutation_percent_genes=mutation_percent_genes,
-    on_generation=on_generation # Define a função a ser chamada a cada geração
+    on_start=parada.on_start if parada is not None else None,   # Zera o critério de parada no início da execução
+    on_generation=on_generation, # Define a função a ser chamada a cada geração
+    on_stop=relatorio.on_stop   # Registra a última geração no relatório
 )
 
 print("Executando o Algoritmo Genético...")
 # Este comando inicia o processo de evolução.
 ga_instance.run()
-print("Execução finalizada.")
+print(f"Execução finalizada após {ga_instance.generations_completed} gerações ({(parada.motivo if parada is not None else None) or 'limite de gerações'}).")
+print(f"Cache de fitness: {fitness_cache.acertos} acertos, {fitness_cache.falhas} falhas "
+      f"({fitness_cache.taxa_acertos:.1%} de avaliações economizadas)")
 
-#%% --- 6. Análise e Visualização do Resultado Final ---
+#%% --- 7. Análise e Visualização do Resultado Final ---
 
 # Pega a melhor solução encontrada após todas as gerações.
 solution, solution_fitness, _ = ga_instance.best_solution()
@@ -0,0 +1,114 @@
+#%% Testes dos utilitários de AG (pytest test_utils_ag.py)
+
+import numpy as np
+import pygad
+import pytest
+
+from utils_ag import CacheFitness, algoritmo_genetico_numpy, selecao_torneio_numpy
+
+#%%=============================================================================
+# SELEÇÃO POR TORNEIO
+# =============================================================================
+
+def test_torneio_sem_reposicao_k_grande():
+    # k ≈ n/4: quase todo torneio sorteado com reposição teria repetição.
+    # Fitness com valores distintos: o vencedor de k competidores distintos
+    # está entre os n - k + 1 melhores, e ao menos k - 1 indivíduos são piores
+    rng = np.random.default_rng(0)
+    n, k, n_pais = 1000, 250, 500
+    fitness_values = rng.permutation(n).astype(float)
+    pais = selecao_torneio_numpy(fitness_values, n_pais, np.random.default_rng(1), k=k, reposicao=False)
+    assert pais.shape == (n_pais,)
+    assert pais.min() >= 0 and pais.max() < n
+    assert fitness_values[pais].min() >= k - 1
+    # Com reposição o mínimo possível seria 0; sem reposição o vencedor típico é o
+    # máximo de k valores distintos, perto de n * k / (k + 1)
+    assert np.median(fitness_values[pais]) > n * (1 - 2 / k)
+
+def test_torneio_k_igual_a_n_devolve_o_melhor():
+    rng = np.random.default_rng(0)
+    fitness_values = rng.random(50)
+    pais = selecao_torneio_numpy(fitness_values, 200, rng, k=50, reposicao=False)
+    assert np.all(pais == np.argmax(fitness_values))
+
+    # k = n - 1 competidores distintos deixam de fora um único indivíduo: o
+    # vencedor é sempre um dos 2 melhores (com reposição, ~13% dos torneios não
+    # sorteariam nenhum dos dois)
+    dois_melhores = np.argsort(fitness_values)[-2:]
+    pais = selecao_torneio_numpy(fitness_values, 200, rng, k=49, reposicao=False)
+    assert np.isin(pais, dois_melhores).all()
+
+def test_torneio_sem_reposicao_k_pequeno():
+    rng = np.random.default_rng(0)
+    fitness_values = rng.random(1000)
+    pais = selecao_torneio_numpy(fitness_values, 2000, rng, k=5, reposicao=False)
+    assert pais.min() >= 0 and pais.max() < 1000
+    # O vencedor de 5 competidores tende a estar acima da mediana
+    assert np.median(fitness_values[pais]) > np.median(fitness_values)
+
+#%%=============================================================================
+# CACHE DE FITNESS
+# =============================================================================
+
+def test_cache_cromossomo_objeto():
+    # gene_type misto no PyGAD gera arrays de objetos: chave pelos valores
+    cache = CacheFitness(lambda individuo: sum(individuo))
+    a = np.array([1, 2.5, 3], dtype=object)
+    b = np.array([1, 2.5, 3], dtype=object)
+    assert cache(a) == cache(b) == 6.5
+    assert (cache.acertos, cache.falhas) == (1, 1)
+
+def test_cache_distingue_tipo_e_forma():
+    cache = CacheFitness(lambda individuo: np.asarray(individuo).size)
+    cache(np.zeros(8, dtype=np.uint8))
+    cache(np.zeros(1, dtype=np.int64))       # Mesmos 8 bytes, outro tipo
+    cache(np.zeros((2, 4), dtype=np.uint8))  # Mesmos bytes, outra forma
+    assert (cache.acertos, cache.falhas) == (0, 3)
+
+def test_cache_em_lote_no_pygad():
+    # fitness_batch_size: o cache separa o lote e só avalia as linhas novas
+    pesos = np.arange(1, 7)
+    linhas_avaliadas = []
+
+    def fitness_lote(ga_instance, solutions, solutions_idx):
+        linhas_avaliadas.append(len(solutions))
+        return np.asarray(solutions) @ pesos
+
+    def executar(fitness_func):
+        ga_instance = pygad.GA(num_generations=15, sol_per_pop=20, num_parents_mating=10,
+                               num_genes=6, gene_type=int, gene_space=[0, 1], keep_elitism=2,
+                               fitness_func=fitness_func, fitness_batch_size=8,
+                               random_seed=3, suppress_warnings=True)
+        ga_instance.run()
+        return ga_instance
+
+    sem_cache = executar(fitness_lote)
+    linhas_avaliadas.clear()
+    cache = CacheFitness(fitness_lote, lote=True)
+    com_cache = executar(cache)
+
+    # Mesma evolução, com menos linhas avaliadas pela função original
+    assert np.array_equal(sem_cache.best_solutions_fitness, com_cache.best_solutions_fitness)
+    assert cache.acertos > 0
+    assert sum(linhas_avaliadas) == cache.falhas <= 2 ** 6
+    assert cache.avaliar(com_cache.population).tolist() == (com_cache.population @ pesos).tolist()
+
+#%%=============================================================================
+# AG NUMPY: VALIDAÇÃO E CHECKPOINT
+# =============================================================================
+
+def test_ag_numpy_rejeita_um_gene():
+    with pytest.raises(ValueError, match="n_genes"):
+        algoritmo_genetico_numpy(lambda pop: pop.sum(axis=1), n_genes=1)
+
+def test_checkpoint_de_outro_problema_e_recusado(tmp_path):
+    arquivo = str(tmp_path / "ag.npz")
+    contar_uns = lambda pop: pop.sum(axis=1)
+    algoritmo_genetico_numpy(contar_uns, n_genes=12, geracoes=10, seed=0,
+                             checkpoint=arquivo, intervalo_checkpoint=5)
+    for n_genes, compactado in [(13, False), (12, True)]:
+        with pytest.raises(ValueError, match="checkpoint"):
+            algoritmo_genetico_numpy(contar_uns, n_genes=n_genes, geracoes=20, seed=0,
+                                     compactado=compactado, checkpoint=arquivo)
+    # Mesmo problema: retoma normalmente
+    algoritmo_genetico_numpy(contar_uns, n_genes=12, geracoes=20, seed=0, checkpoint=arquivo)
@@ -0,0 +1,832 @@
+#%% Utilitários para Algoritmos Genéticos com NumPy
+# Funções compartilhadas pelos scripts de AG (mochila, caixeiro viajante etc.)
+# Uso nos scripts: from utils_ag import algoritmo_genetico_numpy
+
+import json
+import multiprocessing as mp
+import os
+import sys
+import time
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+#%%=============================================================================
+# MOTOR VETORIZADO PARA AG BINÁRIO
+# =============================================================================
+# A população inteira fica em um único array (tam_pop x n_genes) do tipo uint8
+# e seleção, cruzamento e mutação são feitos para a geração toda de uma vez,
+# sem laços em Python por indivíduo ou por gene.
+
+def criar_populacao_numpy(tam_pop, n_genes, rng):
+    """Cria uma população binária aleatória (tam_pop x n_genes) do tipo uint8"""
+    return rng.integers(0, 2, size=(tam_pop, n_genes), dtype=np.uint8)
+
+def selecao_torneio_numpy(fitness_values, n_pais, rng, k=3, reposicao=True):
+    """
+    Seleção por torneio para vários pais de uma vez.
+    Sorteia uma matriz (n_pais x k) de índices de competidores, junta o fitness
+    de todos em uma matriz de mesma forma e o vencedor de cada linha (torneio)
+    é o de maior fitness (argmax por linha). A população não é copiada.
+
+    Args:
+        k: número de competidores por torneio
+        reposicao: se False, os k competidores de um mesmo torneio são distintos
+
+    Returns:
+        array com os índices dos pais selecionados
+    """
+    fitness_values = np.asarray(fitness_values)
+    n = len(fitness_values)
+    if reposicao:
+        competidores = rng.integers(0, n, size=(n_pais, k))
+    elif k > n:
+        raise ValueError(f"Torneio sem reposição exige k <= tamanho da população ({k} > {n})")
+    elif k * k > n:
+        # Repetição provável (~k²/2n por torneio): k primeiros índices de uma
+        # permutação aleatória por linha, sem nenhum novo sorteio
+        competidores = np.argpartition(rng.random((n_pais, n)), k - 1, axis=1)[:, :k]
+    else:
+        # k <= sqrt(n): sorteia com reposição e refaz só as linhas com competidor
+        # repetido (no máximo ~metade das linhas a cada rodada)
+        competidores = rng.integers(0, n, size=(n_pais, k))
+        while True:
+            ordenados = np.sort(competidores, axis=1)
+            repetidos = (ordenados[:, 1:] == ordenados[:, :-1]).any(axis=1)
+            if not repetidos.any():
+                break
+            competidores[repetidos] = rng.integers(0, n, size=(repetidos.sum(), k))
+    vencedores = np.argmax(fitness_values[competidores], axis=1)
+    return competidores[np.arange(n_pais), vencedores]
+
+def selecao_roleta_numpy(fitness_values, n_pais, rng):
+    """
+    Seleção por roleta para vários pais de uma vez, em O(log n) por sorteio.
+    A roleta acumulada (cumsum) é montada uma vez por geração e todos os
+    sorteios são localizados nela com uma única busca binária (searchsorted).
+    Se todos os fitness forem zero, a escolha é uniforme.
+
+    Returns:
+        array com os índices dos pais selecionados
+    """
+    acumulado = np.cumsum(fitness_values, dtype=float)
+    total_fitness = acumulado[-1]
+    if total_fitness == 0:
+        return rng.integers(0, len(fitness_values), size=n_pais)
+    pontos = rng.random(n_pais) * total_fitness
+    return np.minimum(np.searchsorted(acumulado, pontos, side='right'), len(acumulado) - 1)
+
+def tabela_alias(pesos):
+    """
+    Monta a tabela do método de alias (Walker/Vose) em O(n).
+    Cada uma das n colunas guarda uma probabilidade de ficar com o próprio
+    índice e um "alias" para o qual o sorteio é desviado caso contrário.
+
+    Returns:
+        tuple: (probabilidade, alias), arrays de tamanho n
+    """
+    pesos = np.asarray(pesos, dtype=float)
+    n = len(pesos)
+    escalados = pesos * n / pesos.sum()
+    probabilidade = np.ones(n)
+    alias = np.arange(n)
+    pequenos = [i for i in range(n) if escalados[i] < 1.0]
+    grandes = [i for i in range(n) if escalados[i] >= 1.0]
+    while pequenos and grandes:
+        p, g = pequenos.pop(), grandes.pop()
+        probabilidade[p] = escalados[p]
+        alias[p] = g
+        escalados[g] -= 1.0 - escalados[p]
+        (pequenos if escalados[g] < 1.0 else grandes).append(g)
+    return probabilidade, alias
+
+def sortear_alias(probabilidade, alias, n_sorteios, rng):
+    """Sorteios em O(1) cada a partir da tabela de alias"""
+    colunas = rng.integers(0, len(probabilidade), size=n_sorteios)
+    return np.where(rng.random(n_sorteios) < probabilidade[colunas], colunas, alias[colunas])
+
+def selecao_roleta_alias(fitness_values, n_pais, rng):
+    """
+    Seleção por roleta pelo método de alias: O(n) para montar a tabela e O(1)
+    por pai. Vantajosa quando muitos pais são sorteados da mesma população.
+    """
+    if np.sum(fitness_values) == 0:
+        return rng.integers(0, len(fitness_values), size=n_pais)
+    return sortear_alias(*tabela_alias(fitness_values), n_pais, rng)
+
+def cruzamento_um_ponto_numpy(pais1, pais2, rng):
+    """
+    Cruzamento de um ponto para todos os casais de uma vez.
+    Cada linha recebe um ponto de corte e uma máscara booleana decide
+    quais genes vêm do pai 1 (antes do corte) e quais do pai 2.
+    """
+    n_filhos, n_genes = pais1.shape
+    pontos = rng.integers(1, n_genes, size=n_filhos)
+    mascara = np.arange(n_genes) < pontos[:, None]
+    return np.where(mascara, pais1, pais2)
+
+def mutacao_numpy(populacao, rng, taxa=0.1):
+    """Mutação bit-flip: cada gene é invertido com probabilidade 'taxa'"""
+    return populacao ^ (rng.random(populacao.shape) < taxa).astype(np.uint8)
+
+def _validar_checkpoint(estado, arquivo, tam_pop, n_genes, compactado):
+    # Recusa retomar um checkpoint de outro problema (tamanho, genes ou codificação)
+    populacao = estado['populacao']
+    colunas = -(-n_genes // BITS_PALAVRA) if compactado else n_genes
+    esperado = f"tam_pop={tam_pop}, n_genes={n_genes}, compactado={compactado}"
+    if 'n_genes' in estado and int(estado['n_genes']) != n_genes:
+        raise ValueError(f"checkpoint {arquivo} com n_genes={int(estado['n_genes'])}, esperado {esperado}")
+    if 'compactado' in estado and bool(estado['compactado']) != compactado:
+        raise ValueError(f"checkpoint {arquivo} com compactado={bool(estado['compactado'])}, esperado {esperado}")
+    if populacao.shape != (tam_pop, colunas) or (populacao.dtype == np.uint64) != compactado:
+        raise ValueError(f"checkpoint {arquivo} com população {populacao.shape} do tipo {populacao.dtype}, "
+                         f"esperado {esperado}")
+
+def algoritmo_genetico_numpy(fitness_lote, n_genes, tam_pop=10, geracoes=50, taxa_mut=0.1,
+                             selecao=selecao_torneio_numpy, seed=None, compactado=False,
+                             reparo=None, parada=None, relatorio=None, checkpoint=None,
+                             intervalo_checkpoint=10):
+    """
+    AG binário com a população guardada em um array NumPy.
+
+    Args:
+        fitness_lote: função que recebe a população (tam_pop x n_genes) e
+                      retorna um array com o fitness de cada indivíduo
+        n_genes: número de genes por cromossomo
+        tam_pop, geracoes, taxa_mut: mesmos parâmetros do AG manual
+        selecao: função (fitness_values, n_pais, rng) -> índices dos pais
+        seed: semente do numpy.random.Generator (reprodutibilidade)
+        compactado: se True, a população fica compactada em bits (64 genes por
+                    palavra uint64) e fitness_lote recebe a população compactada
+        reparo: função população -> população aplicada antes de cada avaliação;
+                os genes reparados ficam na população (lamarckiano). Para o
+                reparo baldwiniano, repare dentro de fitness_lote
+        parada: CriterioParada opcional; o laço termina antes de 'geracoes' se
+                ele indicar parada (a diversidade é medida na população descompactada)
+        relatorio: RelatorioProgresso opcional, chamado a cada geração
+        checkpoint: arquivo .npz opcional; a cada 'intervalo_checkpoint' gerações
+                    o estado completo é salvo nele (ver salvar_checkpoint). Se o
+                    arquivo já existir, a execução continua de onde parou, com o
+                    mesmo resultado de uma execução sem interrupção
+        intervalo_checkpoint: gerações entre dois checkpoints
+
+    Returns:
+        tuple: (melhor_individuo, melhor_fitness, historico)
+    """
+    if n_genes < 2:
+        raise ValueError(f"n_genes deve ser pelo menos 2 para o cruzamento de um ponto (recebido {n_genes})")
+    rng = np.random.default_rng(seed)
+    if compactado:
+        populacao = compactar(criar_populacao_numpy(tam_pop, n_genes, rng))
+        cruzamento = lambda p1, p2, rng: cruzamento_um_ponto_compactado(p1, p2, n_genes, rng)
+        mutacao = lambda pop, rng, taxa: mutacao_compactada(pop, n_genes, rng, taxa)
+    else:
+        populacao = criar_populacao_numpy(tam_pop, n_genes, rng)
+        cruzamento, mutacao = cruzamento_um_ponto_numpy, mutacao_numpy
+    historico = []
+    fitness_values = None   # Só vem preenchido ao retomar (população já avaliada)
+    inicio = 0
+
+    if checkpoint is not None and os.path.exists(checkpoint):
+        estado = carregar_checkpoint(checkpoint)
+        _validar_checkpoint(estado, checkpoint, tam_pop, n_genes, compactado)
+        populacao, fitness_values, rng = estado['populacao'], estado['fitness'], estado['rng']
+        historico = list(estado['historico'])
+        inicio = estado['geracao'] - 1   # A última geração salva já foi avaliada
+        if parada is not None and 'parada' in estado:
+            melhor, sem_melhora, contadas = estado['parada']
+            parada.melhor, parada.sem_melhora, parada.geracoes = melhor, int(sem_melhora), int(contadas)
+
+    for geracao in range(inicio, geracoes):
+        if fitness_values is None:
+            if reparo is not None:
+                populacao = reparo(populacao)
+            fitness_values = np.asarray(fitness_lote(populacao))
+            historico.append(fitness_values[np.argmax(fitness_values)])
+            if relatorio is not None:
+                relatorio.registrar(geracao + 1, fitness_values)
+            if parada is not None and parada.verificar(
+                    fitness_values, descompactar(populacao, n_genes) if compactado else populacao):
+                break
+            if checkpoint is not None and (geracao + 1) % intervalo_checkpoint == 0:
+                extras = {'n_genes': n_genes, 'compactado': compactado}
+                if parada is not None:
+                    extras['parada'] = np.array([parada.melhor, parada.sem_melhora, parada.geracoes], dtype=float)
+                salvar_checkpoint(checkpoint, populacao, fitness_values, geracao + 1, rng, historico, **extras)
+        melhor_idx = np.argmax(fitness_values)
+
+        # Elitismo: o melhor passa direto; o resto da população são filhos
+        n_filhos = tam_pop - 1
+        pais1 = populacao[selecao(fitness_values, n_filhos, rng)]
+        pais2 = populacao[selecao(fitness_values, n_filhos, rng)]
+        filhos = cruzamento(pais1, pais2, rng)
+        filhos = mutacao(filhos, rng, taxa_mut)
+
+        populacao = np.vstack([populacao[melhor_idx], filhos])
+        fitness_values = None
+
+    if reparo is not None:
+        populacao = reparo(populacao)
+    fitness_values = np.asarray(fitness_lote(populacao))
+    melhor_idx = np.argmax(fitness_values)
+    melhor = populacao[melhor_idx]
+    if compactado:
+        melhor = descompactar(melhor[None], n_genes)[0]
+    return melhor, fitness_values[melhor_idx], historico
+
+#%%=============================================================================
+# CROMOSSOMOS COMPACTADOS EM BITS (64 GENES POR PALAVRA)
+# =============================================================================
+# Em vez de 1 byte (uint8) ou 8 bytes (int64) por gene, cada gene binário ocupa
+# 1 bit: o gene g fica no bit g % 64 da palavra g // 64 (array uint64).
+# Cruzamento e mutação viram operações de máscara sobre palavras inteiras e a
+# soma ponderada (peso, pontos) é feita com contagem de bits (popcount).
+
+BITS_PALAVRA = 64
+
+def compactar(populacao):
+    """Converte população binária (n x n_genes) em palavras uint64 (n x ceil(n_genes/64))"""
+    populacao = np.asarray(populacao, dtype=np.uint8)
+    n, n_genes = populacao.shape
+    n_palavras = -(-n_genes // BITS_PALAVRA)
+    bytes_ = np.packbits(populacao, axis=1, bitorder='little')
+    completo = np.zeros((n, n_palavras * 8), dtype=np.uint8)
+    completo[:, :bytes_.shape[1]] = bytes_
+    return completo.view('<u8')
+
+def descompactar(compactada, n_genes):
+    """Converte palavras uint64 de volta para a população binária (n x n_genes) uint8"""
+    bytes_ = np.ascontiguousarray(compactada, dtype='<u8').view(np.uint8)
+    return np.unpackbits(bytes_, axis=1, count=n_genes, bitorder='little')
+
+if hasattr(np, 'bitwise_count'):
+    popcount = np.bitwise_count
+else:
+    # NumPy < 2.0: contagem de bits por tabela de consulta de 1 byte
+    _BITS_POR_BYTE = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+    def popcount(palavras):
+        palavras = np.ascontiguousarray(palavras, dtype='<u8')
+        return _BITS_POR_BYTE[palavras.view(np.uint8)].reshape(palavras.shape + (8,)).sum(axis=-1)
+
+def planos_de_bits(valores):
+    """
+    Decompõe valores inteiros não negativos (um por gene) em planos de bits.
+    O plano b é a máscara compactada dos genes cujo valor tem o bit b ligado,
+    de modo que sum(valores[genes ligados]) = sum_b 2^b * popcount(X & plano_b).
+
+    Returns:
+        array uint64 (n_bits x n_palavras)
+    """
+    valores = np.asarray(valores, dtype=np.int64)
+    if (valores < 0).any():
+        raise ValueError("planos_de_bits exige valores inteiros não negativos")
+    n_bits = max(int(valores.max()).bit_length(), 1)
+    bits = (valores[None, :] >> np.arange(n_bits)[:, None]) & 1
+    return compactar(bits)
+
+def soma_ponderada_compactada(compactada, planos):
+    """Soma dos valores dos genes ligados de cada indivíduo compactado, via popcount"""
+    contagens = popcount(compactada[:, None, :] & planos[None, :, :]).sum(axis=2)
+    return contagens.astype(np.int64) @ (1 << np.arange(len(planos), dtype=np.int64))
+
+def cruzamento_um_ponto_compactado(pais1, pais2, n_genes, rng):
+    """
+    Cruzamento de um ponto sobre palavras: genes antes do corte vêm do pai 1
+    e os demais do pai 2 (mesmo resultado da versão não compactada).
+    """
+    n_filhos, n_palavras = pais1.shape
+    pontos = rng.integers(1, n_genes, size=n_filhos)
+    palavra_corte = (pontos // BITS_PALAVRA)[:, None]
+    bit_corte = (pontos % BITS_PALAVRA).astype(np.uint64)
+    indices = np.arange(n_palavras)[None, :]
+    mascara_parcial = (np.uint64(1) << bit_corte) - np.uint64(1)
+    mascara = np.where(indices < palavra_corte, ~np.uint64(0), np.uint64(0))
+    mascara = np.where(indices == palavra_corte, mascara_parcial[:, None], mascara)
+    return (pais1 & mascara) | (pais2 & ~mascara)
+
+LOTE_MUTACOES = 1 << 14   # Posições sorteadas por vez na mutação compactada
+
+def mutacao_compactada(compactada, n_genes, rng, taxa=0.1):
+    """
+    Mutação bit-flip compactada: as posições que vão mutar são sorteadas como
+    saltos geométricos (distância até a próxima mutação), em lotes de
+    LOTE_MUTACOES, e os bits de uma mesma palavra são invertidos com um XOR.
+    A memória extra não depende do tamanho da população.
+    """
+    n, n_palavras = compactada.shape
+    total_genes = n * n_genes
+    mutada = compactada.copy()
+    if taxa <= 0:
+        return mutada
+    planas = mutada.reshape(-1)
+    posicao = -1
+    while True:
+        posicoes = posicao + np.cumsum(rng.geometric(taxa, size=LOTE_MUTACOES))
+        posicoes = posicoes[posicoes < total_genes]
+        if len(posicoes) > 0:
+            individuo, gene = np.divmod(posicoes, n_genes)
+            palavras = individuo * n_palavras + gene // BITS_PALAVRA
+            bits = np.uint64(1) << (gene % BITS_PALAVRA).astype(np.uint64)
+            # Posições crescentes: as palavras repetidas ficam juntas
+            palavras, inicio = np.unique(palavras, return_index=True)
+            planas[palavras] ^= np.bitwise_or.reduceat(bits, inicio)
+        if len(posicoes) < LOTE_MUTACOES:
+            return mutada
+        posicao = posicoes[-1]
+
+#%%=============================================================================
+# AVALIAÇÃO PARALELA DO FITNESS (PROCESSOS + MEMÓRIA COMPARTILHADA)
+# =============================================================================
+# Para funções de fitness caras (simulações), a população é copiada uma única
+# vez para um bloco de memória compartilhada e cada processo avalia uma fatia
+# de linhas lendo direto desse bloco, sem serializar indivíduo por indivíduo.
+# Os dados do problema (tabela de itens, matriz de distâncias...) são enviados
+# uma única vez para cada processo, na inicialização do pool.
+#
+# Observação: no Windows os processos são criados com "spawn", então a função
+# de fitness deve ser importável (definida em um módulo, como utils_mochila.py)
+# e o script deve usar o avaliador dentro de if __name__ == "__main__":
+
+_FUNCAO_TRABALHADOR = None
+_DADOS_TRABALHADOR = None
+
+def _inicializar_trabalhador(funcao, dados):
+    global _FUNCAO_TRABALHADOR, _DADOS_TRABALHADOR
+    _FUNCAO_TRABALHADOR = funcao
+    _DADOS_TRABALHADOR = dados
+
+def _avaliar_fatia(nome_memoria, forma, tipo, inicio, fim):
+    memoria = shared_memory.SharedMemory(name=nome_memoria)
+    try:
+        populacao = np.ndarray(forma, dtype=tipo, buffer=memoria.buf)
+        if _DADOS_TRABALHADOR is None:
+            resultado = [_FUNCAO_TRABALHADOR(ind) for ind in populacao[inicio:fim]]
+        else:
+            resultado = [_FUNCAO_TRABALHADOR(ind, **_DADOS_TRABALHADOR) for ind in populacao[inicio:fim]]
+        del populacao
+        return np.asarray(resultado, dtype=float)
+    finally:
+        memoria.close()
+
+class AvaliadorParalelo:
+    """
+    Avalia o fitness de uma população em um pool de processos.
+
+    Args:
+        funcao: fitness de UM indivíduo, chamada como funcao(individuo) ou
+                funcao(individuo, **dados); deve ser importável pelos processos
+        n_processos: número de processos (None = todos os núcleos)
+        dados: dicionário com os dados do problema, enviado uma vez por processo
+        fatias_por_processo: em quantas fatias dividir a população por processo
+
+    Uso:
+        with AvaliadorParalelo(avaliar_mochila, dados=dados) as avaliador:
+            fitness_values = avaliador.avaliar(populacao)          # AG manual
+            pygad.GA(..., fitness_func=avaliador.fitness_pygad,    # PyGAD
+                     fitness_batch_size=sol_per_pop)
+    """
+
+    def __init__(self, funcao, n_processos=None, dados=None, fatias_por_processo=4):
+        self.funcao = funcao
+        self.n_processos = n_processos or mp.cpu_count()
+        self.dados = dados
+        self.fatias_por_processo = fatias_por_processo
+        self._pool = None
+        self._memoria = None
+
+    def __enter__(self):
+        # Inicia o rastreador de recursos antes do pool para que os processos o
+        # compartilhem: assim o bloco só é removido quando o avaliador o libera
+        if hasattr(resource_tracker, 'ensure_running'):
+            resource_tracker.ensure_running()
+        self._pool = mp.Pool(self.n_processos, initializer=_inicializar_trabalhador,
+                             initargs=(self.funcao, self.dados))
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        self._liberar_memoria()
+
+    def _liberar_memoria(self):
+        if self._memoria is not None:
+            self._memoria.close()
+            self._memoria.unlink()
+            self._memoria = None
+
+    def avaliar(self, populacao):
+        """Retorna um array com o fitness de cada linha da população"""
+        if self._pool is None:
+            self.__enter__()
+        populacao = np.ascontiguousarray(populacao)
+        if len(populacao) == 0:
+            return np.zeros(0)
+
+        # Reaproveita o bloco de memória entre gerações se ele couber a população
+        if self._memoria is None or self._memoria.size < populacao.nbytes:
+            self._liberar_memoria()
+            self._memoria = shared_memory.SharedMemory(create=True, size=max(populacao.nbytes, 1))
+        np.ndarray(populacao.shape, dtype=populacao.dtype, buffer=self._memoria.buf)[:] = populacao
+
+        n_fatias = min(len(populacao), self.n_processos * self.fatias_por_processo)
+        limites = np.linspace(0, len(populacao), n_fatias + 1).astype(int)
+        tarefas = [(self._memoria.name, populacao.shape, populacao.dtype.str, int(inicio), int(fim))
+                   for inicio, fim in zip(limites[:-1], limites[1:])]
+        return np.concatenate(self._pool.starmap(_avaliar_fatia, tarefas))
+
+    def fitness_pygad(self, ga_instance, solutions, solutions_idx):
+        """Assinatura de fitness em lote do PyGAD (usar com fitness_batch_size)"""
+        return self.avaliar(solutions)
+
+#%%=============================================================================
+# CACHE DE FITNESS (LRU) INDEXADO PELOS BYTES DO CROMOSSOMO
+# =============================================================================
+# Quando a população converge (elitismo, cópias do melhor indivíduo), o mesmo
+# cromossomo é avaliado muitas vezes. O cache guarda o fitness pelos bytes do
+# cromossomo e descarta o menos usado recentemente quando enche.
+
+class CacheFitness:
+    """
+    Envolve uma função de fitness com um cache LRU de tamanho limitado.
+
+    Aceita as duas assinaturas usadas no projeto:
+        fitness(individuo)                              -> AG manual
+        fitness_func(ga_instance, solution, solution_idx) -> PyGAD
+
+    Com lote=True a função original avalia um lote de cromossomos (fitness em
+    lote do AG manual ou fitness_batch_size do PyGAD): o lote é separado em
+    linhas, cada linha é procurada no cache e só as linhas que faltam são
+    passadas à função original, em uma única chamada.
+
+    Args:
+        funcao: função de fitness original
+        tamanho: número máximo de cromossomos guardados
+        lote: True se funcao recebe e devolve um lote (uma linha por cromossomo)
+
+    Uso:
+        fitness_cache = CacheFitness(fitness_mochila, tamanho=10000)
+        pygad.GA(..., fitness_func=fitness_cache)
+        fitness_cache_lote = CacheFitness(fitness_mochila_lote, lote=True)
+        pygad.GA(..., fitness_func=fitness_cache_lote, fitness_batch_size=30)
+        print(fitness_cache.acertos, fitness_cache.falhas, fitness_cache.taxa_acertos)
+    """
+
+    def __init__(self, funcao, tamanho=10000, lote=False):
+        self.funcao = funcao
+        self.tamanho = tamanho
+        self.lote = lote
+        self.acertos = 0
+        self.falhas = 0
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def chave(cromossomo):
+        """
+        Chave do cache: tipo, forma e bytes do cromossomo. Arrays de objetos
+        (gene_type misto no PyGAD) guardam ponteiros, então viram tupla de valores.
+        """
+        arr = np.asarray(cromossomo)
+        if arr.dtype == object:
+            return (arr.dtype.str, arr.shape, tuple(arr.tolist()))
+        return (arr.dtype.str, arr.shape, arr.tobytes())
+
+    def _guardar(self, chave, valor):
+        self._cache[chave] = valor
+        if len(self._cache) > self.tamanho:
+            self._cache.popitem(last=False)
+
+    def __call__(self, *args):
+        if self.lote:
+            return self._avaliar_lote(*args)
+        cromossomo = args[1] if len(args) == 3 else args[0]
+        chave = self.chave(cromossomo)
+        if chave in self._cache:
+            self.acertos += 1
+            self._cache.move_to_end(chave)
+            return self._cache[chave]
+
+        self.falhas += 1
+        valor = self.funcao(*args)
+        self._guardar(chave, valor)
+        return valor
+
+    def _avaliar_lote(self, *args):
+        # Separa o lote em linhas: acertos saem do cache, as que faltam (sem
+        # repetição) vão juntas para a função original
+        pygad_args = len(args) == 3
+        lote = np.asarray(args[1] if pygad_args else args[0])
+        chaves = [self.chave(linha) for linha in lote]
+        valores = [None] * len(chaves)
+        faltando = {}
+        for i, chave in enumerate(chaves):
+            if chave in self._cache:
+                self._cache.move_to_end(chave)
+                valores[i] = self._cache[chave]
+            elif chave not in faltando:
+                faltando[chave] = i
+        self.falhas += len(faltando)
+        self.acertos += len(chaves) - len(faltando)
+
+        if faltando:
+            indices = list(faltando.values())
+            if pygad_args:
+                novos = self.funcao(args[0], lote[indices], np.asarray(args[2])[indices])
+            else:
+                novos = self.funcao(lote[indices])
+            novos = dict(zip(faltando, np.asarray(novos).tolist()))
+            for chave, valor in novos.items():
+                self._guardar(chave, valor)
+            for i, chave in enumerate(chaves):
+                if valores[i] is None:
+                    valores[i] = novos[chave]
+        return np.array(valores)
+
+    def avaliar(self, populacao):
+        """Fitness de cada linha da população (mesma interface do AvaliadorParalelo)"""
+        if self.lote:
+            return self(populacao)
+        return np.array([self(individuo) for individuo in np.asarray(populacao)])
+
+    @property
+    def taxa_acertos(self):
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def limpar(self):
+        self._cache.clear()
+        self.acertos = self.falhas = 0
+
+#%%=============================================================================
+# CRITÉRIOS DE PARADA ANTECIPADA
+# =============================================================================
+# Em vez de rodar sempre o número fixo de gerações, o AG para quando o melhor
+# fitness estagna, atinge o alvo, a população perde a diversidade ou o tempo
+# acaba. A mesma classe serve para o PyGAD (on_start/on_generation) e para os
+# laços manuais (verificar a cada geração).
+
+def diversidade_genotipica(populacao):
+    """
+    Fração média dos genes que diferem do valor mais comum da sua posição:
+    0 = todos os indivíduos iguais; ~0.5 em uma população binária aleatória.
+    Serve para genes binários, inteiros e permutações.
+    """
+    ordenada = np.sort(np.asarray(populacao), axis=0)
+    n = len(ordenada)
+    linhas = np.arange(n)[:, None]
+    # Início do bloco de valores iguais em que cada linha está (por coluna)
+    novo_valor = np.vstack([np.ones((1, ordenada.shape[1]), dtype=bool), ordenada[1:] != ordenada[:-1]])
+    inicio = np.maximum.accumulate(np.where(novo_valor, linhas, 0), axis=0)
+    maior_bloco = (linhas - inicio + 1).max(axis=0)
+    return 1.0 - maior_bloco.mean() / n
+
+class CriterioParada:
+    """
+    Política de parada antecipada; cada critério é ignorado se for None.
+
+    Args:
+        paciencia: para após este número de gerações sem melhorar o melhor fitness
+        alvo: para quando o melhor fitness for >= alvo
+        diversidade_minima: para quando diversidade_genotipica(população) < valor
+        tempo_maximo: para após este número de segundos
+        tolerancia: melhora mínima para zerar a contagem da paciência
+
+    Uso com PyGAD:
+        parada = CriterioParada(paciencia=20, alvo=41)
+        pygad.GA(..., on_start=parada.on_start, on_generation=parada.on_generation)
+        print(parada.motivo)
+
+    Uso em um laço manual:
+        for geracao in range(geracoes):
+            fitness_values = ...
+            if parada.verificar(fitness_values, populacao):
+                break
+    """
+
+    def __init__(self, paciencia=None, alvo=None, diversidade_minima=None, tempo_maximo=None,
+                 tolerancia=0.0):
+        self.paciencia = paciencia
+        self.alvo = alvo
+        self.diversidade_minima = diversidade_minima
+        self.tempo_maximo = tempo_maximo
+        self.tolerancia = tolerancia
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Zera o estado para uma nova execução (o relógio começa agora)"""
+        self.melhor = -np.inf
+        self.sem_melhora = 0
+        self.geracoes = 0
+        self.motivo = None
+        self._inicio = time.perf_counter()
+
+    def verificar(self, fitness_values, populacao=None):
+        """
+        Atualiza o estado com o fitness da geração atual.
+        Retorna True se o AG deve parar; o motivo fica em self.motivo.
+        """
+        melhor_atual = np.max(fitness_values)
+        self.geracoes += 1
+        if melhor_atual > self.melhor + self.tolerancia:
+            self.melhor = melhor_atual
+            self.sem_melhora = 0
+        else:
+            self.sem_melhora += 1
+
+        if self.alvo is not None and melhor_atual >= self.alvo:
+            self.motivo = f"alvo {self.alvo} atingido"
+        elif self.paciencia is not None and self.sem_melhora >= self.paciencia:
+            self.motivo = f"{self.paciencia} gerações sem melhora"
+        elif (self.diversidade_minima is not None and populacao is not None
+              and diversidade_genotipica(populacao) < self.diversidade_minima):
+            self.motivo = f"diversidade abaixo de {self.diversidade_minima}"
+        elif self.tempo_maximo is not None and time.perf_counter() - self._inicio >= self.tempo_maximo:
+            self.motivo = f"tempo máximo de {self.tempo_maximo} s"
+        return self.motivo is not None
+
+    def on_start(self, ga_instance):
+        """Callback on_start do PyGAD"""
+        self.reiniciar()
+
+    def on_generation(self, ga_instance):
+        """Callback on_generation do PyGAD: retornar "stop" encerra o run()"""
+        if self.verificar(ga_instance.last_generation_fitness, ga_instance.population):
+            return "stop"
+
+    def stop_criteria(self):
+        """
+        Equivalente nativo do PyGAD (stop_criteria) para alvo e paciência;
+        diversidade e tempo só existem via on_generation.
+        """
+        criterios = []
+        if self.alvo is not None:
+            criterios.append(f"reach_{self.alvo}")
+        if self.paciencia is not None:
+            criterios.append(f"saturate_{self.paciencia}")
+        return criterios or None
+
+#%%=============================================================================
+# RELATÓRIO DE PROGRESSO (SEM REAVALIAR A POPULAÇÃO)
+# =============================================================================
+# ga_instance.best_solution() sem pop_fitness recalcula o fitness da população
+# inteira só para imprimir uma linha. O relatório usa o fitness já calculado
+# (last_generation_fitness no PyGAD) e só calcula as estatísticas nas gerações
+# em que vai registrar.
+
+class RelatorioProgresso:
+    """
+    Registra geração, melhor, média, desvio do fitness e tempo decorrido.
+
+    Args:
+        intervalo: registra a cada 'intervalo' gerações (e sempre a geração 1)
+        destino: None = sys.stdout, caminho de arquivo ou objeto com write()
+        formato: 'texto' (uma linha legível), 'json' (JSON Lines) ou 'csv'
+        transformar: função opcional aplicada ao fitness antes das estatísticas
+                     (ex.: lambda f: 1 / f para mostrar distância ou custo)
+        minimizar: se True, 'melhor' é o menor valor (ex.: distância, custo ou
+                   f(x) de um benchmark de minimização)
+
+    Uso com PyGAD:
+        relatorio = RelatorioProgresso(intervalo=50, destino="progresso.jsonl", formato='json')
+        pygad.GA(..., on_start=relatorio.on_start, on_generation=relatorio.on_generation,
+                 on_stop=relatorio.on_stop)
+
+    Uso em um laço manual:
+        with RelatorioProgresso(destino="progresso.csv", formato='csv') as relatorio:
+            ...
+            relatorio.registrar(geracao + 1, fitness_values)
+
+    Com destino em arquivo, o relatório abre o arquivo (modo 'a') no primeiro
+    registro e o fecha no on_stop, em fechar() ou ao sair do bloco with; um
+    novo registro depois disso reabre o arquivo e continua no final.
+    Os registros também ficam em relatorio.registros (lista de dicts).
+    """
+
+    CAMPOS = ('geracao', 'melhor', 'media', 'desvio', 'tempo')
+
+    def __init__(self, intervalo=10, destino=None, formato='texto', transformar=None,
+                 minimizar=False):
+        if formato not in ('texto', 'json', 'csv'):
+            raise ValueError("formato deve ser 'texto', 'json' ou 'csv'")
+        self.intervalo = intervalo
+        self.formato = formato
+        self.transformar = transformar
+        self.minimizar = minimizar
+        self._arquivo_proprio = isinstance(destino, str)
+        self._destino = destino
+        self._saida = None if self._arquivo_proprio else (destino or sys.stdout)
+        self._cabecalho_csv = formato == 'csv' and not (
+            self._arquivo_proprio and os.path.exists(destino) and os.path.getsize(destino) > 0)
+        self.registros = []
+        self._inicio = time.perf_counter()
+
+    def on_start(self, ga_instance=None):
+        """Reinicia o relógio (callback on_start do PyGAD)"""
+        self._inicio = time.perf_counter()
+
+    def registrar(self, geracao, fitness_values, forcar=False):
+        """Registra a geração se ela cair no intervalo (ou se forcar=True)"""
+        if not forcar and geracao != 1 and geracao % self.intervalo != 0:
+            return None
+        valores = np.asarray(fitness_values, dtype=float)
+        if self.transformar is not None:
+            valores = self.transformar(valores)
+        melhor = valores.min() if self.minimizar else valores.max()
+        registro = {'geracao': int(geracao), 'melhor': float(melhor), 'media': float(valores.mean()),
+                    'desvio': float(valores.std()), 'tempo': time.perf_counter() - self._inicio}
+        self.registros.append(registro)
+        self._escrever(registro)
+        return registro
+
+    def _escrever(self, registro):
+        if self._saida is None:
+            self._saida = open(self._destino, 'a', encoding='utf-8')
+        if self.formato == 'json':
+            linha = json.dumps(registro)
+        elif self.formato == 'csv':
+            if self._cabecalho_csv:
+                self._saida.write(",".join(self.CAMPOS) + "\n")
+                self._cabecalho_csv = False
+            linha = ",".join(str(registro[campo]) for campo in self.CAMPOS)
+        else:
+            linha = (f"Geração {registro['geracao']:4d} | Melhor: {registro['melhor']:.4f} | "
+                     f"Média: {registro['media']:.4f} | Desvio: {registro['desvio']:.4f} | "
+                     f"{registro['tempo']:.2f} s")
+        self._saida.write(linha + "\n")
+        self._saida.flush()
+
+    def on_generation(self, ga_instance):
+        """Callback on_generation do PyGAD (usa o fitness já calculado)"""
+        self.registrar(ga_instance.generations_completed, ga_instance.last_generation_fitness)
+
+    def on_stop(self, ga_instance, last_population_fitness):
+        """Callback on_stop do PyGAD: registra a última geração, se ainda não registrada"""
+        geracao = ga_instance.generations_completed
+        if not self.registros or self.registros[-1]['geracao'] != geracao:
+            self.registrar(geracao, last_population_fitness, forcar=True)
+        self.fechar()
+
+    def fechar(self):
+        """Fecha o arquivo aberto pelo relatório (destinos passados prontos ficam abertos)"""
+        if self._arquivo_proprio and self._saida is not None:
+            self._saida.close()
+            self._saida = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+#%%=============================================================================
+# CHECKPOINT E RETOMADA
+# =============================================================================
+# Execuções longas (máquinas preemptivas) salvam periodicamente tudo o que é
+# preciso para continuar: população, fitness, geração, estado do gerador
+# aleatório (bit generator) e histórico. O arquivo .npz não é comprimido, então
+# salvar é praticamente uma cópia de memória. A gravação vai para um arquivo
+# temporário que depois substitui o original, de modo que uma interrupção no
+# meio da escrita nunca corrompe o último checkpoint válido.
+
+def salvar_checkpoint(arquivo, populacao, fitness_values, geracao, rng, historico, **extras):
+    """
+    Salva o estado do AG em um arquivo .npz.
+
+    Args:
+        arquivo: caminho do checkpoint
+        populacao: população já avaliada (inclusive compactada em uint64)
+        fitness_values: fitness dessa população
+        geracao: número de gerações concluídas
+        rng: numpy.random.Generator usado pelo AG
+        historico: melhor fitness por geração até aqui
+        extras: outros arrays a guardar (ex.: estado do CriterioParada)
+    """
+    temporario = f"{arquivo}.tmp"
+    with open(temporario, 'wb') as f:
+        np.savez(f, populacao=populacao, fitness=np.asarray(fitness_values), geracao=geracao,
+                 historico=np.asarray(historico), rng=json.dumps(rng.bit_generator.state), **extras)
+    os.replace(temporario, arquivo)
+
+def carregar_checkpoint(arquivo):
+    """
+    Lê um checkpoint salvo por salvar_checkpoint.
+
+    Returns:
+        dict com 'populacao', 'fitness', 'geracao', 'historico', 'rng' (um
+        numpy.random.Generator no mesmo estado do momento em que foi salvo) e
+        os arrays extras
+    """
+    with np.load(arquivo) as dados:
+        estado = {chave: dados[chave] for chave in dados.files}
+    estado_rng = json.loads(str(estado['rng']))
+    bit_generator = getattr(np.random, estado_rng['bit_generator'])()
+    bit_generator.state = estado_rng
+    estado['rng'] = np.random.Generator(bit_generator)
+    estado['geracao'] = int(estado['geracao'])
+    return estado
@@ -0,0 +1,178 @@
+#%% Otimizador Genético para Funções Contínuas n-Dimensionais
+# Generaliza o AG de "3_2D_Funcao_Teste_Nao_Linear_AG.py" (uma variável x em
+# [XMIN, XMAX]) para n variáveis, cada uma com seus próprios limites.
+#
+# Interface vetorizada da função objetivo:
+#     f(X) com X de forma (pop, dim)  ->  array de forma (pop,)
+#
+# Duas codificações:
+#     'real'    : genes reais, cruzamento SBX e mutação polinomial (Deb)
+#     'binaria' : BITS bits por variável, cruzamento de um ponto e bit-flip
+
+import numpy as np
+
+from utils_ag import mutacao_numpy, selecao_torneio_numpy
+
+#%%=============================================================================
+# FUNÇÕES DE TESTE (BENCHMARKS) - TODAS DE MINIMIZAÇÃO, ÓTIMO = 0
+# =============================================================================
+
+def rastrigin(X):
+    """Rastrigin: multimodal, domínio típico [-5.12, 5.12]^n, mínimo f(0) = 0"""
+    return 10 * X.shape[1] + np.sum(X**2 - 10 * np.cos(2 * np.pi * X), axis=1)
+
+def rosenbrock(X):
+    """Rosenbrock: vale estreito e curvo, domínio típico [-5, 10]^n, mínimo f(1) = 0"""
+    return np.sum(100 * (X[:, 1:] - X[:, :-1]**2)**2 + (1 - X[:, :-1])**2, axis=1)
+
+def ackley(X):
+    """Ackley: muitos mínimos locais, domínio típico [-32.768, 32.768]^n, mínimo f(0) = 0"""
+    n = X.shape[1]
+    termo1 = -20 * np.exp(-0.2 * np.sqrt(np.sum(X**2, axis=1) / n))
+    termo2 = -np.exp(np.sum(np.cos(2 * np.pi * X), axis=1) / n)
+    return termo1 + termo2 + 20 + np.e
+
+def limites_iguais(minimo, maximo, dim):
+    """Limites (dim x 2) com o mesmo intervalo [minimo, maximo] em todas as dimensões"""
+    return np.tile([minimo, maximo], (dim, 1)).astype(float)
+
+#%%=============================================================================
+# OPERADORES PARA CODIFICAÇÃO REAL
+# =============================================================================
+
+def cruzamento_sbx(pais1, pais2, inferior, superior, rng, pc=0.9, eta=15):
+    """
+    Simulated Binary Crossover (SBX) para todos os casais de uma vez.
+    Os filhos ficam em torno dos pais; eta maior = filhos mais próximos dos pais.
+    Cada gene participa com probabilidade 0.5 e cada casal cruza com probabilidade pc.
+    """
+    u = rng.random(pais1.shape)
+    beta = np.where(u <= 0.5, (2 * u) ** (1 / (eta + 1)), (1 / (2 * (1 - u))) ** (1 / (eta + 1)))
+    cruza = (rng.random(pais1.shape) < 0.5) & (rng.random((len(pais1), 1)) < pc)
+    beta = np.where(cruza, beta, 1.0)   # beta = 1 -> filho igual ao pai
+    filhos1 = 0.5 * ((1 + beta) * pais1 + (1 - beta) * pais2)
+    filhos2 = 0.5 * ((1 - beta) * pais1 + (1 + beta) * pais2)
+    return np.clip(filhos1, inferior, superior), np.clip(filhos2, inferior, superior)
+
+def mutacao_polinomial(populacao, inferior, superior, rng, pm, eta=20):
+    """
+    Mutação polinomial: cada gene muta com probabilidade pm, com perturbação
+    proporcional à largura do intervalo; eta maior = perturbações menores.
+    """
+    u = rng.random(populacao.shape)
+    delta = np.where(u < 0.5, (2 * u) ** (1 / (eta + 1)) - 1, 1 - (2 * (1 - u)) ** (1 / (eta + 1)))
+    muta = rng.random(populacao.shape) < pm
+    mutada = populacao + np.where(muta, delta * (superior - inferior), 0.0)
+    return np.clip(mutada, inferior, superior)
+
+#%%=============================================================================
+# DECODIFICAÇÃO BINÁRIA (n VARIÁVEIS x BITS)
+# =============================================================================
+
+def decodificar_binario(populacao, inferior, superior, bits, gray=False):
+    """
+    Converte cromossomos (pop x dim*bits) em reais (pop x dim) com um produto
+    escalar pelas potências de 2, como bits_to_real, para todas as variáveis.
+    """
+    pop = len(populacao)
+    dim = len(inferior)
+    blocos = populacao.reshape(pop, dim, bits).astype(np.int64)
+    if gray:
+        blocos = np.bitwise_xor.accumulate(blocos, axis=-1)
+    potencias = 2 ** np.arange(bits - 1, -1, -1, dtype=np.int64)
+    inteiros = blocos @ potencias
+    return inferior + (superior - inferior) * inteiros / (2**bits - 1)
+
+#%%=============================================================================
+# OTIMIZADOR
+# =============================================================================
+
+def otimizar(f, limites, tam_pop=100, geracoes=200, codificacao='real', bits=16, gray=False,
+             pc=0.9, pm=None, eta_c=15, eta_m=20, k_torneio=2, elitismo=2,
+             maximizar=False, seed=None, parada=None, relatorio=None):
+    """
+    Otimiza uma função de n variáveis com limites por dimensão.
+
+    Args:
+        f: função objetivo vetorizada f(X: (pop, dim)) -> (pop,)
+        limites: array (dim x 2) com [mínimo, máximo] de cada variável
+        tam_pop, geracoes: tamanho da população e número de gerações
+        codificacao: 'real' (SBX + polinomial) ou 'binaria' (um ponto + bit-flip)
+        bits, gray: bits por variável e uso de código Gray (codificação binária)
+        pc: probabilidade de cruzamento
+        pm: probabilidade de mutação por gene (None = 1/número de genes)
+        eta_c, eta_m: índices de distribuição do SBX e da mutação polinomial
+        k_torneio: tamanho do torneio na seleção
+        elitismo: quantos melhores indivíduos passam direto para a próxima geração
+        maximizar: False = minimizar (benchmarks), True = maximizar
+        seed: semente do numpy.random.Generator
+        parada: CriterioParada opcional (utils_ag.py), verificado sobre a
+                aptidão = f ao maximizar e -f ao minimizar (ex.: alvo=-1e-6)
+        relatorio: RelatorioProgresso opcional (utils_ag.py), chamado a cada
+                   geração com os valores de f (ao minimizar, crie-o com minimizar=True)
+
+    Returns:
+        dict com 'x' (melhor ponto), 'f' (melhor valor) e 'historico'
+        (melhor valor de f em cada população avaliada: a inicial e a de cada
+        geração, ou seja geracoes + 1 valores; menos se parada encerrar antes)
+    """
+    rng = np.random.default_rng(seed)
+    limites = np.asarray(limites, dtype=float)
+    inferior, superior = limites[:, 0], limites[:, 1]
+    dim = len(limites)
+    sinal = 1.0 if maximizar else -1.0   # A seleção sempre maximiza a aptidão
+
+    if codificacao == 'real':
+        n_genes = dim
+        populacao = inferior + (superior - inferior) * rng.random((tam_pop, dim))
+        decodificar = lambda pop: pop
+    elif codificacao == 'binaria':
+        n_genes = dim * bits
+        populacao = rng.integers(0, 2, size=(tam_pop, n_genes), dtype=np.uint8)
+        decodificar = lambda pop: decodificar_binario(pop, inferior, superior, bits, gray)
+    else:
+        raise ValueError("codificacao deve ser 'real' ou 'binaria'")
+    if pm is None:
+        pm = 1.0 / n_genes
+
+    historico = []
+    X = decodificar(populacao)
+    valores = np.asarray(f(X), dtype=float)
+    for geracao in range(geracoes):
+        aptidao = sinal * valores
+        ordem = np.argsort(aptidao)[::-1]
+        historico.append(valores[ordem[0]])
+        if relatorio is not None:
+            relatorio.registrar(geracao + 1, valores)
+        if parada is not None and parada.verificar(aptidao, populacao):
+            break
+
+        # Seleção por torneio dos casais que vão gerar os filhos
+        n_pares = -(-(tam_pop - elitismo) // 2)
+        pais1 = populacao[selecao_torneio_numpy(aptidao, n_pares, rng, k=k_torneio)]
+        pais2 = populacao[selecao_torneio_numpy(aptidao, n_pares, rng, k=k_torneio)]
+
+        if codificacao == 'real':
+            filhos1, filhos2 = cruzamento_sbx(pais1, pais2, inferior, superior, rng, pc, eta_c)
+            filhos = np.concatenate([filhos1, filhos2])
+            filhos = mutacao_polinomial(filhos, inferior, superior, rng, pm, eta_m)
+        else:
+            # Um ponto de corte por casal e filhos complementares; sem
+            # cruzamento (máscara toda verdadeira) os filhos copiam os pais
+            cortes = rng.integers(1, n_genes, size=(n_pares, 1))
+            mascara = (np.arange(n_genes) < cortes) | (rng.random((n_pares, 1)) >= pc)
+            filhos1 = np.where(mascara, pais1, pais2)
+            filhos2 = np.where(mascara, pais2, pais1)
+            filhos = mutacao_numpy(np.concatenate([filhos1, filhos2]), rng, pm)
+
+        # Elitismo: os melhores passam direto; os filhos completam a população
+        filhos = filhos[:tam_pop - elitismo]
+        X_filhos = decodificar(filhos)
+        populacao = np.concatenate([populacao[ordem[:elitismo]], filhos])
+        valores = np.concatenate([valores[ordem[:elitismo]], np.asarray(f(X_filhos), dtype=float)])
+    else:
+        # Sem parada antecipada, a população da última geração ainda não entrou no histórico
+        historico.append(valores[np.argmax(sinal * valores)])
+
+    melhor = np.argmax(sinal * valores)
+    return {'x': decodificar(populacao[melhor:melhor + 1])[0], 'f': valores[melhor], 'historico': historico}
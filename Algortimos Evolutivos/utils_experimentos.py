@@ -0,0 +1,221 @@
+#%% Varredura de Parâmetros (Grade x Sementes) em Paralelo
+# Substitui os blocos pygad.GA(...) quase idênticos dos scripts de CROSSOVER e
+# MUTAÇÃO por uma grade declarativa:
+#
+#     grade = {'crossover_probability': [0.3, 0.7, 0.95],
+#              'crossover_type': ['single_point', 'uniform']}
+#     resultados = executar_varredura(funcao, grade, sementes=range(10),
+#                                     arquivo="varredura.jsonl")
+#
+# Cada célula (configuração x semente) roda em um processo do Pool. Ao terminar,
+# a célula é gravada como uma linha JSON no arquivo de checkpoint; se a varredura
+# for interrompida, a próxima chamada lê o arquivo e só executa o que falta.
+# A primeira linha do arquivo guarda a impressão digital do que fica fixo na
+# varredura (função, instância, parâmetros do GA); se ela mudar, o arquivo antigo
+# é recusado em vez de ter seus resultados reaproveitados.
+
+import hashlib
+import itertools
+import json
+import multiprocessing as mp
+import os
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+#%%=============================================================================
+# GRADE DE PARÂMETROS
+# =============================================================================
+
+def expandir_grade(grade):
+    """
+    Produto cartesiano de uma grade {parâmetro: [valores]} em uma lista de
+    configurações {parâmetro: valor}, na ordem em que os parâmetros aparecem.
+    """
+    nomes = list(grade)
+    return [dict(zip(nomes, valores)) for valores in itertools.product(*grade.values())]
+
+def _json_padrao(valor):
+    """Converte tipos NumPy para tipos nativos do JSON"""
+    if isinstance(valor, np.ndarray):
+        return valor.tolist()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return str(valor)
+
+def chave_configuracao(config):
+    """Texto que identifica uma configuração (ordem dos parâmetros não importa)"""
+    return json.dumps(config, sort_keys=True, default=_json_padrao, ensure_ascii=False)
+
+def _json_fixo(valor):
+    """Como _json_padrao, mas descreve pelo conteúdo tabelas e objetos (ex.: CriterioParada)"""
+    if isinstance(valor, (pd.DataFrame, pd.Series)):
+        return valor.to_json()
+    if isinstance(valor, (np.ndarray, np.generic)):
+        return _json_padrao(valor)
+    if hasattr(valor, '__dict__'):
+        atributos = {k: v for k, v in vars(valor).items() if not k.startswith('_')}
+        return {'classe': type(valor).__qualname__, **atributos}
+    return str(valor)
+
+def impressao_execucao(funcao):
+    """
+    Impressão digital (hash SHA-256) do que a varredura mantém fixo: o nome
+    qualificado da função e, em um functools.partial, os argumentos fixados
+    (instância do problema, num_generations etc.).
+    """
+    fixos = None
+    if isinstance(funcao, partial):
+        fixos = [funcao.args, funcao.keywords]
+        funcao = funcao.func
+    nome = f"{funcao.__module__}.{funcao.__qualname__}"
+    texto = json.dumps([nome, fixos], sort_keys=True, default=_json_fixo, ensure_ascii=False)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+#%%=============================================================================
+# EXECUÇÃO COM CHECKPOINT
+# =============================================================================
+
+def _executar_celula(tarefa):
+    # Executado nos processos do Pool: funcao(semente, **config)
+    funcao, config, semente = tarefa
+    return config, semente, funcao(semente, **config)
+
+def ler_checkpoint(arquivo, impressao=None):
+    """
+    Células já concluídas: {(chave da configuração, semente): registro}.
+    Com impressao (ver impressao_execucao), recusa com ValueError um arquivo
+    gravado por uma varredura com outra função, instância ou parâmetros fixos.
+    """
+    concluidas = {}
+    if arquivo is None or not os.path.exists(arquivo):
+        return concluidas
+    gravada = None
+    with open(arquivo, encoding='utf-8') as f:
+        for linha in f:
+            try:
+                registro = json.loads(linha)
+            except json.JSONDecodeError:
+                continue   # Última linha incompleta de uma execução interrompida
+            if 'impressao' in registro:
+                gravada = registro['impressao']
+                continue
+            concluidas[(chave_configuracao(registro['config']), registro['semente'])] = registro
+    if impressao is not None and concluidas and gravada != impressao:
+        raise ValueError(f"o checkpoint {arquivo} foi gravado por outra varredura (função, instância "
+                         "ou parâmetros fixos diferentes); apague o arquivo ou use outro nome")
+    return concluidas
+
+def executar_varredura(funcao, grade, sementes, arquivo=None, n_processos=None, verbose=True):
+    """
+    Executa funcao(semente, **config) para todas as configurações da grade e
+    todas as sementes, em paralelo.
+
+    Args:
+        funcao: função importável (ou functools.partial de uma) que recebe a
+                semente e os parâmetros da configuração e devolve um dict de
+                resultados serializável em JSON (ex.: executar_pygad_mochila)
+        grade: dict {parâmetro: [valores]} ou lista de configurações prontas
+        sementes: sementes repetidas em cada configuração
+        arquivo: checkpoint JSON Lines (uma célula por linha); None = sem checkpoint.
+                 Um arquivo de outra varredura (impressao_execucao diferente)
+                 gera ValueError
+        n_processos: processos do Pool (None = número de núcleos; 1 = sem Pool)
+        verbose: imprime o progresso a cada célula concluída
+
+    Returns:
+        Lista de registros {'config', 'semente', 'resultado'}, incluindo os
+        lidos do checkpoint
+    """
+    configs = expandir_grade(grade) if isinstance(grade, dict) else list(grade)
+    impressao = impressao_execucao(funcao)
+    concluidas = ler_checkpoint(arquivo, impressao)
+    pendentes = [(funcao, config, semente) for config in configs for semente in sementes
+                 if (chave_configuracao(config), semente) not in concluidas]
+    total = len(configs) * len(sementes)
+    if verbose and concluidas:
+        print(f"Checkpoint: {total - len(pendentes)} de {total} células já concluídas")
+
+    saida = open(arquivo, 'a', encoding='utf-8') if arquivo is not None else None
+    if saida is not None and saida.tell() > 0:
+        with open(arquivo, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                saida.write("\n")   # Isola a linha incompleta deixada pela interrupção
+    if saida is not None and not concluidas:
+        saida.write(json.dumps({'impressao': impressao}) + "\n")
+    try:
+        if n_processos == 1:
+            resultados = map(_executar_celula, pendentes)
+            pool = None
+        else:
+            pool = mp.Pool(n_processos)
+            resultados = pool.imap_unordered(_executar_celula, pendentes)
+
+        for feitas, (config, semente, resultado) in enumerate(resultados, start=total - len(pendentes) + 1):
+            linha = json.dumps({'config': config, 'semente': semente, 'resultado': resultado},
+                               default=_json_padrao, ensure_ascii=False)
+            concluidas[(chave_configuracao(config), semente)] = json.loads(linha)   # Mesmos tipos do checkpoint
+            if saida is not None:
+                saida.write(linha + "\n")
+                saida.flush()
+            if verbose:
+                print(f"[{feitas}/{total}] {chave_configuracao(config)} | semente {semente}")
+    finally:
+        if saida is not None:
+            saida.close()
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    # Só as células desta grade, na ordem da grade
+    return [concluidas[(chave_configuracao(config), semente)]
+            for config in configs for semente in sementes]
+
+#%%=============================================================================
+# AGREGAÇÃO DOS RESULTADOS
+# =============================================================================
+
+def agregar_varredura(registros, curva='convergencia'):
+    """
+    Resume a varredura por configuração.
+
+    Args:
+        registros: saída de executar_varredura
+        curva: chave do resultado com a curva de convergência (lista por geração)
+
+    Returns:
+        tuple: (tabela, curvas)
+            tabela: DataFrame com uma linha por configuração e média/desvio de
+                    cada métrica escalar sobre as sementes
+            curvas: {chave da configuração: {'config', 'media', 'desvio', 'n'}};
+                    curvas mais curtas (parada antecipada) são completadas com
+                    o último valor
+    """
+    grupos = {}
+    for registro in registros:
+        grupos.setdefault(chave_configuracao(registro['config']), []).append(registro)
+
+    linhas, curvas = [], {}
+    for chave, grupo in grupos.items():
+        config = grupo[0]['config']
+        escalares = pd.DataFrame([{k: v for k, v in r['resultado'].items()
+                                   if isinstance(v, (int, float)) or v is None}
+                                  for r in grupo]).astype(float)
+        linha = {k: (v if isinstance(v, (int, float, str, bool)) else str(v)) for k, v in config.items()}
+        linha['execucoes'] = len(grupo)
+        for coluna in escalares:
+            linha[f"{coluna}_media"] = escalares[coluna].mean()
+            linha[f"{coluna}_desvio"] = escalares[coluna].std()
+        linhas.append(linha)
+
+        series = [r['resultado'][curva] for r in grupo if curva in r['resultado']]
+        if series:
+            tamanho = max(len(s) for s in series)
+            matriz = np.array([np.pad(np.asarray(s, dtype=float), (0, tamanho - len(s)), mode='edge')
+                               for s in series])
+            curvas[chave] = {'config': config, 'media': matriz.mean(axis=0),
+                             'desvio': matriz.std(axis=0), 'n': len(series)}
+
+    return pd.DataFrame(linhas), curvas
@@ -0,0 +1,154 @@
+#%% Modelo de Ilhas - Várias Populações do PyGAD em Processos Separados
+# Em vez de uma única população (panmítica), N ilhas evoluem em paralelo, uma
+# por processo, e a cada época trocam seus melhores indivíduos (migrantes).
+#
+#     época:  cada ilha roda geracoes_por_epoca gerações do pygad.GA
+#             -> envia os n_migrantes melhores ao coordenador (Pipe)
+#             -> o coordenador repassa os migrantes conforme a topologia
+#             -> cada ilha troca seus piores indivíduos pelos migrantes recebidos
+#
+# Só os lotes de migrantes (poucas linhas) passam pelos Pipes; a população e o
+# fitness ficam no processo de cada ilha. Como as épocas são sincronizadas e a
+# topologia aleatória é sorteada pelo coordenador, o resultado é determinístico
+# para uma mesma semente.
+
+import multiprocessing as mp
+
+import numpy as np
+import pygad
+
+TOPOLOGIAS = ('anel', 'completa', 'aleatoria')
+
+#%%=============================================================================
+# TOPOLOGIAS DE MIGRAÇÃO
+# =============================================================================
+
+def destinos_migracao(topologia, n_ilhas, rng):
+    """
+    Para cada ilha, a lista de ilhas que recebem seus migrantes nesta época.
+        'anel'      : i -> i+1 (a última envia para a primeira)
+        'completa'  : i -> todas as outras
+        'aleatoria' : i -> uma outra ilha sorteada a cada época
+    Com uma única ilha não há para onde migrar, em qualquer topologia.
+    """
+    if topologia not in TOPOLOGIAS:
+        raise ValueError(f"topologia deve ser uma de {TOPOLOGIAS}")
+    if n_ilhas < 2:
+        return [[] for _ in range(n_ilhas)]
+    if topologia == 'anel':
+        return [[(i + 1) % n_ilhas] for i in range(n_ilhas)]
+    if topologia == 'completa':
+        return [[j for j in range(n_ilhas) if j != i] for i in range(n_ilhas)]
+    sorteio = rng.integers(0, n_ilhas - 1, n_ilhas)   # 'aleatoria'
+    return [[j + (j >= i)] for i, j in enumerate(sorteio)]   # Pula a própria ilha
+
+#%%=============================================================================
+# PROCESSO DE UMA ILHA
+# =============================================================================
+
+def _trabalhador_ilha(conexao, parametros_ga, semente, geracoes_por_epoca, n_migrantes, inicializar):
+    # Executado em um processo separado: mantém um pygad.GA e responde ao coordenador
+    parametros = dict(parametros_ga)
+    if inicializar is not None:
+        parametros['initial_population'] = inicializar(np.random.default_rng(semente))
+    ga_instance = pygad.GA(num_generations=geracoes_por_epoca, random_seed=int(semente),
+                           suppress_warnings=True, **parametros)
+
+    while True:
+        migrantes = conexao.recv()
+        if migrantes is None:
+            break
+        if len(migrantes) > 0:
+            # Migrantes substituem os piores indivíduos (mantém pelo menos o melhor)
+            quantidade = min(len(migrantes), len(ga_instance.population) - 1)
+            piores = np.argsort(ga_instance.last_generation_fitness)[:quantidade]
+            ga_instance.population[piores] = migrantes[:quantidade]
+        ga_instance.run()
+
+        fitness = ga_instance.last_generation_fitness
+        melhores = np.argsort(fitness)[::-1][:n_migrantes]
+        conexao.send((ga_instance.population[melhores].copy(), float(fitness[melhores[0]])))
+
+    solucao, fitness, _ = ga_instance.best_solution(pop_fitness=ga_instance.last_generation_fitness)
+    conexao.send((solucao, float(fitness), [float(f) for f in ga_instance.best_solutions_fitness]))
+    conexao.close()
+
+#%%=============================================================================
+# COORDENADOR
+# =============================================================================
+
+def executar_ilhas(parametros_ga, n_ilhas=4, epocas=10, geracoes_por_epoca=10, n_migrantes=2,
+                   topologia='anel', inicializar=None, seed=None, verbose=True):
+    """
+    Executa o modelo de ilhas com uma população do PyGAD por processo.
+
+    Args:
+        parametros_ga: parâmetros do pygad.GA de cada ilha (sem num_generations e
+                       random_seed, definidos aqui). fitness_func e operadores
+                       personalizados devem ser funções importáveis de módulo
+        n_ilhas: número de ilhas (processos)
+        epocas: número de migrações; total de gerações = epocas * geracoes_por_epoca
+        geracoes_por_epoca: intervalo de migração (gerações entre trocas)
+        n_migrantes: quantos melhores indivíduos cada ilha envia por época
+        topologia: 'anel', 'completa' ou 'aleatoria' (ver destinos_migracao)
+        inicializar: função opcional rng -> população inicial de uma ilha
+                     (ex.: functools.partial(populacao_permutacoes, 100, n_cidades))
+        seed: semente do coordenador; a ilha i usa a semente seed + i
+              (None = semente base sorteada da entropia do sistema)
+        verbose: imprime o melhor fitness de cada ilha a cada época
+
+    Returns:
+        dict com 'solucao', 'fitness', 'ilha' (de onde veio a melhor solução),
+        'historico' (épocas x ilhas, melhor fitness ao fim de cada época) e
+        'convergencia' (best_solutions_fitness de cada ilha)
+    """
+    if topologia not in TOPOLOGIAS:
+        raise ValueError(f"topologia deve ser uma de {TOPOLOGIAS}")
+    if n_ilhas < 1:
+        raise ValueError("n_ilhas deve ser pelo menos 1")
+    # Sem semente, a base vem da entropia do sistema (random_seed do PyGAD < 2**32)
+    base = int(np.random.SeedSequence().generate_state(1)[0] >> 1) if seed is None else seed
+    rng = np.random.default_rng(base)
+    conexoes, processos = [], []
+    try:
+        for ilha in range(n_ilhas):
+            local, remota = mp.Pipe()
+            processo = mp.Process(target=_trabalhador_ilha, daemon=True,
+                                  args=(remota, parametros_ga, base + ilha, geracoes_por_epoca,
+                                        n_migrantes, inicializar))
+            processo.start()
+            conexoes.append(local)
+            processos.append(processo)
+
+        recebidos = [np.empty((0,))] * n_ilhas
+        historico = []
+        for epoca in range(epocas):
+            for conexao, migrantes in zip(conexoes, recebidos):
+                conexao.send(migrantes)
+            respostas = [conexao.recv() for conexao in conexoes]
+            historico.append([melhor for _, melhor in respostas])
+
+            # Roteamento dos migrantes conforme a topologia
+            entrada = [[] for _ in range(n_ilhas)]
+            for origem, destinos in enumerate(destinos_migracao(topologia, n_ilhas, rng)):
+                for destino in destinos:
+                    entrada[destino].append(respostas[origem][0])
+            recebidos = [np.concatenate(lotes) if lotes else np.empty((0,)) for lotes in entrada]
+
+            if verbose:
+                melhores = " | ".join(f"{melhor:.4f}" for melhor in historico[-1])
+                print(f"Época {epoca + 1:3d} ({(epoca + 1) * geracoes_por_epoca:4d} gerações): {melhores}")
+
+        for conexao in conexoes:
+            conexao.send(None)
+        finais = [conexao.recv() for conexao in conexoes]
+        for processo in processos:
+            processo.join()
+    finally:
+        for processo in processos:
+            if processo.is_alive():
+                processo.terminate()
+
+    ilha = int(np.argmax([fitness for _, fitness, _ in finais]))
+    return {'solucao': finais[ilha][0], 'fitness': finais[ilha][1], 'ilha': ilha,
+            'historico': np.array(historico), 'convergencia': [conv for _, _, conv in finais]}
@@ -0,0 +1,333 @@
+#%% Utilitários para o Problema da Mochila
+# Funções compartilhadas pelos scripts 2_AG_Problema da Mochila_*
+
+import time
+
+import numpy as np
+import pandas as pd
+import pygad
+
+#%%=============================================================================
+# FITNESS DE UM INDIVÍDUO (IMPORTÁVEL PELOS PROCESSOS DO AvaliadorParalelo)
+# =============================================================================
+
+def avaliar_mochila(individuo, pontos, pesos, capacidade=5000):
+    """
+    Fitness de uma solução binária da mochila: pontos totais se o peso
+    couber na capacidade, senão 0.
+
+    Args:
+        individuo: array de 0s e 1s (um gene por item)
+        pontos, pesos: arrays NumPy com os pontos e pesos de cada item
+        capacidade: peso máximo da mochila
+    """
+    individuo = np.asarray(individuo)
+    peso = individuo @ pesos
+    return individuo @ pontos if peso <= capacidade else 0
+
+class FitnessMochila:
+    """
+    Fitness em lote da mochila: a população inteira é avaliada com dois
+    produtos matriz-vetor (pontos e pesos); soluções acima da capacidade valem 0.
+
+    Uso com PyGAD:
+        fitness_mochila_lote = FitnessMochila(mochila['pontos'], mochila['peso']).fitness_pygad
+        pygad.GA(..., fitness_func=fitness_mochila_lote, fitness_batch_size=10)
+    """
+
+    def __init__(self, pontos, pesos, capacidade=5000):
+        self.pontos = np.asarray(pontos)
+        self.pesos = np.asarray(pesos)
+        self.capacidade = capacidade
+
+    def avaliar(self, populacao):
+        populacao = np.asarray(populacao)
+        return np.where(populacao @ self.pesos <= self.capacidade, populacao @ self.pontos, 0)
+
+    def fitness_pygad(self, ga_instance, solutions, solutions_idx):
+        """Assinatura de fitness_func em lote do PyGAD (fitness_batch_size)"""
+        return self.avaliar(solutions)
+
+#%%=============================================================================
+# INSTÂNCIAS GERADAS
+# =============================================================================
+
+def gerar_mochila(n_itens, capacidade_relativa=0.2, seed=None):
+    """
+    Gera uma instância aleatória no mesmo formato de DataFrame dos scripts.
+    Pontos e pesos são correlacionados (itens valiosos tendem a ser pesados),
+    o que torna a instância mais difícil que valores independentes.
+
+    Args:
+        n_itens: número de itens
+        capacidade_relativa: capacidade como fração do peso total (menor = mais apertada)
+        seed: semente do numpy.random.Generator
+
+    Returns:
+        tuple: (DataFrame com 'item', 'pontos', 'peso', capacidade)
+    """
+    rng = np.random.default_rng(seed)
+    peso = rng.integers(10, 1000, n_itens)
+    pontos = np.maximum(1, (peso / 10 + rng.integers(-20, 21, n_itens))).astype(int)
+    mochila = pd.DataFrame({'item': [f"item {i}" for i in range(n_itens)],
+                            'pontos': pontos, 'peso': peso})
+    return mochila, int(capacidade_relativa * peso.sum())
+
+#%%=============================================================================
+# REPARO GULOSO DE SOLUÇÕES ACIMA DA CAPACIDADE
+# =============================================================================
+# Com a penalidade "fitness = 0 se peso > capacidade", boa parte da população
+# fica sem informação nenhuma para a seleção. O reparo retira, de cada solução
+# inviável, os itens de pior razão pontos/peso até o peso caber na mochila.
+
+def reparar_mochila(populacao, pontos, pesos, capacidade=5000):
+    """
+    Reparo guloso vetorizado para a população inteira.
+    Os itens são percorridos da pior para a melhor razão pontos/peso; um item
+    escolhido é retirado enquanto o peso já retirado antes dele ainda não
+    cobre o excesso da solução. Soluções viáveis não mudam.
+
+    Args:
+        populacao: array (n x itens) de 0s e 1s
+        pontos, pesos: arrays NumPy com os pontos e pesos de cada item
+        capacidade: peso máximo da mochila
+
+    Returns:
+        Nova população reparada (a original não é alterada)
+    """
+    populacao = np.asarray(populacao)
+    ordem = np.argsort(pontos / pesos, kind='stable')   # Piores itens primeiro
+    escolhidos = populacao[:, ordem] != 0
+    excesso = escolhidos @ pesos[ordem] - capacidade
+    retirado_antes = np.cumsum(escolhidos * pesos[ordem], axis=1) - escolhidos * pesos[ordem]
+    retirar = escolhidos & (retirado_antes < excesso[:, None])
+
+    reparada = populacao.copy()
+    reparada[:, ordem] = np.where(retirar, 0, populacao[:, ordem])
+    return reparada
+
+class ReparoMochila:
+    """
+    Fitness da mochila com reparo guloso, para PyGAD e para os AGs em lote.
+
+    lamarckiano=True : os genes reparados substituem os originais na população
+                       (via on_start/on_mutation do PyGAD ou reparar() no AG NumPy)
+    lamarckiano=False: baldwiniano, só a avaliação usa a solução reparada; os
+                       genes da população ficam como estão
+
+    Uso com PyGAD:
+        reparo = ReparoMochila(PONTOS, PESOS, 5000, lamarckiano=True)
+        pygad.GA(..., fitness_func=reparo.fitness_pygad, fitness_batch_size=30,
+                 on_start=reparo.on_start, on_mutation=reparo.on_mutation)
+    """
+
+    def __init__(self, pontos, pesos, capacidade=5000, lamarckiano=True):
+        self.pontos = np.asarray(pontos)
+        self.pesos = np.asarray(pesos)
+        self.capacidade = capacidade
+        self.lamarckiano = lamarckiano
+
+    def reparar(self, populacao):
+        return reparar_mochila(populacao, self.pontos, self.pesos, self.capacidade)
+
+    def avaliar(self, populacao):
+        """Pontos de cada solução depois do reparo (toda solução reparada é viável)"""
+        return self.reparar(populacao) @ self.pontos
+
+    def fitness_pygad(self, ga_instance, solutions, solutions_idx):
+        """Assinatura de fitness_func em lote do PyGAD (fitness_batch_size)"""
+        return self.avaliar(np.asarray(solutions, dtype=int))
+
+    def on_start(self, ga_instance):
+        if self.lamarckiano:
+            ga_instance.population[:] = self.reparar(ga_instance.population.astype(int))
+
+    def on_mutation(self, ga_instance, offspring):
+        if self.lamarckiano:
+            return self.reparar(np.asarray(offspring, dtype=int))
+
+#%%=============================================================================
+# SOLUÇÕES EXATAS (REFERÊNCIA PARA MEDIR O DESVIO DO AG)
+# =============================================================================
+# Assim como resolver_programacao_linear no Problema da Ração, estas funções
+# dão o ótimo exato da mochila 0/1 no mesmo formato de DataFrame dos scripts
+# (colunas 'pontos' e 'peso').
+
+def mochila_programacao_dinamica(mochila, capacidade=5000, col_valor='pontos', col_peso='peso'):
+    """
+    Programação dinâmica sobre a capacidade (pesos inteiros), O(n * capacidade).
+    melhor[c] = maior valor com peso <= c, atualizado item a item em um único
+    array NumPy. Para reconstruir a solução, guarda-se por item apenas um bit por
+    capacidade ("o item entrou?"), compactado com np.packbits.
+
+    Returns:
+        dict com 'valor', 'selecao' (array 0/1 por item), 'peso', 'tempo' (s)
+    """
+    inicio = time.perf_counter()
+    valores = mochila[col_valor].to_numpy()
+    pesos = mochila[col_peso].to_numpy()
+    if not np.issubdtype(pesos.dtype, np.integer):
+        raise ValueError("A programação dinâmica exige pesos inteiros; use mochila_branch_and_bound")
+    capacidade = int(capacidade)
+
+    melhor = np.zeros(capacidade + 1, dtype=np.result_type(valores.dtype, np.int64))
+    entrou = []
+    for valor, peso in zip(valores, pesos):
+        bits = np.zeros(capacidade + 1, dtype=bool)
+        if peso <= capacidade:
+            candidato = melhor[:capacidade + 1 - peso] + valor   # Cópia: usa a linha anterior
+            bits[peso:] = candidato > melhor[peso:]
+            melhor[peso:] = np.where(bits[peso:], candidato, melhor[peso:])
+        entrou.append(np.packbits(bits))
+
+    # Reconstrução de trás para frente pelos bits guardados
+    selecao = np.zeros(len(valores), dtype=int)
+    c = capacidade
+    for i in range(len(valores) - 1, -1, -1):
+        if (entrou[i][c >> 3] >> (7 - (c & 7))) & 1:
+            selecao[i] = 1
+            c -= pesos[i]
+
+    return {'valor': melhor[capacidade], 'selecao': selecao, 'peso': selecao @ pesos,
+            'tempo': time.perf_counter() - inicio}
+
+def mochila_branch_and_bound(mochila, capacidade=5000, col_valor='pontos', col_peso='peso'):
+    """
+    Branch-and-bound em profundidade com limitante da relaxação linear (Dantzig):
+    os itens são ordenados por valor/peso e o limitante de um nó é o valor da
+    mochila fracionária com os itens restantes, obtido em O(log n) com somas
+    acumuladas. Não depende do tamanho da capacidade (aceita pesos reais).
+
+    Returns:
+        dict com 'valor', 'selecao', 'peso', 'tempo' (s) e 'nos' explorados
+    """
+    inicio = time.perf_counter()
+    valores = mochila[col_valor].to_numpy().astype(float)
+    pesos = mochila[col_peso].to_numpy().astype(float)
+    n = len(valores)
+
+    ordem = np.argsort(-valores / np.maximum(pesos, 1e-12), kind='stable')
+    v, w = valores[ordem], pesos[ordem]
+    V = np.concatenate([[0.0], np.cumsum(v)])   # V[i] = soma dos valores dos itens 0..i-1
+    W = np.concatenate([[0.0], np.cumsum(w)])
+
+    def limitante(i, peso, valor):
+        # Itens i, i+1, ... inteiros enquanto couberem, e uma fração do próximo
+        j = np.searchsorted(W, W[i] + capacidade - peso, side='right') - 1
+        limite = valor + V[j] - V[i]
+        if j < n:
+            limite += (capacidade - peso - (W[j] - W[i])) * v[j] / max(w[j], 1e-12)
+        return limite
+
+    melhor_valor, melhor_escolha = 0.0, []
+    nos = 0
+    pilha = [(0, 0.0, 0.0, [])]   # (próximo item, peso, valor, itens escolhidos)
+    while pilha:
+        i, peso, valor, escolha = pilha.pop()
+        nos += 1
+        if valor > melhor_valor:
+            melhor_valor, melhor_escolha = valor, escolha
+        if i == n or limitante(i, peso, valor) <= melhor_valor:
+            continue
+        # Empilha primeiro "não leva" para explorar antes o ramo "leva" (guloso)
+        pilha.append((i + 1, peso, valor, escolha))
+        if peso + w[i] <= capacidade:
+            pilha.append((i + 1, peso + w[i], valor + v[i], escolha + [i]))
+
+    selecao = np.zeros(n, dtype=int)
+    selecao[ordem[melhor_escolha]] = 1
+    return {'valor': selecao @ mochila[col_valor].to_numpy(), 'selecao': selecao,
+            'peso': selecao @ mochila[col_peso].to_numpy(),
+            'tempo': time.perf_counter() - inicio, 'nos': nos}
+
+def resolver_mochila_exata(mochila, capacidade=5000, col_valor='pontos', col_peso='peso',
+                           limite_pd=10**8):
+    """
+    Escolhe o método exato: programação dinâmica se os pesos forem inteiros e
+    n * capacidade <= limite_pd; caso contrário, branch-and-bound.
+    """
+    pesos = mochila[col_peso].to_numpy()
+    if np.issubdtype(pesos.dtype, np.integer) and len(pesos) * (int(capacidade) + 1) <= limite_pd:
+        resultado = mochila_programacao_dinamica(mochila, capacidade, col_valor, col_peso)
+        resultado['metodo'] = 'programacao_dinamica'
+    else:
+        resultado = mochila_branch_and_bound(mochila, capacidade, col_valor, col_peso)
+        resultado['metodo'] = 'branch_and_bound'
+    return resultado
+
+#%%=============================================================================
+# EXECUÇÃO INSTRUMENTADA DO PYGAD (BENCHMARKS)
+# =============================================================================
+
+def executar_pygad_mochila(mochila, capacidade, seed, otimo=None, alvo=0.99, reparo=True,
+                           parada=None, **parametros):
+    """
+    Executa o PyGAD em uma instância da mochila e mede o desempenho.
+
+    Args:
+        mochila, capacidade: instância no formato de DataFrame ('pontos', 'peso')
+        seed: random_seed do PyGAD
+        otimo: valor ótimo exato (ex.: resolver_mochila_exata) para o gap
+        alvo: fração do ótimo usada em 'avaliacoes_ate_alvo'
+        reparo: True = fitness com reparo guloso (baldwiniano), False = fitness 0 se inviável
+        parada: CriterioParada opcional (utils_ag.py) para encerrar antes de num_generations
+        **parametros: parâmetros do pygad.GA (substituem os valores padrão abaixo)
+
+    Returns:
+        dict com 'melhor', 'gap' (%), 'geracoes', 'avaliacoes',
+        'avaliacoes_ate_alvo' (None se não atingiu), 'tempo', 'tempo_por_geracao' (s)
+        e 'convergencia' (melhor fitness de cada geração)
+    """
+    pontos = mochila['pontos'].to_numpy()
+    pesos = mochila['peso'].to_numpy()
+    if reparo:
+        fitness_base = ReparoMochila(pontos, pesos, capacidade, lamarckiano=False).avaliar
+    else:
+        fitness_base = FitnessMochila(pontos, pesos, capacidade).avaliar
+
+    contagem = {'avaliacoes': 0, 'ate_alvo': None}
+    valor_alvo = None if otimo is None else alvo * otimo
+
+    def fitness(ga_instance, solutions, solutions_idx):
+        solutions = np.asarray(solutions, dtype=int)
+        contagem['avaliacoes'] += len(solutions)
+        return fitness_base(solutions)
+
+    def on_generation(ga_instance):
+        if (valor_alvo is not None and contagem['ate_alvo'] is None
+                and np.max(ga_instance.last_generation_fitness) >= valor_alvo):
+            contagem['ate_alvo'] = contagem['avaliacoes']
+        if parada is not None:
+            return parada.on_generation(ga_instance)
+
+    configuracao = dict(num_generations=100, sol_per_pop=50, num_parents_mating=20,
+                        keep_elitism=1, mutation_probability=min(1.0, 2 / len(pontos)))
+    configuracao.update(parametros)
+
+    ga_instance = pygad.GA(
+        num_genes=len(pontos),
+        gene_space=[0, 1],
+        gene_type=int,
+        fitness_func=fitness,
+        fitness_batch_size=configuracao['sol_per_pop'],
+        on_generation=on_generation,
+        random_seed=seed,
+        suppress_warnings=True,
+        **configuracao
+    )
+    if parada is not None:
+        parada.reiniciar()
+    inicio = time.perf_counter()
+    ga_instance.run()
+    tempo = time.perf_counter() - inicio
+
+    melhor = float(np.max(ga_instance.best_solutions_fitness))
+    geracoes = ga_instance.generations_completed
+    return {'melhor': melhor,
+            'gap': None if otimo is None else float((otimo - melhor) / otimo * 100),
+            'geracoes': geracoes,
+            'avaliacoes': contagem['avaliacoes'],
+            'avaliacoes_ate_alvo': contagem['ate_alvo'],
+            'tempo': tempo,
+            'tempo_por_geracao': tempo / max(geracoes, 1),
+            'convergencia': [float(f) for f in ga_instance.best_solutions_fitness]}
@@ -0,0 +1,176 @@
+#%% Formulação de Ração a partir de Tabelas (Ingredientes x Nutrientes)
+# Generaliza o problema da ração (osso, soja, peixe; proteína e cálcio) para
+# qualquer número de ingredientes e nutrientes lidos de arquivos:
+#
+#     ingredientes.csv : ingrediente, custo, inclusao_min, inclusao_max, <nutriente 1>, <nutriente 2>, ...
+#     exigencias.csv   : nutriente, minimo, maximo
+#
+# Inclusões e exigências são frações da mistura (0.3 = 30%); células vazias
+# significam "sem limite". O modelo linear é montado a partir das matrizes:
+# uma expressão por linha da matriz de composição, criada de uma vez a partir
+# dos coeficientes não nulos, em vez de um "prob += a*x1 + b*x2 + ..." por termo.
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pulp
+
+#%%=============================================================================
+# LEITURA DAS TABELAS
+# =============================================================================
+
+def ler_tabela(origem):
+    """DataFrame pronto ou caminho de arquivo .csv / .parquet"""
+    if isinstance(origem, pd.DataFrame):
+        return origem
+    extensao = os.path.splitext(origem)[1].lower()
+    if extensao == '.csv':
+        return pd.read_csv(origem)
+    if extensao in ('.parquet', '.pq'):
+        return pd.read_parquet(origem)   # Requer pyarrow ou fastparquet
+    raise ValueError(f"formato de tabela não suportado: {origem} (use .csv ou .parquet)")
+
+def carregar_formulacao(ingredientes, exigencias):
+    """
+    Converte as tabelas de ingredientes e exigências nos arrays do modelo.
+
+    Args:
+        ingredientes: tabela (ou arquivo) com as colunas 'ingrediente', 'custo',
+                      opcionalmente 'inclusao_min' / 'inclusao_max', e uma coluna
+                      por nutriente com o teor no ingrediente
+        exigencias: tabela (ou arquivo) com 'nutriente', 'minimo' e 'maximo';
+                    só os nutrientes listados aqui entram no modelo
+
+    Returns:
+        dict com 'ingredientes', 'nutrientes' (nomes), 'custos',
+        'composicao' (nutrientes x ingredientes), 'minimo', 'maximo',
+        'inclusao_min', 'inclusao_max' (arrays; NaN = sem limite)
+    """
+    ingredientes = ler_tabela(ingredientes)
+    exigencias = ler_tabela(exigencias)
+    nutrientes = list(exigencias['nutriente'])
+    faltando = [n for n in nutrientes if n not in ingredientes.columns]
+    if faltando:
+        raise ValueError(f"nutrientes sem coluna na tabela de ingredientes: {faltando}")
+
+    n_ingredientes = len(ingredientes)
+    sem_limite = np.full(n_ingredientes, np.nan)
+    return {
+        'ingredientes': list(ingredientes['ingrediente']),
+        'nutrientes': nutrientes,
+        'custos': ingredientes['custo'].to_numpy(dtype=float),
+        'composicao': ingredientes[nutrientes].fillna(0).to_numpy(dtype=float).T,
+        'minimo': exigencias['minimo'].to_numpy(dtype=float),
+        'maximo': exigencias['maximo'].to_numpy(dtype=float),
+        'inclusao_min': ingredientes.get('inclusao_min', pd.Series(sem_limite)).to_numpy(dtype=float),
+        'inclusao_max': ingredientes.get('inclusao_max', pd.Series(sem_limite)).to_numpy(dtype=float),
+    }
+
+#%%=============================================================================
+# INSTÂNCIAS GERADAS
+# =============================================================================
+
+def gerar_formulacao(n_ingredientes, n_nutrientes, inclusao_maxima=0.2, seed=None):
+    """
+    Gera tabelas aleatórias no formato de carregar_formulacao, sempre viáveis:
+    as exigências são montadas em torno de uma mistura sorteada que respeita
+    os limites de inclusão.
+
+    Returns:
+        tuple: (tabela de ingredientes, tabela de exigências)
+    """
+    rng = np.random.default_rng(seed)
+    nutrientes = [f"nutriente {j}" for j in range(n_nutrientes)]
+    composicao = rng.uniform(0, 1, (n_ingredientes, n_nutrientes))
+    composicao[rng.random(composicao.shape) < 0.3] = 0   # Nem todo ingrediente tem todo nutriente
+    custos = 0.2 + composicao.mean(axis=1) + rng.uniform(0, 0.5, n_ingredientes)
+
+    mistura = rng.dirichlet(np.ones(n_ingredientes))
+    while mistura.max() > inclusao_maxima:
+        mistura = np.minimum(mistura, inclusao_maxima)
+        mistura /= mistura.sum()
+    teor = mistura @ composicao
+
+    # Metade dos nutrientes com mínimo, a outra metade com mínimo e máximo
+    com_maximo = np.arange(n_nutrientes) % 2 == 1
+    ingredientes = pd.DataFrame(composicao, columns=nutrientes)
+    ingredientes.insert(0, 'ingrediente', [f"ingrediente {i}" for i in range(n_ingredientes)])
+    ingredientes.insert(1, 'custo', custos.round(4))
+    ingredientes.insert(2, 'inclusao_min', 0.0)
+    ingredientes.insert(3, 'inclusao_max', inclusao_maxima)
+    exigencias = pd.DataFrame({'nutriente': nutrientes, 'minimo': 0.95 * teor,
+                               'maximo': np.where(com_maximo, 1.05 * teor, np.nan)})
+    return ingredientes, exigencias
+
+#%%=============================================================================
+# MODELO DE PROGRAMAÇÃO LINEAR
+# =============================================================================
+
+def montar_modelo(formulacao, total=1.0):
+    """
+    Monta o PL de custo mínimo com PuLP a partir das matrizes:
+        min  custos @ x
+        s.a. minimo * total <= composicao @ x <= maximo * total
+             sum(x) == total
+             inclusao_min * total <= x <= inclusao_max * total
+
+    Returns:
+        tuple: (pulp.LpProblem, lista de variáveis na ordem dos ingredientes)
+    """
+    prob = pulp.LpProblem("Formulacao_Racao", pulp.LpMinimize)
+    limite = lambda valor: None if np.isnan(valor) else float(valor) * total
+    x = [pulp.LpVariable(f"x_{i}", lowBound=limite(minimo) or 0, upBound=limite(maximo))
+         for i, (minimo, maximo) in enumerate(zip(formulacao['inclusao_min'], formulacao['inclusao_max']))]
+
+    custos = formulacao['custos']
+    prob.setObjective(pulp.LpAffineExpression([(x[i], float(custos[i])) for i in np.flatnonzero(custos)]))
+    prob.addConstraint(pulp.LpConstraint(pulp.LpAffineExpression([(v, 1.0) for v in x]),
+                                         pulp.LpConstraintEQ, "Soma_Ingredientes", total))
+
+    # Uma expressão por nutriente, só com os coeficientes não nulos da linha
+    for nome, linha, minimo, maximo in zip(formulacao['nutrientes'], formulacao['composicao'],
+                                           formulacao['minimo'], formulacao['maximo']):
+        indices = np.flatnonzero(linha)
+        termos = [(x[i], c) for i, c in zip(indices, linha[indices].tolist())]
+        if not np.isnan(minimo):
+            prob.addConstraint(pulp.LpConstraint(pulp.LpAffineExpression(termos), pulp.LpConstraintGE,
+                                                 f"{nome}_min", limite(minimo)))
+        if not np.isnan(maximo):
+            prob.addConstraint(pulp.LpConstraint(pulp.LpAffineExpression(termos), pulp.LpConstraintLE,
+                                                 f"{nome}_max", limite(maximo)))
+    return prob, x
+
+def formular_racao(formulacao, total=1.0, solver=None):
+    """
+    Resolve a formulação de custo mínimo.
+
+    Args:
+        formulacao: dict de carregar_formulacao
+        total: quantidade total da mistura (1.0 = frações, 1000 = kg por tonelada)
+        solver: solver do PuLP (padrão: CBC sem mensagens)
+
+    Returns:
+        dict com 'status', 'custo', 'quantidades' (Series por ingrediente),
+        'nutrientes' (Series com o teor de cada nutriente na mistura, em fração),
+        'tempo_montagem' e 'tempo_solucao' (segundos)
+    """
+    inicio = time.perf_counter()
+    prob, x = montar_modelo(formulacao, total)
+    tempo_montagem = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    prob.solve(solver or pulp.PULP_CBC_CMD(msg=0))
+    tempo_solucao = time.perf_counter() - inicio
+
+    status = pulp.LpStatus[prob.status]
+    quantidades = np.array([v.varValue or 0.0 for v in x])
+    return {
+        'status': status,
+        'custo': pulp.value(prob.objective) if status == 'Optimal' else None,
+        'quantidades': pd.Series(quantidades, index=formulacao['ingredientes']),
+        'nutrientes': pd.Series(formulacao['composicao'] @ quantidades / total, index=formulacao['nutrientes']),
+        'tempo_montagem': tempo_montagem,
+        'tempo_solucao': tempo_solucao,
+    }
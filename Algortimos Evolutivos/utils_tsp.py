@@ -0,0 +1,419 @@
+#%% Utilitários para o Problema do Caixeiro Viajante (PCV)
+# Funções compartilhadas pelos scripts 4_Caixeiro Viajante_*
+
+import numpy as np
+
+#%%=============================================================================
+# MATRIZ DE DISTÂNCIAS
+# =============================================================================
+# Construída por broadcasting sobre o array de coordenadas, em blocos de linhas
+# para limitar a memória temporária. Para instâncias muito grandes pode ser
+# gerada em float32 e/ou direto em um arquivo .npy mapeado em memória; a matriz
+# continua quadrada, indexável como D[i, j] pelas demais funções deste módulo.
+
+def _distancias_bloco(origens, destinos):
+    """Distâncias euclidianas entre cada linha de 'origens' e cada linha de 'destinos'"""
+    quadrados = np.zeros((len(origens), len(destinos)), dtype=origens.dtype)
+    for k in range(origens.shape[1]):
+        diferenca = origens[:, k, None] - destinos[None, :, k]
+        quadrados += diferenca * diferenca
+    return np.sqrt(quadrados, out=quadrados)
+
+def matriz_distancias(coordenadas, dtype=np.float64, arquivo=None, tam_bloco=1024):
+    """
+    Matriz de distâncias euclidianas entre todas as cidades.
+
+    Args:
+        coordenadas: lista ou array (n x 2) com as coordenadas das cidades
+        dtype: np.float64 (padrão) ou np.float32 (metade da memória)
+        arquivo: caminho de um .npy; se informado, a matriz é escrita direto no
+                 disco (np.memmap) em vez de ficar toda na memória RAM
+        tam_bloco: número de linhas calculadas por vez
+
+    Returns:
+        array (n x n) ou memmap com as distâncias
+    """
+    coordenadas = np.asarray(coordenadas, dtype=dtype)
+    n = len(coordenadas)
+    forma = (n, n)
+    if arquivo is not None:
+        saida = np.lib.format.open_memmap(arquivo, mode='w+', dtype=dtype, shape=forma)
+    else:
+        saida = np.empty(forma, dtype=dtype)
+
+    for inicio in range(0, n, tam_bloco):
+        fim = min(inicio + tam_bloco, n)
+        saida[inicio:fim] = _distancias_bloco(coordenadas[inicio:fim], coordenadas)
+
+    if arquivo is not None:
+        saida.flush()
+    return saida
+
+#%%=============================================================================
+# DETECÇÃO DE SUB-ROTAS (VETOR DE SUCESSORES)
+# =============================================================================
+# Com a codificação binária por arcos, as rotas ativas podem ser guardadas em um
+# vetor de sucessores: sucessor[i] = cidade visitada logo depois de i (-1 se a
+# cidade não tem saída). Basta seguir os ponteiros para contar os ciclos.
+
+def contar_subrotas(sucessor):
+    """
+    Número de sub-rotas do vetor de sucessores, em O(n).
+    Cada cidade é visitada uma única vez seguindo os ponteiros; cada ciclo
+    novo conta como uma sub-rota, e um caminho que termina em uma cidade sem
+    saída (-1) também conta como uma sub-rota (aberta).
+    Uma rota válida do PCV tem exatamente 1 sub-rota.
+    """
+    sucessor = np.asarray(sucessor)
+    n = len(sucessor)
+    passeio = np.full(n, -1)    # Em qual passeio cada cidade foi visitada
+    subrotas = 0
+    for inicio in range(n):
+        if passeio[inicio] >= 0:
+            continue
+        cidade = inicio
+        while cidade >= 0 and passeio[cidade] < 0:
+            passeio[cidade] = inicio
+            cidade = sucessor[cidade]
+        # Fechou um ciclo novo (voltou ao passeio atual) ou parou sem saída;
+        # se caiu em um passeio anterior, apenas se juntou a uma sub-rota existente
+        if cidade < 0 or passeio[cidade] == inicio:
+            subrotas += 1
+    return subrotas
+
+#%%=============================================================================
+# CODIFICAÇÃO POR PERMUTAÇÃO
+# =============================================================================
+# Uma rota é uma permutação das cidades: [2, 0, 4, 1, 3] = 2 → 0 → 4 → 1 → 3 → 2.
+# Toda permutação já é uma rota válida (cada cidade uma vez, um único ciclo),
+# então não há penalidades e o número de genes cresce linearmente (n genes).
+
+def _sortear(rng, baixo, alto, size=None):
+    """Inteiro em [baixo, alto) com numpy.random.Generator ou RandomState (PyGAD)"""
+    if hasattr(rng, 'integers'):
+        return rng.integers(baixo, alto, size=size)
+    return rng.randint(baixo, alto, size=size)
+
+def _corte(n, rng):
+    """Sorteia um segmento [a, b) com pelo menos uma cidade"""
+    a, b = np.sort(_sortear(rng, 0, n + 1, size=2))
+    if a == b:
+        b = a + 1 if a < n else a
+        a = b - 1
+    return a, b
+
+def populacao_permutacoes(tam_pop, num_cidades, rng):
+    """População inicial (tam_pop x num_cidades) de rotas aleatórias"""
+    return np.array([rng.permutation(num_cidades) for _ in range(tam_pop)])
+
+def comprimento_rotas(rotas, distance_matrix):
+    """
+    Comprimento de todas as rotas de uma vez (vetorizado).
+    Soma D[cidade_i, cidade_i+1] ao longo de cada linha, incluindo o retorno
+    da última cidade para a primeira.
+
+    Args:
+        rotas: array (pop x n) de permutações, ou uma única rota (n,)
+        distance_matrix: matriz de distâncias (n x n)
+    """
+    rotas = np.asarray(rotas, dtype=np.intp)
+    proximas = np.roll(rotas, -1, axis=-1)
+    return distance_matrix[rotas, proximas].sum(axis=-1)
+
+def cruzamento_ox(pai1, pai2, rng):
+    """
+    Order Crossover (OX): o filho herda um segmento contínuo do pai 1 e as
+    demais cidades na ordem em que aparecem no pai 2 (a partir do fim do segmento).
+    """
+    n = len(pai1)
+    a, b = _corte(n, rng)
+    filho = np.empty(n, dtype=pai1.dtype)
+    filho[a:b] = pai1[a:b]
+
+    usado = np.zeros(n, dtype=bool)
+    usado[pai1[a:b]] = True
+    ordem_pai2 = np.roll(pai2, -b)
+    restantes = ordem_pai2[~usado[ordem_pai2]]
+    posicoes = (b + np.arange(n - (b - a))) % n
+    filho[posicoes] = restantes
+    return filho
+
+def cruzamento_pmx(pai1, pai2, rng):
+    """
+    Partially Mapped Crossover (PMX): o filho herda um segmento do pai 1 e as
+    demais posições do pai 2; conflitos são resolvidos pelo mapeamento
+    entre os dois segmentos.
+    """
+    n = len(pai1)
+    a, b = _corte(n, rng)
+    filho = pai2.copy()
+    filho[a:b] = pai1[a:b]
+
+    no_segmento = np.zeros(n, dtype=bool)
+    no_segmento[pai1[a:b]] = True
+    posicao_pai1 = np.empty(n, dtype=np.intp)
+    posicao_pai1[pai1] = np.arange(n)
+
+    for i in np.r_[0:a, b:n]:
+        cidade = pai2[i]
+        while no_segmento[cidade]:
+            cidade = pai2[posicao_pai1[cidade]]
+        filho[i] = cidade
+    return filho
+
+def mutacao_troca(rota, rng):
+    """Swap: troca duas cidades de posição"""
+    rota = rota.copy()
+    i, j = _sortear(rng, 0, len(rota), size=2)
+    rota[i], rota[j] = rota[j], rota[i]
+    return rota
+
+def mutacao_inversao(rota, rng):
+    """Inversão: inverte a ordem de um trecho da rota (equivale a um movimento 2-opt)"""
+    rota = rota.copy()
+    a, b = _corte(len(rota), rng)
+    rota[a:b] = rota[a:b][::-1]
+    return rota
+
+#%%=============================================================================
+# BUSCA LOCAL (2-OPT E OR-OPT) E ESTÁGIO MEMÉTICO
+# =============================================================================
+# Cada movimento é avaliado pela variação de custo (delta) das poucas arestas
+# que mudam, sem recalcular a rota inteira. As listas de vizinhos limitam os
+# candidatos às k cidades mais próximas de cada cidade.
+
+def vizinhos_mais_proximos(distance_matrix, k=10):
+    """Para cada cidade, as k cidades mais próximas em ordem de distância (n x k)"""
+    n = len(distance_matrix)
+    k = min(k, n - 1)
+    distancias = np.array(distance_matrix, dtype=float, copy=True)
+    np.fill_diagonal(distancias, np.inf)
+    candidatos = np.argpartition(distancias, k - 1, axis=1)[:, :k]
+    ordem = np.argsort(np.take_along_axis(distancias, candidatos, axis=1), axis=1)
+    return np.take_along_axis(candidatos, ordem, axis=1)
+
+def sucessores_de_rota(rota):
+    """Vetor de sucessores (sucessor[i] = cidade seguinte a i) de uma permutação"""
+    rota = np.asarray(rota)
+    sucessor = np.empty(len(rota), dtype=np.intp)
+    sucessor[rota] = np.roll(rota, -1)
+    return sucessor
+
+def rota_de_sucessores(sucessor):
+    """Permutação a partir do vetor de sucessores, ou None se não for uma rota única"""
+    sucessor = np.asarray(sucessor)
+    n = len(sucessor)
+    rota = np.empty(n, dtype=np.intp)
+    cidade = 0
+    for i in range(n):
+        if cidade < 0:
+            return None
+        rota[i] = cidade
+        cidade = sucessor[cidade]
+    if cidade != 0 or len(np.unique(rota)) != n:
+        return None
+    return rota
+
+def _inverter_trecho(rota, posicao, inicio, fim):
+    """Inverte o trecho circular rota[inicio..fim] (inclusive) e atualiza as posições"""
+    n = len(rota)
+    tamanho = (fim - inicio) % n + 1
+    if 2 * tamanho > n:
+        # Inverter o complemento dá a mesma rota (percorrida no outro sentido) com menos trocas
+        inicio, fim = (fim + 1) % n, (inicio - 1) % n
+        tamanho = n - tamanho
+    indices = (inicio + np.arange(tamanho)) % n
+    rota[indices] = rota[indices[::-1]]
+    posicao[rota[indices]] = indices
+
+def dois_opt(rota, distance_matrix, vizinhos, max_passadas=50):
+    """
+    2-opt com listas de vizinhos: troca as arestas (a, b) e (c, d) por (a, c) e
+    (b, d) invertendo o trecho entre elas, sempre que o delta de custo é negativo.
+    """
+    D = distance_matrix
+    rota = np.array(rota, dtype=np.intp)
+    n = len(rota)
+    if n < 4:
+        return rota
+    posicao = np.empty(n, dtype=np.intp)
+    posicao[rota] = np.arange(n)
+
+    for _ in range(max_passadas):
+        melhorou = False
+        for i in range(n):
+            a, b = rota[i], rota[(i + 1) % n]
+            d_ab = D[a, b]
+            for c in vizinhos[a]:
+                if D[a, c] >= d_ab:
+                    break   # Vizinhos estão ordenados: daqui em diante não há ganho
+                j = posicao[c]
+                d = rota[(j + 1) % n]
+                if c == b or d == a:
+                    continue
+                delta = D[a, c] + D[b, d] - d_ab - D[c, d]
+                if delta < -1e-10:
+                    _inverter_trecho(rota, posicao, (i + 1) % n, j)
+                    melhorou = True
+                    break
+        if not melhorou:
+            break
+    return rota
+
+def _mover_trecho(rota, posicao, i, tamanho, D, vizinhos):
+    """
+    Tenta mover o trecho rota[i:i + tamanho] para junto de um vizinho da sua
+    primeira cidade. Retorna a nova rota (lista) no primeiro movimento com
+    ganho, ou None se nenhum movimento melhora.
+    """
+    n = len(rota)
+    trecho = rota[i:i + tamanho]
+    s0, sL = trecho[0], trecho[-1]
+    p, nx = rota[i - 1], rota[(i + tamanho) % n]
+    ganho_remocao = D[p, s0] + D[sL, nx] - D[p, nx]
+    for c in vizinhos[s0]:
+        j = posicao[c]
+        if i <= j < i + tamanho:
+            continue
+        # Opção 1: c → s0 ... sL → próxima(c)   (mesmo sentido)
+        e = rota[(j + 1) % n]
+        if e not in trecho and D[c, s0] + D[sL, e] - D[c, e] - ganho_remocao < -1e-10:
+            resto = rota[:i] + rota[i + tamanho:]
+            k = resto.index(c)
+            return resto[:k + 1] + trecho + resto[k + 1:]
+        # Opção 2: anterior(c) → sL ... s0 → c   (invertido)
+        e = rota[j - 1]
+        if e not in trecho and D[e, sL] + D[s0, c] - D[e, c] - ganho_remocao < -1e-10:
+            resto = rota[:i] + rota[i + tamanho:]
+            k = resto.index(c)
+            return resto[:k] + trecho[::-1] + resto[k:]
+    return None
+
+def or_opt(rota, distance_matrix, vizinhos, tamanhos=(1, 2, 3), max_passadas=50):
+    """
+    Or-opt: move um trecho de 1 a 3 cidades para junto de uma cidade vizinha
+    (no mesmo sentido ou invertido), quando o delta de custo é negativo.
+    Como no dois_opt, cada passada percorre a rota inteira aplicando os
+    movimentos com ganho, e o laço para após uma passada sem melhora.
+    """
+    D = distance_matrix
+    rota = [int(c) for c in rota]
+    n = len(rota)
+    posicao = np.empty(n, dtype=np.intp)
+
+    for _ in range(max_passadas):
+        melhorou = False
+        posicao[rota] = np.arange(n)
+        for tamanho in tamanhos:
+            if tamanho > n - 3:
+                break
+            for i in range(n - tamanho + 1):
+                nova = _mover_trecho(rota, posicao, i, tamanho, D, vizinhos)
+                if nova is not None:
+                    rota = nova
+                    posicao[rota] = np.arange(n)
+                    melhorou = True
+        if not melhorou:
+            break
+    return np.array(rota, dtype=np.intp)
+
+def busca_local(rota, distance_matrix, vizinhos, max_rodadas=10):
+    """Alterna 2-opt e Or-opt até nenhum dos dois melhorar a rota"""
+    rota = np.asarray(rota, dtype=np.intp)
+    comprimento = comprimento_rotas(rota, distance_matrix)
+    for _ in range(max_rodadas):
+        nova = or_opt(dois_opt(rota, distance_matrix, vizinhos), distance_matrix, vizinhos)
+        novo_comprimento = comprimento_rotas(nova, distance_matrix)
+        if novo_comprimento >= comprimento - 1e-10:
+            break
+        rota, comprimento = nova, novo_comprimento
+    return rota
+
+def estagio_memetico(ga_instance, distance_matrix, vizinhos, num_elites=2,
+                     decodificar=None, codificar=None):
+    """
+    Aplica a busca local aos melhores indivíduos da geração atual do PyGAD.
+    Chamar dentro do on_generation; a rota melhorada substitui o indivíduo na
+    população e o fitness (1 / distância) é atualizado em last_generation_fitness.
+
+    Args:
+        num_elites: quantos dos melhores indivíduos recebem a busca local
+        decodificar: converte um cromossomo em rota (permutação) ou None se for
+                     inválido; padrão = o cromossomo já é a permutação
+        codificar: converte a rota de volta para o cromossomo
+    """
+    fitness = ga_instance.last_generation_fitness
+    for idx in np.argsort(fitness)[::-1][:num_elites]:
+        solucao = ga_instance.population[idx]
+        rota = decodificar(solucao) if decodificar else np.asarray(solucao, dtype=np.intp)
+        if rota is None:
+            continue
+        nova = busca_local(rota, distance_matrix, vizinhos)
+        comprimento = comprimento_rotas(nova, distance_matrix)
+        if comprimento < comprimento_rotas(rota, distance_matrix) - 1e-10:
+            ga_instance.population[idx] = codificar(nova) if codificar else nova
+            fitness[idx] = 1.0 / comprimento
+
+#%%=============================================================================
+# ADAPTADORES PARA O PYGAD (crossover_type / mutation_type personalizados)
+# =============================================================================
+# O PyGAD aceita funções próprias de cruzamento e mutação. Elas usam o gerador
+# aleatório da instância (quando existe) para respeitar o random_seed.
+
+def _rng_pygad(ga_instance):
+    return getattr(ga_instance, 'numpy_random_generator', np.random)
+
+def _cruzamento_pygad(operador, parents, offspring_size, ga_instance):
+    rng = _rng_pygad(ga_instance)
+    parents = np.asarray(parents).astype(np.intp)
+    offspring = np.empty(offspring_size, dtype=np.intp)
+    for k in range(offspring_size[0]):
+        pai1 = parents[k % len(parents)]
+        pai2 = parents[(k + 1) % len(parents)]
+        offspring[k] = operador(pai1, pai2, rng)
+    return offspring
+
+def crossover_ox_pygad(parents, offspring_size, ga_instance):
+    return _cruzamento_pygad(cruzamento_ox, parents, offspring_size, ga_instance)
+
+def crossover_pmx_pygad(parents, offspring_size, ga_instance):
+    return _cruzamento_pygad(cruzamento_pmx, parents, offspring_size, ga_instance)
+
+def _mutacao_pygad(operador, offspring, ga_instance):
+    rng = _rng_pygad(ga_instance)
+    probabilidade = ga_instance.mutation_probability
+    if probabilidade is None:
+        probabilidade = 1.0
+    offspring = np.asarray(offspring).astype(np.intp)
+    for k in range(len(offspring)):
+        if rng.random() < probabilidade:
+            offspring[k] = operador(offspring[k], rng)
+    return offspring
+
+def mutacao_troca_pygad(offspring, ga_instance):
+    return _mutacao_pygad(mutacao_troca, offspring, ga_instance)
+
+def mutacao_inversao_pygad(offspring, ga_instance):
+    return _mutacao_pygad(mutacao_inversao, offspring, ga_instance)
+
+class FitnessRotas:
+    """
+    Fitness em lote 1 / comprimento da rota, como objeto (a matriz de distâncias
+    vai junto). Ao contrário de uma função definida no script, pode ser enviado
+    a outros processos (ex.: modelo de ilhas em utils_ilhas.py). Com vizinhos,
+    on_generation aplica o estágio memético aos num_elites melhores.
+
+    Uso: pygad.GA(..., fitness_func=FitnessRotas(D).fitness_pygad, fitness_batch_size=...)
+    """
+
+    def __init__(self, distance_matrix, vizinhos=None, num_elites=2):
+        self.distance_matrix = distance_matrix
+        self.vizinhos = vizinhos
+        self.num_elites = num_elites
+
+    def fitness_pygad(self, ga_instance, solutions, solutions_idx):
+        return 1.0 / comprimento_rotas(solutions, self.distance_matrix)
+
+    def on_generation(self, ga_instance):
+        if self.vizinhos is not None:
+            estagio_memetico(ga_instance, self.distance_matrix, self.vizinhos, self.num_elites)